@@ -0,0 +1,1013 @@
+
+"""
+Author: the.desert.eagle
+Project: GDJobScraper Benchmark Script
+Purpose: Measure the scraper's throughput against a local stub of GD's pages, without touching the live website
+Usage: python benchmark.py BENCHMARK_NAME [--NAME=VALUE ...]   (run without arguments to list the benchmarks)
+
+Author's Notes:
+• The stub site serves synthetic pages that satisfy the patterns in ScraperLogic, and delays every response by a fake latency
+• The replay site serves responses recorded from the live website (scraper.py --record-fixtures=DIR), with fake latency, jitter and faults
+• Any used abbreviations are listed in the bottom-most docstring of scraper.py
+
+"""
+
+# MODULE DEPENDENCIES
+import gzip
+import hashlib
+import json
+import os
+import random
+import re
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from tempfile import TemporaryDirectory
+from threading import Lock
+from threading import Thread
+from sys import argv
+from sys import exc_info
+from sys import exit
+
+import requests
+import scraper
+
+# LOCAL STUB OF GD'S WEBSITE
+class StubHTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server with a listen backlog large enough for many concurrent connections (avoids SYN retries skewing timings)"""
+    daemon_threads = True
+    request_queue_size = 128
+
+    def handle_error(self, request, clientAddress):
+        """Ignores clients closing their connection mid-response (as the bounded page reader does), reporting any other error"""
+        if not isinstance(exc_info()[1], ConnectionError): ThreadingHTTPServer.handle_error(self, request, clientAddress)
+
+class LocalJobSite:
+    """Base of the local job sites: serves pages from a local HTTP server, adding fake latency, jitter and faults to the responses
+
+    • Faults are injected into job-page requests only (a failed location or job-listing request would end the run): 
+      [403] Forbidden, [429] Too Many Requests (with Retry-After: 0) and timeouts (the server stalls, then drops the connection)
+    • With a 'capacity' set, job-page requests beyond that many in flight are answered with 'overloadReply': 
+      '429' (with Retry-After: 1) or 'captcha' (a [200] block page without any job information)
+    • Subclasses must define _route(handler), answering a request that got no fault with the matching page (see _send())
+    """
+
+    _faultPath = '/job-listing/details.htm'
+
+    def __init__(self, latency = 0.05, jitter = 0.0, faultRates = None, stallSeconds = 2.0):
+        """Starts the server on a free local port in a background thread
+           Params:
+           • latency - Fake delay (seconds) added to every response
+           • jitter - Upper bound (seconds) of a uniformly random delay added on top of the latency
+           • faultRates - Dictionary of the fractions of job-page requests answered with a fault ('403', '429', 'timeout')
+           • stallSeconds - Seconds a timed-out request is stalled before its connection is dropped (set above the client's timeout)
+
+           Returns: [None]
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.faultRates = {faultName: faultRate for faultName, faultRate in (faultRates or {}).items() if faultRate}
+        self.stallSeconds = stallSeconds
+        self.requestCount = 0
+        self.connectionCount = 0
+        self.faultCounts = {faultName: 0 for faultName in self.faultRates}
+        self.capacity, self.overloadReply, self.peakInFlight = 0, '429', 0
+        self._inFlight, self._inFlightLock = 0, Lock()
+        jobSite = self
+
+        class LocalRequestHandler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1' # allows keep-alive connections
+            def setup(self):
+                jobSite.connectionCount += 1
+                BaseHTTPRequestHandler.setup(self)
+            def do_GET(self): jobSite._respond(self)
+            def log_message(self, *args): pass
+
+        self._server = StubHTTPServer(('127.0.0.1', 0), LocalRequestHandler)
+        self.siteRoot = 'http://127.0.0.1:{}'.format(self._server.server_address[1])
+        Thread(target = self._server.serve_forever, daemon = True).start()
+
+    def close(self):
+        """Stops the server"""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _send(self, handler, status, body = '', contentType = 'text/html', extraHeaders = None):
+        """Writes a response for the request held by the handler (body given as text or raw bytes)"""
+        payload = body if isinstance(body, bytes) else body.encode('utf-8')
+        if status == 200:
+            etag = '"{}"'.format(hashlib.md5(payload).hexdigest())
+            if handler.headers.get('If-None-Match') == etag: status, payload = 304, b''
+            extraHeaders = dict(extraHeaders or {}, ETag = etag)
+        handler.send_response(status)
+        handler.send_header('Content-Type', contentType if 'charset' in contentType else '{}; charset=utf-8'.format(contentType))
+        handler.send_header('Content-Length', str(len(payload)))
+        for headerName, headerValue in (extraHeaders or {}).items(): handler.send_header(headerName, headerValue)
+        handler.end_headers()
+        handler.wfile.write(payload)
+
+    def _faultInjector(self, handler):
+        """Answers a job-page request with a randomly drawn fault, if any (returns whether a fault was served)"""
+        if handler.path.split('?')[0] != self._faultPath: return False
+        faultDraw = random.random()
+        for faultName, faultRate in self.faultRates.items():
+            if faultDraw >= faultRate: 
+                faultDraw -= faultRate
+                continue
+            self.faultCounts[faultName] += 1
+            if faultName == 'timeout':
+                time.sleep(self.stallSeconds)
+                handler.close_connection = True # no response at all
+            else: self._send(handler, int(faultName), extraHeaders = {'Retry-After': '0'} if faultName == '429' else None)
+            return True
+        return False
+
+    def _respond(self, handler):
+        """Delays a request by the latency and jitter, then answers it with a fault or the routed page"""
+        self.requestCount += 1
+        faultPath = handler.path.split('?')[0] == self._faultPath
+        with self._inFlightLock:
+            if faultPath: self._inFlight += 1
+            overloaded, self.peakInFlight = self.capacity and self._inFlight > self.capacity, max(self.peakInFlight, self._inFlight)
+        try:
+            time.sleep(self.latency + random.uniform(0, self.jitter))
+            if overloaded:
+                self.faultCounts['overload'] = self.faultCounts.get('overload', 0) + 1
+                if self.overloadReply == 'captcha': self._send(handler, 200, '<html><body><form id="captcha">Please verify you are a human</form></body></html>')
+                else: self._send(handler, 429, extraHeaders = {'Retry-After': '1'})
+            elif not self._faultInjector(handler): self._route(handler) # defined by the subclasses
+        finally:
+            if faultPath: 
+                with self._inFlightLock: self._inFlight -= 1
+
+class StubJobSite(LocalJobSite):
+    """Serves synthetic location, job-listing and job pages from a local HTTP server with fake latency"""
+
+    _jobsPerPage = 30
+    _listPgPath = '/Job/data-scientist-jobs-SRCH_IL.0,9_IC115.htm'
+
+    def __init__(self, latency = 0.05, pageCount = 1000, errorRate = 0.0, overlap = 0, pageTail = 2048, jitter = 0.0, faultRates = None, idShift = 0, revisedEvery = 0):
+        """Starts the stub server on a free local port in a background thread
+           Params:
+           • latency - Fake delay (seconds) added to every response
+           • pageCount - Number of job-listing pages holding job links (later pages are served without any)
+           • errorRate - Fraction of job-page requests answered with [429] Too Many Requests
+           • overlap - Number of job postings each job-listing page repeats from the previous page
+           • pageTail - Number of filler characters following the job description on every job page (like GD's similar-jobs listings, footer and scripts)
+           • jitter, faultRates - Random extra delay and further faults (see LocalJobSite)
+           • idShift - Number of job postings the listings are moved on by, like a later day's listings (the first postings are gone, new ones follow the last)
+           • revisedEvery - Every how many job postings one has a revised job description (0 = none)
+
+           Returns: [None]
+        """
+        self.pageCount = pageCount
+        self.overlap = overlap
+        self.pageTail = pageTail
+        self.idShift = idShift
+        self.revisedEvery = revisedEvery
+        LocalJobSite.__init__(self, latency, jitter, dict(faultRates or {}, **{'429': errorRate}))
+
+    def listingPage(self, pageNumber):
+        """Builds a job-listing page holding 30 job links and their company logo links"""
+        firstJobId = 1000 + self.idShift + (pageNumber - 1) * (StubJobSite._jobsPerPage - self.overlap)
+        jobIds = range(firstJobId, firstJobId + StubJobSite._jobsPerPage) if pageNumber <= self.pageCount else []
+        return ''.join('<li><div><a href="/partner/jobListing.htm?pos={0}&ao=29&jobListingId={1}">Job</a></div>'
+                       '<img src="https://media.glassdoor.com/sqls/{1}/company-{1}.png"/></li>'.format(jobNumber, jobId) for jobNumber, jobId in enumerate(jobIds))
+
+    @staticmethod
+    def jobPage(jobId, pageTail = 2048, revised = False):
+        """Builds a job page holding all the header information matched by ScraperLogic, and a job description (revised, if asked for) followed by 'pageTail' filler characters"""
+        return ('<html><head><script>var gdInfo = {{"employerName":"Company {0}","jobTitle":"Data Scientist {0}","loc":"Bengaluru"}};</script></head>'
+                '<body><span class="ratingNum">3.{1}<</span><span class="datePosted" value="2018-07-01 ">1 day ago</span>'
+                '<div class="jobDescriptionContent desc"><div><p>Python, SQL &amp; machine learning for job {0}.</p></div>'
+                '<ul><li>A.I. and R experience</li><li>time series</li></ul>{3}</div>{2}</body></html>').format(jobId, jobId % 10, '<div class="footer"> </div>' * (pageTail // 26), 
+                                                                                               '<p>Now hiring for Spark too.</p>' if revised else '')
+
+    def _route(self, handler):
+        """Routes a stub request to the matching synthetic page"""
+        path = handler.path.split('?')[0]
+        if path == '/util/ajax/findLocationsByFullText.htm':
+            self._send(handler, 200, json.dumps({'locations': [{'id': 115, 'type': 'C'}]}), 'application/json')
+        elif path == '/Job/jobs.htm':
+            self._send(handler, 302, extraHeaders = {'Location': self._listPgPath})
+        elif path.startswith(self._listPgPath[:-4]):
+            pageNumberRes = re.findall(r'_IP(\d+)\.htm$', path)
+            self._send(handler, 200, self.listingPage(int(pageNumberRes[0]) if pageNumberRes else 1))
+        elif path == '/job-listing/details.htm':
+            jobId = int(re.findall(r'jobListingId=(\d+)', handler.path)[0])
+            self._send(handler, 200, self.jobPage(jobId, self.pageTail, self.revisedEvery and jobId % self.revisedEvery == 0))
+        else:
+            self._send(handler, 404)
+
+class ReplayJobSite(LocalJobSite):
+    """Replays the responses recorded by scraper.FixtureRecorder (e.g. with scraper.py's --record-fixtures option) from a local HTTP server
+
+    • Requests are matched by their normalized path and query; a location lookup or job-listing base request of another search falls back 
+      to the only recorded one of its kind, so a single recorded search can be replayed under any title and location
+    """
+
+    def __init__(self, fixtureDir, latency = 0.05, jitter = 0.0, faultRates = None, stallSeconds = 2.0):
+        """Loads the fixture manifest and starts the replay server (see LocalJobSite for the delay and fault parameters)"""
+        self._fixtureDir = fixtureDir
+        self._fixtures, self._fixturesByPath = {}, {}
+        for fixture in scraper.fixtureReader(fixtureDir):
+            self._fixtures[fixture['key']] = fixture
+            if fixture['finalKey'] != fixture['key']: self._fixtures.setdefault(fixture['finalKey'], dict(fixture, key = fixture['finalKey'])) # target of a recorded redirect
+            self._fixturesByPath.setdefault(fixture['key'].split('?')[0], []).append(fixture)
+        if not self._fixtures: raise ValueError('No fixtures recorded in {}'.format(fixtureDir))
+        self._bodies, self.missCount = {}, 0
+        LocalJobSite.__init__(self, latency, jitter, faultRates, stallSeconds)
+
+    def _body(self, fixture):
+        """Loads (once) the decompressed body of a fixture"""
+        if fixture['body'] not in self._bodies:
+            with open(os.path.join(self._fixtureDir, fixture['body']), 'rb') as bodyFile: self._bodies[fixture['body']] = gzip.decompress(bodyFile.read())
+        return self._bodies[fixture['body']]
+
+    def _route(self, handler):
+        """Replays the fixture recorded for the request (redirecting to its final page if the recorded request was redirected)"""
+        key = scraper.FixtureRecorder.fixtureKey('http://replay' + handler.path)
+        fixture = self._fixtures.get(key)
+        if fixture is None and len(self._fixturesByPath.get(key.split('?')[0], [])) == 1: fixture = self._fixturesByPath[key.split('?')[0]][0]
+        if fixture is None:
+            self.missCount += 1
+            self._send(handler, 404)
+        elif fixture['finalKey'] != fixture['key']:
+            self._send(handler, 302, extraHeaders = {'Location': fixture['finalKey']})
+        else:
+            self._send(handler, fixture['status'], self._body(fixture), fixture['contentType'])
+
+def stubURLUtilClass(stubSite):
+    """Creates a JobURLUtil subclass whose requests are all directed to the stub site"""
+    class StubJobURLUtil(scraper.JobURLUtil):
+        _siteRoot = stubSite.siteRoot
+    return StubJobURLUtil
+
+def stubURLUtil(stubSite, **urlUtilArgs):
+    """Creates a JobURLUtil object whose requests are all directed to the stub site"""
+    return stubURLUtilClass(stubSite)('Data Scientist', 'Bangalore', 'SERVER_TIMING', **urlUtilArgs)
+
+# BENCHMARKS
+def fetchBenchmark(latency = 0.05, workers = 8, hostLimit = 8):
+    """Compares sequential and concurrent job-page fetching of one job-listing page (30 job pages)
+
+       Params:
+       • latency - Fake delay (seconds) of every stub response
+       • workers - Number of concurrent fetches for the concurrent run
+       • hostLimit - Per-host concurrency cap for the concurrent run
+
+       Returns:
+       • Dictionary of wall-clock timings for both runs
+    """
+    stubSite = StubJobSite(latency)
+    try:
+        results = {}
+        for runName, runArgs in (('sequential', {'maxWorkers': 1}), ('concurrent', {'maxWorkers': workers, 'perHostLimit': hostLimit})):
+            urlUtil = stubURLUtil(stubSite, **runArgs)
+            htmlContent = urlUtil.jobListingPageBaseRequester().text
+            startTime = time.perf_counter()
+            headers = urlUtil.jobLinkHeaderInfoExtractor(urlUtil.jobLinkExtractor(htmlContent), htmlContent)
+            elapsed = time.perf_counter() - startTime
+            results[runName] = {'seconds': round(elapsed, 3), 'jobPages': len(headers), 'pagesPerSec': round(len(headers) / elapsed, 1),
+                                'logosPaired': all(header['companyLogoURL'].endswith('/company-{}.png'.format(re.findall(r'jobListingId=(\d+)', header['jobURL'])[0])) for header in headers)}
+        results['speedup'] = round(results['sequential']['seconds'] / results['concurrent']['seconds'], 1)
+        return results
+    finally:
+        stubSite.close()
+
+def serialBatchExtract(urlUtil, resObj, batchCount):
+    """Reference implementation of batchExtract without the pipeline: each job-listing page is fetched only after the previous page is done"""
+    jobHeadersCollection = []
+    for pageNumber in range(2, batchCount + 2):
+        jobHeadersCollection += urlUtil.jobLinkHeaderInfoExtractor(urlUtil.jobLinkExtractor(resObj.text), resObj.text)
+        if pageNumber <= batchCount: resObj = urlUtil.jobListingPageRetriever(pageNumber)
+    return jobHeadersCollection
+
+def pipelineBenchmark(latency = 0.05, batches = 20, workers = 8, prefetch = 2, pageCount = 1000):
+    """Compares batchExtract's pipelined job-listing page prefetching with a serial page-after-page loop
+
+       Params:
+       • latency - Fake delay (seconds) of every stub response
+       • batches - Number of job-listing pages to be scraped
+       • workers - Number of concurrent job-page fetches (used by both runs)
+       • prefetch - Number of job-listing pages prefetched by the pipelined run
+       • pageCount - Number of stub job-listing pages holding job links (set below 'batches' to measure stop-early mode)
+
+       Returns:
+       • Dictionary of wall-clock timings for both runs, and whether both produced the same job headers in the same order
+    """
+    stubSite = StubJobSite(latency, pageCount)
+    try:
+        results, jobURLs = {}, {}
+        for runName in ('serial', 'pipelined'):
+            urlUtil = stubURLUtil(stubSite, maxWorkers = workers, perHostLimit = workers)
+            resObj = urlUtil.jobListingPageBaseRequester()
+            requestCount, startTime = stubSite.requestCount, time.perf_counter()
+            if runName == 'serial': headers = serialBatchExtract(urlUtil, resObj, batches)
+            else: headers = urlUtil.batchExtract(resObj, batches, False, prefetch, pageCount < batches)
+            elapsed = time.perf_counter() - startTime
+            jobURLs[runName] = [header['jobURL'] for header in headers]
+            results[runName] = {'seconds': round(elapsed, 3), 'jobPages': len(headers), 'requests': stubSite.requestCount - requestCount}
+        results['speedup'] = round(results['serial']['seconds'] / results['pipelined']['seconds'], 2)
+        results['identicalOutput'] = jobURLs['serial'] == jobURLs['pipelined']
+        return results
+    finally:
+        stubSite.close()
+
+def sessionBenchmark(latency = 0.02, workers = 8, errorRate = 0.1):
+    """Compares one-shot requests (a new connection per request, as with requests.get) with the pooled keep-alive session of HTTPSessionPool
+
+       Params:
+       • latency - Fake delay (seconds) of every stub response
+       • workers - Number of concurrent job-page fetches (used by both runs)
+       • errorRate - Fraction of job-page requests answered with [429], to be retried by the pooled run
+
+       Returns:
+       • Dictionary of timings and the number of TCP connections opened for 30 job pages, along with the pool's own statistics
+    """
+    stubSite = StubJobSite(latency, errorRate = errorRate)
+    try:
+        urlUtil = stubURLUtil(stubSite, maxWorkers = workers, perHostLimit = workers)
+        jobLinks = urlUtil.jobLinkExtractor(urlUtil.jobListingPageBaseRequester().text)
+        results = {}
+
+        connectionCount, startTime = stubSite.connectionCount, time.perf_counter()
+        with ThreadPoolExecutor(max_workers = workers) as executor: oneShotStatuses = list(executor.map(lambda jobLink: requests.get(jobLink).status_code, jobLinks))
+        results['oneShot'] = {'seconds': round(time.perf_counter() - startTime, 3), 'connectionsOpened': stubSite.connectionCount - connectionCount, 
+                              'jobPagesFetched': oneShotStatuses.count(200)}
+
+        connectionCount, startTime = stubSite.connectionCount, time.perf_counter()
+        pooledResObjs = urlUtil._concurrentGETRequester(jobLinks, 'job-page benchmark')
+        results['pooled'] = {'seconds': round(time.perf_counter() - startTime, 3), 'connectionsOpened': stubSite.connectionCount - connectionCount, 
+                             'jobPagesFetched': sum(1 for resObj in pooledResObjs if resObj), 'poolStats': urlUtil.connectionStats()}
+        urlUtil.close()
+        return results
+    finally:
+        stubSite.close()
+
+def cacheBenchmark(latency = 0.05, batches = 3, workers = 8):
+    """Compares a cold run of batchExtract with repeated runs served from the on-disk response cache
+
+       Params:
+       • latency - Fake delay (seconds) of every stub response
+       • batches - Number of job-listing pages to be scraped by each run
+       • workers - Number of concurrent job-page fetches
+
+       Returns:
+       • Dictionary of timings, requests reaching the stub and cache statistics of the cold, warm (fresh entries) and revalidating (expired entries, 304s) runs
+    """
+    stubSite = StubJobSite(latency)
+    try:
+        results = {}
+        with TemporaryDirectory() as cacheDir:
+            for runName, ttls in (('cold', None), ('warm', None), ('revalidating', {'location': 0, 'listing': 0, 'job': 0})):
+                responseCache = scraper.HTTPResponseCache(cacheDir, ttls = ttls)
+                requestCount, startTime = stubSite.requestCount, time.perf_counter()
+                urlUtil = stubURLUtil(stubSite, maxWorkers = workers, perHostLimit = workers, responseCache = responseCache)
+                headers = urlUtil.batchExtract(urlUtil.jobListingPageBaseRequester(), batches)
+                results[runName] = {'seconds': round(time.perf_counter() - startTime, 3), 'jobPages': len(headers), 
+                                    'stubRequests': stubSite.requestCount - requestCount, 'cacheStats': urlUtil.cacheStats()}
+                urlUtil.close()
+        return results
+    finally:
+        stubSite.close()
+
+def findallHeaderFields(patternBase, htmlContent):
+    """Reference (pre single-pass) header extraction: one findall() scan over the whole job page per header pattern"""
+    headerFields = {}
+    for fieldName in ('companyName', 'companyRating', 'jobTitle', 'jobLocation', 'jobPostingDate'):
+        fieldRes = patternBase[fieldName].findall(htmlContent)
+        if fieldRes: headerFields[fieldName] = fieldRes[0]
+    if 'companyName' not in headerFields:
+        companyNameAltRes = patternBase['companyNameAlt'].findall(htmlContent)
+        if companyNameAltRes: headerFields['companyName'] = companyNameAltRes[0]
+    return headerFields
+
+def singlePassHeaderFields(scraperLogic, htmlContent):
+    """Single-pass header extraction, reduced to the same fields as findallHeaderFields()"""
+    headerFields = scraperLogic.headerFieldExtractor(htmlContent)
+    if 'companyName' not in headerFields and 'companyNameAlt' in headerFields: headerFields['companyName'] = headerFields['companyNameAlt']
+    headerFields.pop('companyNameAlt', None)
+    return headerFields
+
+def jobPageCorpus(corpusDir = None, pageCount = 200, pageSize = 200000):
+    """Loads saved job pages (*.html, or gzip-compressed *.html.gz as kept by the response cache), or generates synthetic ones
+
+       Params:
+       • corpusDir - Directory searched recursively for saved job pages (synthetic pages are generated if not given)
+       • pageCount - Number of synthetic pages
+       • pageSize - Approximate size (characters) of a synthetic page; header fields are scattered through markup-like filler, 
+         and some pages lack the rating, use the alternate company name or lack the job title
+
+       Returns:
+       • List of job-page HTML text contents
+    """
+    if corpusDir:
+        corpus = []
+        for dirPath, _, fileNames in os.walk(corpusDir):
+            for fileName in sorted(fileNames):
+                filePath = os.path.join(dirPath, fileName)
+                if fileName.endswith('.html.gz'): 
+                    with gzip.open(filePath, 'rt', encoding = 'utf-8', errors = 'replace') as pageFile: corpus.append(pageFile.read())
+                elif fileName.endswith('.html'):
+                    with open(filePath, encoding = 'utf-8', errors = 'replace') as pageFile: corpus.append(pageFile.read())
+        return corpus
+
+    randomGen = random.Random(7)
+    fillerAlphabet = 'abcdefghijklmnopqrstuvwxyz     <>="\'/:;{}()0123456789'
+    corpus = []
+    for pageNumber in range(pageCount):
+        filler = ''.join(randomGen.choice(fillerAlphabet) for _ in range(pageSize))
+        companyPart = '"employerName":"Company {}",'.format(pageNumber) if pageNumber % 7 else ''
+        titlePart = '"jobTitle":"Data Scientist ({})",'.format(pageNumber) if pageNumber % 23 else ''
+        headerParts = ['{{{}{}"loc":"Bengaluru, Karnataka"}}'.format(companyPart, titlePart), 
+                       '<span class="companyName">Alt Company {}</span>'.format(pageNumber),
+                       '<span class="ratingNum">{}.{}</span>'.format(pageNumber % 5, pageNumber % 10) if pageNumber % 5 else '',
+                       '<span class="datePosted" value="2018-07-{:02d} ">'.format(pageNumber % 28 + 1)]
+        splitPoints = sorted(randomGen.randrange(pageSize) for _ in headerParts)
+        pageParts, previousPoint = [], 0
+        for splitPoint, headerPart in zip(splitPoints, headerParts):
+            pageParts += [filler[previousPoint:splitPoint], headerPart]
+            previousPoint = splitPoint
+        corpus.append(''.join(pageParts) + filler[previousPoint:])
+    return corpus
+
+def extractBenchmark(corpus = None, pages = 200, pageSize = 200000, repeat = 3):
+    """Compares the findall-per-field header extraction with ScraperLogic's single-pass extraction over a corpus of job pages
+
+       Params:
+       • corpus - Directory of saved job pages, e.g. a response cache directory (synthetic pages are used if not given)
+       • pages - Number of synthetic pages
+       • pageSize - Approximate size (characters) of a synthetic page
+       • repeat - Number of timed passes over the corpus (the best pass is reported)
+
+       Returns:
+       • Dictionary of both engines' throughput, and the number of pages on which their outputs differ
+    """
+    jobPages = jobPageCorpus(corpus, pages, pageSize)
+    scraperLogic = scraper.ScraperLogic()
+    corpusMB = sum(len(htmlContent) for htmlContent in jobPages) / 1e6
+    engines = {'findall': lambda htmlContent: findallHeaderFields(scraperLogic.patternBase, htmlContent), 
+               'singlePass': lambda htmlContent: singlePassHeaderFields(scraperLogic, htmlContent)}
+    results, outputs = {'corpusPages': len(jobPages), 'corpusMB': round(corpusMB, 2)}, {}
+    for engineName, engine in engines.items():
+        bestTime = float('inf')
+        for _ in range(repeat):
+            startTime = time.perf_counter()
+            outputs[engineName] = [engine(htmlContent) for htmlContent in jobPages]
+            bestTime = min(bestTime, time.perf_counter() - startTime)
+        results[engineName] = {'seconds': round(bestTime, 4), 'pagesPerSec': round(len(jobPages) / bestTime, 1), 'MBPerSec': round(corpusMB / bestTime, 1)}
+    results['speedup'] = round(results['findall']['seconds'] / results['singlePass']['seconds'], 1)
+    results['mismatchedPages'] = sum(1 for findallFields, singlePassFields in zip(outputs['findall'], outputs['singlePass']) if findallFields != singlePassFields)
+    return results
+
+def parseBenchmark(corpus = None, pages = 200, pageSize = 200000, workers = 0):
+    """Compares in-process job-page parsing with the process-pool parse stage, over a corpus of raw job-page bytes
+
+       Params:
+       • corpus - Directory of saved job pages, e.g. a response cache directory (synthetic pages are used if not given)
+       • pages - Number of synthetic pages
+       • pageSize - Approximate size (characters) of a synthetic page
+       • workers - Number of parse-worker processes (0 = one per CPU core)
+
+       Returns:
+       • Dictionary of the throughput of both runs, and whether both scraped the same header information
+    """
+    workers = workers or os.cpu_count()
+    rawPages = [(htmlContent.encode('utf-8'), 'utf-8') for htmlContent in jobPageCorpus(corpus, pages, pageSize)]
+    doc, scraperLogic = datetime(2018, 7, 31), scraper.ScraperLogic()
+    results = {'corpusPages': len(rawPages), 'cpuCount': os.cpu_count(), 'parseWorkers': workers}
+
+    startTime = time.perf_counter()
+    inProcessHeaders = [scraper.jobPageHeaderParser(scraperLogic, doc, pageBytes.decode(encoding)) for pageBytes, encoding in rawPages]
+    results['inProcess'] = {'seconds': round(time.perf_counter() - startTime, 3), 'pagesPerSec': round(len(rawPages) / (time.perf_counter() - startTime), 1)}
+
+    with scraper.parseExecutorCreator(doc, workers) as parseExecutor:
+        scraper.parallelJobPageParser(parseExecutor, workers, rawPages[:workers]) # warms up the worker processes
+        startTime = time.perf_counter()
+        processPoolHeaders = scraper.parallelJobPageParser(parseExecutor, workers, rawPages)
+        results['processPool'] = {'seconds': round(time.perf_counter() - startTime, 3), 'pagesPerSec': round(len(rawPages) / (time.perf_counter() - startTime), 1)}
+    results['speedup'] = round(results['inProcess']['seconds'] / results['processPool']['seconds'], 2)
+    results['identicalOutput'] = [parsedPage[:2] for parsedPage in inProcessHeaders] == [parsedPage[:2] for parsedPage in processPoolHeaders] # step timings differ
+    return results
+
+def writerBenchmark(batches = 20, workers = 8, fileFormat = 'jsonl'):
+    """Compares the peak memory of batchExtract collecting all job records in memory with streaming them into a DatasetWriter
+
+       Params:
+       • batches - Number of job-listing pages to be scraped by each run
+       • workers - Number of concurrent job-page fetches
+       • fileFormat - Dataset format of the streaming run (jsonl, csv or parquet)
+
+       Returns:
+       • Dictionary of the peak traced memory and timing of both runs, and the number of records written by the streaming run
+    """
+    stubSite = StubJobSite(0.0)
+    try:
+        results = {}
+        with TemporaryDirectory() as outputDir:
+            for runName in ('inMemory', 'streaming'):
+                urlUtil = stubURLUtil(stubSite, maxWorkers = workers, perHostLimit = workers)
+                resObj = urlUtil.jobListingPageBaseRequester()
+                recordSink = scraper.DatasetWriter(os.path.join(outputDir, 'jobs.' + fileFormat)) if runName == 'streaming' else None
+                tracemalloc.start()
+                startTime = time.perf_counter()
+                headers = urlUtil.batchExtract(resObj, batches, False, recordSink = recordSink)
+                elapsed = time.perf_counter() - startTime
+                peakMemory = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                results[runName] = {'seconds': round(elapsed, 3), 'peakMemoryKB': round(peakMemory / 1024), 'recordsInMemory': len(headers)}
+                if recordSink is not None:
+                    recordSink.close()
+                    results[runName]['recordsWritten'] = recordSink.recordCount
+                urlUtil.close()
+        return results
+    finally:
+        stubSite.close()
+
+def resumeBenchmark(latency = 0.01, batches = 6, cutoff = 3, overlap = 5, workers = 8, forbiddenRate = 0.0):
+    """Compares the requests of a full run with those of a run cut off after some pages and resumed from its checkpoint, on listing pages repeating postings
+
+       Params:
+       • latency - Fake delay (seconds) of every stub response
+       • batches - Number of job-listing pages to be scraped
+       • cutoff - Number of job-listing pages scraped before the first run of the resumed pair is cut off
+       • overlap - Number of job postings each stub job-listing page repeats from the previous page
+       • workers - Number of concurrent job-page fetches
+       • forbiddenRate - Fraction of job-page requests answered with [403] during the cut-off run (the resumed run is served without faults)
+
+       Returns:
+       • Dictionary of the stub requests and job records of the full run, both parts of the resumed run, and the checkpoint statistics
+    """
+    stubSite = StubJobSite(latency, overlap = overlap)
+    try:
+        results = {'naiveRequests': 2 + batches * (1 + StubJobSite._jobsPerPage)} # location lookup + base page redirect, then a listing page and all its job pages per batch
+        with TemporaryDirectory() as checkpointDir:
+            requestCount = stubSite.requestCount
+            urlUtil = stubURLUtil(stubSite, maxWorkers = workers, perHostLimit = workers)
+            results['full'] = {'jobRecords': len(urlUtil.batchExtract(urlUtil.jobListingPageBaseRequester(), batches)), 'stubRequests': stubSite.requestCount - requestCount}
+            urlUtil.close()
+
+            checkpoint = scraper.ScrapeCheckpoint(os.path.join(checkpointDir, 'run.sqlite'))
+            requestCount, jobRecords, stubSite.faultRates = stubSite.requestCount, 0, {'403': forbiddenRate}
+            stubSite.faultCounts = {'403': 0}
+            urlUtil = stubURLUtil(stubSite, maxWorkers = workers, perHostLimit = workers)
+            for pageNumber, _, jobHeadersList in urlUtil.jobHeaderPageIterator(urlUtil.jobListingPageBaseRequester(), batches, checkpoint = checkpoint):
+                jobRecords += len(jobHeadersList)
+                if pageNumber == cutoff: break # the run is cut off while the page is being handled, so it is not marked as completed
+            results['cutOff'] = {'jobRecords': jobRecords, 'stubRequests': stubSite.requestCount - requestCount, 'forbidden': stubSite.faultCounts['403'], 'checkpoint': checkpoint.stats()}
+            urlUtil.close()
+            checkpoint.close()
+            stubSite.faultRates = {}
+
+            checkpoint = scraper.ScrapeCheckpoint(os.path.join(checkpointDir, 'run.sqlite'))
+            requestCount = stubSite.requestCount
+            urlUtil = stubURLUtil(stubSite, maxWorkers = workers, perHostLimit = workers)
+            results['resumed'] = {'jobRecords': len(urlUtil.batchExtract(None, batches, checkpoint = checkpoint)), 'stubRequests': stubSite.requestCount - requestCount, 'checkpoint': checkpoint.stats()}
+            urlUtil.close()
+            checkpoint.close()
+        return results
+    finally:
+        stubSite.close()
+
+def streamBenchmark(latency = 0.01, batches = 3, workers = 8, pageTail = 300000):
+    """Compares reading whole job pages with reading them only up to the end of their job description, on stub job pages with a long tail
+
+       Params:
+       • latency - Fake delay (seconds) of every stub response
+       • batches - Number of job-listing pages to be scraped
+       • workers - Number of concurrent job-page fetches
+       • pageTail - Number of filler characters following the job description on every job page
+
+       Returns:
+       • Dictionary of the elapsed time, job-page bytes read and peak traced memory of both modes, and whether both scraped the same job records
+    """
+    stubSite = StubJobSite(latency, pageTail = pageTail)
+    try:
+        results, jobRecords = {'jobPageBytes': len(StubJobSite.jobPage(1000, pageTail))}, {}
+        for mode, streamPages in (('wholePages', False), ('boundedPages', True)):
+            readBytes = []
+            class ByteCountingURLUtil(stubURLUtilClass(stubSite)):
+                def _jobPageParser(self, resObjs):
+                    readBytes.extend(len(resObj.content) for resObj in resObjs)
+                    return scraper.JobURLUtil._jobPageParser(self, resObjs)
+            urlUtil = ByteCountingURLUtil('Data Scientist', 'Bangalore', 'SERVER_TIMING', maxWorkers = workers, perHostLimit = workers, streamPages = streamPages)
+            tracemalloc.start()
+            startTime = time.perf_counter()
+            jobRecords[mode] = urlUtil.batchExtract(urlUtil.jobListingPageBaseRequester(), batches)
+            elapsedTime = time.perf_counter() - startTime
+            _, peakMemory = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            results[mode] = {'seconds': round(elapsedTime, 3), 'jobPagesRead': len(readBytes), 'jobPageBytesRead': sum(readBytes), 'peakTracedMB': round(peakMemory / 2**20, 2)}
+            urlUtil.close()
+        results['bytesSaved'] = round(1 - results['boundedPages']['jobPageBytesRead'] / max(1, results['wholePages']['jobPageBytesRead']), 3)
+        results['identicalRecords'] = jobRecords['wholePages'] == jobRecords['boundedPages']
+        results['sampleRecord'] = {fieldName: jobRecords['boundedPages'][0][fieldName] for fieldName in ('jobDescription', 'fineSkills', 'coarseSkills')} if jobRecords['boundedPages'] else None
+        return results
+    finally:
+        stubSite.close()
+
+def multiQueryBenchmark(latency = 0.02, queries = 6, locations = 2, batches = 3, workers = 8, maxActive = 4):
+    """Compares searches scraped one after the other, each with its own JobURLUtil and connections, with the same searches run by one MultiQueryScheduler
+       (the stub site serves the same job postings to every search, like overlapping titles and locations do on the real site)
+
+       Params:
+       • latency - Fake delay (seconds) of every stub response
+       • queries - Number of (title, location) searches
+       • locations - Number of distinct locations the searches are spread over
+       • batches - Number of job-listing pages scraped per search
+       • workers - Number of concurrent job-page fetches per search
+       • maxActive - Number of searches scraped side by side by the scheduler
+
+       Returns:
+       • Dictionary of the elapsed time, stub requests, stub connections and job records of both modes, and the scheduler statistics
+    """
+    queryList = [('Title {}'.format(queryNumber), 'Location {}'.format(queryNumber % locations), batches) for queryNumber in range(queries)]
+    stubSite = StubJobSite(latency)
+    try:
+        results = {}
+        requestCount, connectionCount, jobRecords = stubSite.requestCount, stubSite.connectionCount, 0
+        startTime = time.perf_counter()
+        for title, loc, batchCount in queryList:
+            scraper.JobURLUtil._locationMemo.clear() # separate processes do not share the location lookups
+            urlUtil = stubURLUtilClass(stubSite)(title, loc, 'SERVER_TIMING', maxWorkers = workers, perHostLimit = workers)
+            jobRecords += len(urlUtil.batchExtract(urlUtil.jobListingPageBaseRequester(), batchCount))
+            urlUtil.close()
+        results['separate'] = {'seconds': round(time.perf_counter() - startTime, 3), 'stubRequests': stubSite.requestCount - requestCount, 
+                               'stubConnections': stubSite.connectionCount - connectionCount, 'jobRecords': jobRecords}
+
+        scraper.JobURLUtil._locationMemo.clear()
+        requestCount, connectionCount = stubSite.requestCount, stubSite.connectionCount
+        startTime = time.perf_counter()
+        scheduler = scraper.MultiQueryScheduler(queryList, maxWorkers = workers, perHostLimit = workers, maxActiveQueries = maxActive, urlUtilClass = stubURLUtilClass(stubSite))
+        jobRecords = len(scheduler.run())
+        scheduler.close()
+        results['scheduler'] = {'seconds': round(time.perf_counter() - startTime, 3), 'stubRequests': stubSite.requestCount - requestCount, 
+                                'stubConnections': stubSite.connectionCount - connectionCount, 'jobRecords': jobRecords, 'stats': scheduler.stats}
+        return results
+    finally:
+        stubSite.close()
+
+def incrementalBenchmark(latency = 0.01, batches = 5, workers = 8, shift = 15, revisedEvery = 10, recheckRate = 0.1, cache = 0, overlap = 5):
+    """Compares a full re-run of a search with an incremental run against the posting index of the previous day's run, 
+       on stub listings moved on by a few postings (some gone, some new) with some revised job descriptions
+
+       Params:
+       • latency - Fake delay (seconds) of every stub response
+       • batches - Number of job-listing pages holding job links (every run goes on up to the first page without any, the end of the listing)
+       • workers - Number of concurrent job-page fetches
+       • shift - Number of postings gone since the previous day (and of new postings)
+       • revisedEvery - Every how many postings one has a revised job description since the previous day
+       • recheckRate - Fraction of the known postings re-checked by the incremental run
+       • cache - Whether the previous day's run and the incremental run share a response cache (whose job pages are still fresh a day later)
+       • overlap - Number of postings each job-listing page repeats from the previous page (a repeated new posting still counts as added once)
+
+       Returns:
+       • Dictionary of the elapsed time, stub requests and records of both runs, and the changes found by the previous day's and the incremental run
+    """
+    def dayRunner(stubSite, postingIndex = None, responseCache = None):
+        requestCount, startTime = stubSite.requestCount, time.perf_counter()
+        urlUtil = stubURLUtil(stubSite, maxWorkers = workers, perHostLimit = workers, postingIndex = postingIndex, responseCache = responseCache)
+        jobRecords = urlUtil.batchExtract(urlUtil.jobListingPageBaseRequester(), batches + 1, stopEarly = True)
+        urlUtil.close()
+        return jobRecords, {'seconds': round(time.perf_counter() - startTime, 3), 'stubRequests': stubSite.requestCount - requestCount, 'jobRecords': len(jobRecords)}
+
+    stubSite = StubJobSite(latency, pageCount = batches, overlap = overlap)
+    try:
+        with TemporaryDirectory() as tempDir:
+            responseCache = scraper.HTTPResponseCache(os.path.join(tempDir, 'cache'), ttls = {'listing': 0}) if cache else None # listings are stale a day later
+            postingIndex = scraper.PostingIndex(os.path.join(tempDir, 'postings.sqlite'), recheckRate)
+            dayRunner(stubSite, postingIndex, responseCache) # builds the index
+            postingIndex.close()
+            previousStats = postingIndex.stats
+            stubSite.idShift, stubSite.revisedEvery = shift, revisedEvery # the listings of the next day
+            fullRecords, fullRun = dayRunner(stubSite)
+            postingIndex = scraper.PostingIndex(os.path.join(tempDir, 'postings.sqlite'), recheckRate) # a later run is a new process
+            incrementalRecords, incrementalRun = dayRunner(stubSite, postingIndex, responseCache)
+            postingIndex.close()
+            if responseCache is not None: 
+                incrementalRun['cache'] = responseCache.stats()
+                responseCache.close()
+        changeStatuses = {}
+        for jobRecord in incrementalRecords: changeStatuses[jobRecord['changeStatus']] = changeStatuses.get(jobRecord['changeStatus'], 0) + 1
+        revisedRecords = [jobRecord for jobRecord in fullRecords if 'Spark' in jobRecord['jobDescription']]
+        return {'fullRun': fullRun, 'incrementalRun': incrementalRun, 
+                'requestsSaved': round(1 - incrementalRun['stubRequests'] / fullRun['stubRequests'], 3), 
+                'previousRunStats': previousStats, 'changes': changeStatuses, 'indexStats': postingIndex.stats, 
+                'expected': {'previousRunAdded': batches * StubJobSite._jobsPerPage - (batches - 1) * overlap, 'added': shift, 'removed': shift, 
+                             'revisedPostingsListed': len(revisedRecords)}}
+    finally:
+        stubSite.close()
+
+def adaptiveBenchmark(latency = 0.05, capacity = 6, overloadReply = '429,captcha', batches = 4, workers = 16, safeWorkers = 2):
+    """Compares fixed job-page concurrencies with the adaptive concurrency controller, on a stub site that throttles (or serves block pages to) 
+       job-page requests beyond 'capacity' in flight
+
+       Params:
+       • latency - Fake delay (seconds) of every stub response
+       • capacity - Number of in-flight job-page requests the stub site sustains
+       • overloadReply - Comma-separated answers to the requests beyond the capacity ('429' and/or 'captcha'), each measured separately
+       • batches - Number of job-listing pages scraped per run
+       • workers - Number of fetching threads (the fixed high concurrency, and the adaptive controller's upper bound)
+       • safeWorkers - Fixed low concurrency, like a hand-picked safe setting
+
+       Returns:
+       • Dictionary holding, per overload answer, the elapsed time, job records, stub requests and overload replies of every mode, and the adaptive controller's statistics
+    """
+    results = {}
+    for replyMode, mode, modeWorkers, adaptive in ((replyMode, mode, modeWorkers, adaptive) for replyMode in str(overloadReply).split(',') 
+                                                   for mode, modeWorkers, adaptive in (('fixedSafe', safeWorkers, False), ('fixedHigh', workers, False), ('adaptive', workers, True))):
+        stubSite = StubJobSite(latency)
+        stubSite.capacity, stubSite.overloadReply = capacity, replyMode
+        concurrencyController = scraper.AdaptiveConcurrencyController(modeWorkers, verbose = False) if adaptive else None
+        httpPool = scraper.HTTPSessionPool(poolSize = modeWorkers, concurrencyController = concurrencyController)
+        try:
+            urlUtil = stubURLUtil(stubSite, maxWorkers = modeWorkers, perHostLimit = modeWorkers, httpPool = httpPool)
+            startTime = time.perf_counter()
+            jobRecords = urlUtil.batchExtract(urlUtil.jobListingPageBaseRequester(), batches)
+            results.setdefault(replyMode, {})[mode] = {'seconds': round(time.perf_counter() - startTime, 3), 'jobRecords': len(jobRecords), 'stubRequests': stubSite.requestCount, 
+                             'overloadReplies': stubSite.faultCounts.get('overload', 0), 'peakInFlight': stubSite.peakInFlight}
+            if concurrencyController is not None: 
+                results[replyMode][mode]['controller'] = dict(concurrencyController.stats(), history = concurrencyController.stats()['history'][-10:])
+            urlUtil.close()
+        finally:
+            httpPool.close()
+            stubSite.close()
+    return results
+
+def naiveSkillPatterns(skillMatcher):
+    """Compiles one regex per skill term of a SkillMatcher, with the same case and word-boundary rules (the baseline of skillBenchmark(); 
+       without the matcher's rule against name parts such as 'Series C', so the regexes find a superset of its skills)"""
+    skillPatterns = []
+    for _, term, caseSensitive in skillMatcher._terms:
+        pattern = ('(?<![\\w+#&])' if scraper.SkillMatcher._isWordChar(term[0]) else '') + re.escape(term) + ('(?![\\w+#&])' if scraper.SkillMatcher._isWordChar(term[-1]) else '')
+        skillPatterns.append((term, re.compile(pattern, 0 if caseSensitive else re.IGNORECASE)))
+    return skillPatterns
+
+def naiveSkillExtractor(skillPatterns, text):
+    """Finds the skill terms of a text by searching it once per term"""
+    text = ' '.join(text.split())
+    return {term for term, skillPattern in skillPatterns if skillPattern.search(text)}
+
+skillCheckSentences = ( # (sentence, skills the matcher must tag in it): short terms are tagged on their own, name parts are not
+    ('Strong knowledge of R.', ['R']), ('We use R for statistics.', ['R']), ('Proficiency in C.', ['C']), ('AI is our focus', ['AI']), 
+    ('Python, R and SQL', ['Python', 'R', 'SQL']), ('Our R&D team', []), ('Report to the C-level', []), ('We closed our Series C round', []), 
+    ('Please contact MR. Smith', [])
+)
+
+def skillBenchmark(descriptions = 100, words = 400, dictSizes = '0,3000', seed = 7):
+    """Compares the single-pass skill matcher with one regex search per skill term, over synthetic job descriptions and growing dictionaries
+
+       Params:
+       • descriptions - Number of synthetic job descriptions
+       • words - Number of words per description
+       • dictSizes - Comma-separated numbers of synthetic terms added to the shipped skill dictionaries
+       • seed - Random seed of the synthetic descriptions and terms
+
+       Returns:
+       • Dictionary of the timings of both extractors per dictionary size, whether every skill found by the matcher was also found by the regexes, 
+         and the check sentences (see skillCheckSentences) whose skills were not tagged as expected
+    """
+    randomGen = random.Random(seed)
+    shippedDicts = scraper.SkillMatcher()
+    shippedTerms = [term for _, term, _ in shippedDicts._terms]
+    fillerWords = ['the', 'team', 'will', 'work', 'with', 'data', 'and', 'build', 'models', 'for', 'our', 'clients', 'experience', 'in', 'strong', 
+                   'skills', 'years', 'of', 'a', 'is', 'plus', 'required', 'Responsibilities:', 'design,', 'deliver', 'products.', 'Reading', 'analysts']
+    texts = [' '.join(randomGen.choice(shippedTerms) if randomGen.random() < 0.05 else randomGen.choice(fillerWords) for _ in range(words)) for _ in range(descriptions)]
+    results = {'descriptions': descriptions, 'characters': sum(len(text) for text in texts)}
+    checkSkills = [(sentence, expectedSkills, [term for _, _, _, term in shippedDicts.skillMatchFinder(sentence)]) for sentence, expectedSkills in skillCheckSentences]
+    results['failedSkillChecks'] = {sentence: {'expected': expectedSkills, 'tagged': taggedSkills} for sentence, expectedSkills, taggedSkills in checkSkills 
+                                    if sorted(expectedSkills) != sorted(taggedSkills)}
+
+    for extraTerms in [int(dictSize) for dictSize in str(dictSizes).split(',')]:
+        syntheticTerms = [' '.join(''.join(randomGen.choice('bcdfghjklmnpqrstvwxz') for _ in range(randomGen.randint(4, 9))) for _ in range(randomGen.randint(1, 3))) 
+                          for _ in range(extraTerms)]
+        startTime = time.perf_counter()
+        skillMatcher = scraper.SkillMatcher([(category, [term for termCategory, term, _ in shippedDicts._terms if termCategory == category]) 
+                                             for category in shippedDicts.categories] + [('syntheticSkills', syntheticTerms)])
+        buildSeconds = time.perf_counter() - startTime
+        skillPatterns = naiveSkillPatterns(skillMatcher)
+
+        startTime = time.perf_counter()
+        matcherSkills = [{term for _, _, _, term in skillMatcher.skillMatchFinder(text)} for text in texts]
+        matcherSeconds = time.perf_counter() - startTime
+        startTime = time.perf_counter()
+        naiveSkills = [naiveSkillExtractor(skillPatterns, text) for text in texts]
+        naiveSeconds = time.perf_counter() - startTime
+        results['{} terms'.format(len(skillMatcher._terms))] = {
+            'matcher': {'buildSeconds': round(buildSeconds, 3), 'seconds': round(matcherSeconds, 3), 'descriptionsPerSec': round(descriptions / matcherSeconds, 1)},
+            'regexPerTerm': {'seconds': round(naiveSeconds, 3), 'descriptionsPerSec': round(descriptions / naiveSeconds, 1)},
+            'speedup': round(naiveSeconds / matcherSeconds, 2),
+            'matcherSkillsFoundByRegexes': all(matcherTerms <= naiveTerms for matcherTerms, naiveTerms in zip(matcherSkills, naiveSkills)) # the regexes also report terms inside longer matches
+        }
+    return results
+
+def stubFixtureRecorder(fixtureDir, batches = 3, workers = 8, pageTail = 2048):
+    """Records the responses of a stub-site scrape as fixtures (the synthetic stand-in for fixtures recorded with scraper.py --record-fixtures)"""
+    stubSite = StubJobSite(0.0, pageTail = pageTail)
+    fixtureRecorder = scraper.FixtureRecorder(fixtureDir)
+    try:
+        urlUtil = stubURLUtil(stubSite, maxWorkers = workers, perHostLimit = workers, fixtureRecorder = fixtureRecorder)
+        urlUtil.batchExtract(urlUtil.jobListingPageBaseRequester(), batches)
+        urlUtil.close()
+        return fixtureRecorder.recordCount
+    finally:
+        fixtureRecorder.close()
+        stubSite.close()
+
+def e2eRun(siteRoot, resultFile, batches = 3, workers = 8, parseWorkers = 0, streamPages = 0, timeout = 1.0):
+    """Runs one end-to-end scrape against a local job site and writes its measurements to a JSON file (the child process of e2eBenchmark())
+
+       Params:
+       • siteRoot - Root URL of the local job site
+       • resultFile - File the measurements are written to
+       • batches, workers, parseWorkers, streamPages - Scrape settings (see scraper.py's --batch-size, --workers, --parse-workers and --stream-pages)
+       • timeout - Seconds the HTTP session waits for the site before a retry
+
+       Returns:
+       • Dictionary of the measurements
+    """
+    try: import resource # POSIX only
+    except ImportError: resource = None
+
+    class LocalJobURLUtil(scraper.JobURLUtil):
+        _siteRoot = siteRoot
+    runMetrics = scraper.RunMetrics()
+    httpPool = scraper.HTTPSessionPool(poolSize = workers, backoffBase = 0.05, backoffCap = 1, timeout = timeout)
+    startTime, startCPUTime = time.perf_counter(), time.process_time()
+    urlUtil = LocalJobURLUtil('Data Scientist', 'Bangalore', 'SERVER_TIMING', maxWorkers = workers, perHostLimit = workers, httpPool = httpPool, 
+                              parseWorkers = parseWorkers, streamPages = bool(streamPages), runMetrics = runMetrics)
+    jobRecords = urlUtil.batchExtract(urlUtil.jobListingPageBaseRequester(), batches)
+    urlUtil.close()
+    elapsedTime = time.perf_counter() - startTime
+    cpuTime = time.process_time() - startCPUTime
+    if resource is not None: cpuTime += sum(resource.getrusage(resource.RUSAGE_CHILDREN)[:2]) # parse workers
+    jobPageStage = runMetrics.report()['stages'].get('jobPageFetch', {})
+
+    results = {'seconds': round(elapsedTime, 3), 'jobRecords': len(jobRecords), 'pagesPerSec': round(len(jobRecords) / elapsedTime, 2), 
+               'p50Ms': jobPageStage.get('p50Ms'), 'p99Ms': jobPageStage.get('p99Ms'), 'cpuSeconds': round(cpuTime, 3), 
+               'peakRSSMB': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1) if resource is not None else None, # ru_maxrss is in KB on Linux
+               'connections': httpPool.stats()}
+    httpPool.close()
+    with open(resultFile, 'w', encoding = 'utf-8') as resultFileObj: json.dump(results, resultFileObj)
+    return results
+
+def gitCommit():
+    """Returns the short hash of the checked-out commit (None outside a git repository)"""
+    try: return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd = os.path.dirname(os.path.abspath(__file__)), 
+                               capture_output = True, text = True, check = True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError): return None
+
+def historyTracker(history, results):
+    """Appends a benchmark result to a JSONL history file, adding the change of its medians against the latest entry of the same settings
+       Params:
+       • history - Path of the history file
+       • results - Benchmark result holding 'settings', 'median' and 'commit' (given 'sincePrevious' here, if there is an earlier entry)
+
+       Returns: [None]
+    """
+    previousResults = None
+    if os.path.exists(history):
+        with open(history, encoding = 'utf-8') as historyFile: 
+            historyLines = [historyLine for historyLine in historyFile if historyLine.strip()]
+        sameSettingsResults = [json.loads(historyLine) for historyLine in historyLines if json.loads(historyLine)['settings'] == results['settings']]
+        if sameSettingsResults: previousResults = sameSettingsResults[-1]
+    if previousResults is not None:
+        results['sincePrevious'] = {'commit': previousResults['commit'], 
+                                    'change': {measure: round(value / previousResults['median'][measure] - 1, 3) 
+                                               for measure, value in results['median'].items() if isinstance(value, (int, float)) and previousResults['median'].get(measure)}}
+    with open(history, 'a', encoding = 'utf-8') as historyFile: 
+        historyFile.write(json.dumps({fieldName: fieldValue for fieldName, fieldValue in results.items() if fieldName not in ('runs', 'sincePrevious')}) + '\n')
+
+def e2eBenchmark(fixtures = None, latency = 0.02, jitter = 0.02, forbiddenRate = 0.0, tooManyRate = 0.05, timeoutRate = 0.01, 
+                 batches = 3, workers = 8, parseWorkers = 0, streamPages = 0, timeout = 1.0, repeat = 3, history = None):
+    """Measures whole scrapes end to end against a replay server, each in a fresh process, with realistic latency and faults 
+
+       Params:
+       • fixtures - Directory of recorded fixtures (see scraper.py's --record-fixtures); synthetic stub-site fixtures are recorded if not given
+       • latency, jitter - Fake delay and random extra delay (seconds) of every replayed response
+       • forbiddenRate, tooManyRate, timeoutRate - Fractions of job-page requests answered with [403], [429] or no response at all
+       • batches, workers, parseWorkers, streamPages - Scrape settings of every run
+       • timeout - Seconds the HTTP session waits for the server before a retry
+       • repeat - Number of runs (the medians are reported)
+       • history - JSONL file every result is appended to, to track the numbers from commit to commit
+
+       Returns:
+       • Dictionary of the median throughput, job-page latency, CPU time and peak RSS, the individual runs and the change against the latest history entry (see historyTracker())
+    """
+    fixturesLabel = fixtures or 'synthetic'
+    with TemporaryDirectory() as tempDir:
+        if fixtures is None:
+            fixtures = os.path.join(tempDir, 'fixtures')
+            stubFixtureRecorder(fixtures, batches, workers)
+        replaySite = ReplayJobSite(fixtures, latency, jitter, {'403': forbiddenRate, '429': tooManyRate, 'timeout': timeoutRate}, stallSeconds = timeout + 0.5)
+        try:
+            runs = []
+            for runNumber in range(repeat):
+                resultFile = os.path.join(tempDir, 'run{}.json'.format(runNumber))
+                subprocess.run([sys.executable, os.path.abspath(__file__), 'e2e-run', '--site-root=' + replaySite.siteRoot, '--result-file=' + resultFile, 
+                                '--batches={}'.format(batches), '--workers={}'.format(workers), '--parse-workers={}'.format(parseWorkers), 
+                                '--stream-pages={}'.format(streamPages), '--timeout={}'.format(float(timeout))], stdout = subprocess.DEVNULL, check = True)
+                with open(resultFile, encoding = 'utf-8') as resultFileObj: runs.append(json.load(resultFileObj))
+        finally:
+            replaySite.close()
+
+    medians = {measure: round(statistics.median(run[measure] for run in runs), 3) if runs[0][measure] is not None else None
+               for measure in ('pagesPerSec', 'p50Ms', 'p99Ms', 'cpuSeconds', 'peakRSSMB', 'jobRecords')}
+    results = {'commit': gitCommit(), 'timestamp': datetime.now().isoformat(timespec = 'seconds'), 
+               'settings': {'fixtures': fixturesLabel, 'latency': latency, 'jitter': jitter, 
+                            'faultRates': replaySite.faultRates, 'batches': batches, 'workers': workers, 'parseWorkers': parseWorkers, 'streamPages': streamPages}, 
+               'median': medians, 'faultsServed': replaySite.faultCounts, 'replayMisses': replaySite.missCount, 'runs': runs}
+    if history: historyTracker(history, results)
+    return results
+
+def importBenchmark(repeat = 10, history = None):
+    """Measures the startup of scraper.py in fresh processes: the bare interpreter, importing the module, --help (as a script, whose code 
+       is compiled on every start, and through the import, whose bytecode is cached), the modules loaded by the import, and setting up the 
+       scraping patterns and skill matcher (first object, further objects, and first object with a warm --skill-cache file)
+
+       Params:
+       • repeat - Number of runs of every measurement (the medians are reported)
+       • history - JSONL file every result is appended to, to track the numbers from commit to commit
+
+       Returns:
+       • Dictionary of the median startup times (ms), the heavy modules loaded by a bare import, and the change against the latest history entry
+    """
+    scriptDir = os.path.dirname(os.path.abspath(__file__))
+    heavyModules = ('requests', 'urllib3', 'sqlite3', 'webbrowser', 'concurrent.futures', 'cProfile', 'pstats')
+    setupSnippet = ('import json, sys, time; startTime = time.perf_counter(); import scraper; importTime = time.perf_counter() - startTime\n'
+                    'scraper.SkillMatcher.cachePath = sys.argv[1] if len(sys.argv) > 1 else None\n'
+                    'startTime = time.perf_counter(); scraper.ScraperLogic(); firstTime = time.perf_counter() - startTime\n'
+                    'startTime = time.perf_counter(); scraper.ScraperLogic(); sharedTime = time.perf_counter() - startTime\n'
+                    'print(json.dumps([importTime, firstTime, sharedTime, sorted(name for name in {} if name in sys.modules)]))').format(heavyModules)
+
+    def wallTimer(command):
+        startTime = time.perf_counter()
+        subprocess.run(command, cwd = scriptDir, stdout = subprocess.DEVNULL, check = True)
+        return 1000 * (time.perf_counter() - startTime)
+
+    subprocess.run([sys.executable, '-c', 'import scraper'], cwd = scriptDir, check = True) # writes the module's cached bytecode
+    with TemporaryDirectory() as tempDir:
+        skillCachePath = os.path.join(tempDir, 'skills.cache')
+        subprocess.run([sys.executable, '-c', setupSnippet, skillCachePath], cwd = scriptDir, stdout = subprocess.DEVNULL, check = True) # writes the skill cache
+        runs = {'interpreterMs': [], 'importMs': [], 'helpScriptMs': [], 'helpViaImportMs': [], 'inProcessImportMs': [], 'firstScraperLogicMs': [], 
+                'sharedScraperLogicMs': [], 'cachedFirstScraperLogicMs': []}
+        for _ in range(repeat):
+            runs['interpreterMs'].append(wallTimer([sys.executable, '-c', 'pass']))
+            runs['importMs'].append(wallTimer([sys.executable, '-c', 'import scraper']))
+            runs['helpScriptMs'].append(wallTimer([sys.executable, 'scraper.py', '--help']))
+            runs['helpViaImportMs'].append(wallTimer([sys.executable, '-c', 'import scraper; scraper.main()', '--help']))
+            importTime, firstTime, sharedTime, loadedModules = json.loads(subprocess.run([sys.executable, '-c', setupSnippet], cwd = scriptDir, capture_output = True, 
+                                                                                          text = True, check = True).stdout)
+            runs['inProcessImportMs'].append(1000 * importTime)
+            runs['firstScraperLogicMs'].append(1000 * firstTime)
+            runs['sharedScraperLogicMs'].append(1000 * sharedTime)
+            runs['cachedFirstScraperLogicMs'].append(1000 * json.loads(subprocess.run([sys.executable, '-c', setupSnippet, skillCachePath], cwd = scriptDir, 
+                                                                                      capture_output = True, text = True, check = True).stdout)[1])
+
+    results = {'commit': gitCommit(), 'timestamp': datetime.now().isoformat(timespec = 'seconds'), 'settings': {'benchmark': 'import', 'repeat': repeat}, 
+               'median': {measure: round(statistics.median(values), 3) for measure, values in runs.items()}, 'heavyModulesAfterImport': loadedModules}
+    if history: historyTracker(history, results)
+    return results
+
+BENCHMARKS = {
+    'fetch' : fetchBenchmark,
+    'pipeline' : pipelineBenchmark,
+    'session' : sessionBenchmark,
+    'cache' : cacheBenchmark,
+    'extract' : extractBenchmark,
+    'parse' : parseBenchmark,
+    'writer' : writerBenchmark,
+    'resume' : resumeBenchmark,
+    'stream' : streamBenchmark,
+    'multiquery' : multiQueryBenchmark,
+    'skills' : skillBenchmark,
+    'incremental' : incrementalBenchmark,
+    'adaptive' : adaptiveBenchmark,
+    'e2e' : e2eBenchmark,
+    'import' : importBenchmark,
+    'e2e-run' : e2eRun
+}
+
+def main():
+    if len(argv) < 2 or argv[1] not in BENCHMARKS:
+        print('<ERROR> Benchmark name expected - one of {}'.format(', '.join(BENCHMARKS)))
+        exit(0)
+    benchmarkArgs = {}
+    for cmdParam in argv[2:]:
+        argName, _, argValue = cmdParam.lstrip('-').partition('=')
+        argName = re.sub(r'-(\w)', lambda match: match.group(1).upper(), argName) # --host-limit=8 -> hostLimit=8
+        for argType in (int, float, str): # --latency=0.02 -> 0.02, --fixtures=./fixtures -> './fixtures'
+            try: 
+                benchmarkArgs[argName] = argType(argValue)
+                break
+            except ValueError: pass
+    print(json.dumps(BENCHMARKS[argv[1]](**benchmarkArgs), indent = 2))
+
+if __name__ == '__main__': main()
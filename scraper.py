@@ -19,14 +19,38 @@ Author's Notes:
 
 """
 
-# MODULE DEPENDENCIES
-import requests
-import webbrowser
+# MODULE DEPENDENCIES {requests, webbrowser, sqlite3, cProfile, pstats and concurrent.futures are imported where first used, 
+#                       so that --help, argument validation and short runs do not pay for loading them}
 import re
+import random
+import time
+import gzip
+import hashlib
+import os
+import csv
+import json
+import codecs
+import html
+from collections import deque
+from queue import Empty
+from queue import Full
+from queue import Queue
+from threading import BoundedSemaphore
+from threading import Condition
+from threading import Event
+from threading import Lock
+from threading import Thread
+from threading import local
+from urllib.parse import parse_qsl
+from urllib.parse import urlencode
+from urllib.parse import urlsplit
+from urllib.parse import urlunsplit
 from sys import exit
 from sys import exc_info
 from sys import argv
+from sys import _current_frames
 from datetime import datetime
+from datetime import timedelta
 
 # DEBUG UTILITY FUNCTION {Deprecated}
 def htmlFileTester(docName, docContent):
@@ -45,30 +69,1514 @@ def htmlFileTester(docName, docContent):
     fileHandler = open(fileName, 'w', encoding='utf-8')
     fileHandler.write(docContent)
     fileHandler.close()
+    import webbrowser
     webbrowser.open_new_tab(fileName)
 
 # CENTRAL AND TUNABLE LOGIC-BASE FOR SCRAPING
 class ScraperLogic:
     """Contains the main-logic and search patterns for GD scraping"""
+
+    # PRIVATE VARIABLES
+    _headerFields = ('companyName', 'companyNameAlt', 'companyRating', 'jobTitle', 'jobLocation', 'jobPostingDate') # each pattern holds exactly one capturing group
+    _requiredHeaderFields = ('companyName', 'companyRating', 'jobTitle', 'jobLocation', 'jobPostingDate') # once found, scanning stops (companyNameAlt is only a fallback)
+    _quotePrefix = r'(?:\'|")'
+    _streamScanOverlap = 2048 # characters of a streamed page re-scanned with every new chunk, so that markers split across chunks are still found
+    _sharedPatterns = None # (patternBase, headerPattern, headerValueGroups), compiled by the first instance of the process and shared by all others
+    _sharedPatternsLock = Lock()
+
     def __init__(self):
         """Sets the foundational scraper-logic object(s) for information extraction from web pages
+           The patterns and the skill matcher are built once per process and shared by all instances (e.g. one per JobURLUtil)
+
+           Params: [None]
+    
+           Returns: [None]   
+        """
+        with ScraperLogic._sharedPatternsLock:
+            if ScraperLogic._sharedPatterns is None: ScraperLogic._sharedPatterns = ScraperLogic._patternCompiler()
+        self.patternBase, self._headerPattern, self._headerValueGroups = ScraperLogic._sharedPatterns
+        self.skillMatcher = SkillMatcher.defaultMatcher() # Tags the job descriptions with the skills of the skill dictionaries
+
+    @staticmethod
+    def _patternCompiler():
+        """Compiles the search patterns
+           Helper Method For: __init__()
+
+           Params: [None]
+
+           Returns:
+           • patternBase - Dictionary of the compiled search patterns by name
+           • headerPattern, headerValueGroups - Single-pass header pattern and its value groups (see _headerPatternCompiler())
+        """
+        patternBase = {
+            # Applied separately using jobLinkExtractor()
+            'jobLink' : re.compile(r'v><a href=(?:\'|")/partner/jobListing([.?=&_0-9a-zA-Z]+)(?:\'|")'), 
+            # Applied separately using jobListingIdExtractor() on extracted job links
+            'jobListingId' : re.compile(r'jobListingId=(\d+)'),
+            # Applied separately using logoLinkExtractor()
+            'logoLink' : re.compile(r'(?:https?://media\.glassdoor\.[a-zA-Z.-]+/sqls/[0-9]+/[a-zA-Z0-9-]+\.png|defLogo)'),
+            # Applied collectively on job-pages accessible via extracted job-links [Header Information]
+            'jobTitle' : re.compile(r'(?:\'|")jobTitle(?:\'|"):(?:\'|")([\d\w\sÀ-ÿ.,&\)\(\]\[\{\};:\\/#!—–-]+)(?:\'|")'), 
+            'companyRating' : re.compile(r'(?:\'|")ratingNum(?:\'|")>([\d.]+)<'), 
+            'jobLocation' : re.compile(r'(?:\'|")loc(?:\'|"):(?:\'|")([\d\w\sÀ-ÿ.,&\)\(\]\[\{\};:\\/#!—–-]+)(?:\'|")'),   
+            'jobPostingDate' : re.compile(r'(?:\'|")datePosted(?:\'|")\svalue=(?:\'|")([0-9-]+)\s'),
+            'companyName' : re.compile(r'(?:\'|")employerName(?:\'|"):(?:\'|")([\d\w\sÀ-ÿ.,&\)\(\]\[\{\};:\\/#!—–-]+)(?:\'|")'), 
+            'companyNameAlt' : re.compile(r'(?:\'|")companyName(?:\'|")>([\d\w\sÀ-ÿ.,&\)\(\]\[\{\};:\\/#!—–-]+)<'),
+            # Applied separately using descriptionExtractor() [Job Description: opening tag of the description's div, then its nested div tags]
+            'jobDescription' : re.compile(r'<div[^>]*class=(?:\'|")jobDescriptionContent[^>]*>'),
+            'divTag' : re.compile(r'<(/?)div\b', re.IGNORECASE),
+            'htmlTag' : re.compile(r'<[^>]*>')
+        }                
+        return (patternBase,) + ScraperLogic._headerPatternCompiler(patternBase)
+
+    @staticmethod
+    def _headerPatternCompiler(patternBase):
+        """Combines the header patterns of patternBase into one alternation with a named group per field, so that a job page is scanned once
+           The quote that every header pattern starts with is hoisted out of the alternation, letting the scan skip ahead to the next quote
+           Helper Method For: _patternCompiler()
+
+           Params:
+           • patternBase - Dictionary of the compiled search patterns by name
+
+           Returns:
+           • headerPattern - Compiled alternation of all header patterns
+           • headerValueGroups - Dictionary mapping each header field to the group number of its extracted value
+        """
+        headerSources = [patternBase[fieldName].pattern for fieldName in ScraperLogic._headerFields]
+        prefix = ScraperLogic._quotePrefix if all(source.startswith(ScraperLogic._quotePrefix) for source in headerSources) else ''
+        headerPattern = re.compile(prefix + '(?:' + '|'.join('(?P<{}>{})'.format(fieldName, source[len(prefix):]) for fieldName, source in zip(ScraperLogic._headerFields, headerSources)) + ')')
+        return headerPattern, {fieldName: headerPattern.groupindex[fieldName] + 1 for fieldName in ScraperLogic._headerFields}
+
+    def headerFieldExtractor(self, htmlContent):
+        """Extracts the first match of every header pattern in a single pass over the job page, stopping as soon as all required fields are found
+           (gives the same values as taking findall(htmlContent)[0] of each header pattern in patternBase)
+
+           Params:
+           • htmlContent - HTML text content of a job page
+
+           Returns:
+           • headerFields - Dictionary mapping each found header field to its first extracted value (fields without any match are left out)
+        """
+        headerFields = {}
+        for match in self._headerPattern.finditer(htmlContent):
+            fieldName = match.lastgroup # the field's own named group closes last, as it encloses the value group
+            if fieldName in headerFields: continue
+            headerFields[fieldName] = match.group(self._headerValueGroups[fieldName])
+            if all(requiredField in headerFields for requiredField in ScraperLogic._requiredHeaderFields): break
+        return headerFields
+
+    def _divCloseFinder(self, htmlContent, scanFrom, divDepth):
+        """Scans div tags for the one closing the job description's div
+           Helper Method For: descriptionExtractor(), pageReadChecker()
+
+           Params:
+           • htmlContent - HTML text content of a (possibly partially read) job page
+           • scanFrom - Offset of the first character to be scanned
+           • divDepth - Number of div tags still open at 'scanFrom' (1 right after the description's opening tag)
+
+           Returns:
+           • closeOffset - Offset of the closing tag (None if not read yet)
+           • divDepth - Number of div tags still open at 'nextScanFrom'
+           • nextScanFrom - Offset the scan continues from once more of the page is read
+        """
+        nextScanFrom = scanFrom
+        for tagMatch in self.patternBase['divTag'].finditer(htmlContent, scanFrom):
+            divDepth += -1 if tagMatch.group(1) else 1
+            if divDepth == 0: return tagMatch.start(), 0, tagMatch.end()
+            nextScanFrom = tagMatch.end()
+        return None, divDepth, max(nextScanFrom, len(htmlContent) - len('</div')) # a tag cut off at the end is scanned again
+
+    def descriptionExtractor(self, htmlContent):
+        """Extracts the job description as plain text (tags removed, entities unescaped, whitespace collapsed)
+           Params:
+           • htmlContent - HTML text content of a job page
+
+           Returns:
+           • Job description text (None if the page holds no job description)
+        """
+        startMatch = self.patternBase['jobDescription'].search(htmlContent)
+        if not startMatch: return None
+        closeOffset, _, _ = self._divCloseFinder(htmlContent, startMatch.end(), 1)
+        descriptionHTML = htmlContent[startMatch.end():closeOffset] # up to the end of the page if the div is never closed
+        return ' '.join(html.unescape(self.patternBase['htmlTag'].sub(' ', descriptionHTML)).split())
+
+    def pageReadChecker(self, htmlContent, readState):
+        """Checks whether a job page that is being read incrementally already holds all required header fields and the whole job description,
+           scanning only the newly read part of the page (see boundedPageReader())
+
+           Params:
+           • htmlContent - HTML text content of the job page read so far
+           • readState - Dictionary carrying the scan progress from one call to the next (empty on the first call)
+
+           Returns:
+           • Whether the rest of the page can be left unread
+        """
+        if not readState: readState.update(headerFields = set(), headerScanFrom = 0, descriptionStart = None, divDepth = 1, divScanFrom = 0, descriptionEnd = None)
+        for match in self._headerPattern.finditer(htmlContent, readState['headerScanFrom']): readState['headerFields'].add(match.lastgroup)
+        if readState['descriptionStart'] is None:
+            startMatch = self.patternBase['jobDescription'].search(htmlContent, readState['headerScanFrom'])
+            if startMatch: readState['descriptionStart'] = readState['divScanFrom'] = startMatch.end()
+        readState['headerScanFrom'] = max(0, len(htmlContent) - ScraperLogic._streamScanOverlap)
+        if readState['descriptionStart'] is not None and readState['descriptionEnd'] is None:
+            readState['descriptionEnd'], readState['divDepth'], readState['divScanFrom'] = self._divCloseFinder(htmlContent, readState['divScanFrom'], readState['divDepth'])
+        return readState['descriptionEnd'] is not None and all(fieldName in readState['headerFields'] for fieldName in ScraperLogic._requiredHeaderFields)
+
+# JOB-PAGE HEADER PARSING (shared by in-thread parsing and the parse-worker processes)
+def jobPageHeaderParser(scraperLogic, doc, htmlContent):
+    """Scrapes a single job page's header information, job description and the skills it mentions
+
+        Params: 
+        • scraperLogic - ScraperLogic object holding the compiled header patterns
+        • doc - Date on client's side, for the job-posting time difference
+        • htmlContent - HTML text content of the job page
+
+        Returns:
+        • headerValues - Dictionary of the job's header information, description and skills (None if it could not be scraped)   
+        • errorInfo - Description of the scraping error (None if the job page was scraped)
+        • parseInfo - Dictionary of the pattern names without any match ('fieldMisses', e.g. 'companyName' when the companyNameAlt fallback fires)
+          and of the seconds spent in every extraction step ('stageSeconds')
+    """
+
+    # Future Work: Need to preprocess names and titles by removing unicodes like &amp;
+    parseInfo = {'fieldMisses': [], 'stageSeconds': {}}
+    try:
+        stageStart = time.perf_counter()
+        headerFields = scraperLogic.headerFieldExtractor(htmlContent) # Single pass over the job page for all header patterns
+        parseInfo['stageSeconds']['headerExtraction'] = time.perf_counter() - stageStart
+        parseInfo['fieldMisses'] = [fieldName for fieldName in ScraperLogic._requiredHeaderFields if fieldName not in headerFields]
+        if 'companyName' not in headerFields and 'companyNameAlt' not in headerFields: parseInfo['fieldMisses'].append('companyNameAlt')
+        missingFields = [fieldName for fieldName in ('jobTitle', 'jobLocation', 'jobPostingDate') if fieldName not in headerFields]
+        if 'companyName' not in headerFields and 'companyNameAlt' not in headerFields: missingFields.insert(0, 'companyNameAlt')
+        if missingFields: raise ValueError('No match for pattern(s): {}'.format(', '.join(missingFields)))
+
+        # Company-Name Extraction (Backup Pattern if needed)
+        companyName = headerFields.get('companyName', headerFields.get('companyNameAlt'))
+        
+        # Company-Rating Extraction
+        companyRating = headerFields.get('companyRating', -1)
+
+        # Job-Title and Job-Location Extraction
+        jobTitle, jobLocation = headerFields['jobTitle'], headerFields['jobLocation']
+
+        # Job Posting Time Difference Extraction
+        jobPostingTimeDiff = (doc - datetime.strptime(headerFields['jobPostingDate'], JobURLUtil.getJobPostingDateFormat())).days 
+
+        # Job Description and Skill Extraction (the description is optional, as it is not needed by the header information)
+        stageStart = time.perf_counter()
+        jobDescription = scraperLogic.descriptionExtractor(htmlContent)
+        parseInfo['stageSeconds']['descriptionExtraction'] = time.perf_counter() - stageStart
+        if jobDescription is None: parseInfo['fieldMisses'].append('jobDescription')
+        stageStart = time.perf_counter()
+        skillTags = scraperLogic.skillMatcher.skillExtractor(jobDescription or '')
+        parseInfo['stageSeconds']['skillTagging'] = time.perf_counter() - stageStart
+
+    except Exception as error:
+        return None, '{}\n......> <Line Number> {}'.format(error, exc_info()[-1].tb_lineno), parseInfo # Shows with line number error wth sys.exc_info()
+
+    return {'companyName': companyName, 
+            'companyRating': companyRating, 
+            'jobTitle': jobTitle, 
+            'jobLocation': jobLocation, 
+            'jobPostingTimeDiff': jobPostingTimeDiff,
+            'jobDescription': jobDescription,
+            **skillTags}, None, parseInfo
+
+# PARSE-WORKER PROCESS STATE AND TASK {Each worker process compiles the ScraperLogic patterns once, in _parseWorkerInitializer()}
+_parseWorkerState = {}
+
+def _parseWorkerInitializer(doc, skillCachePath = None):
+    """Sets up a parse-worker process with its own precompiled patterns and the date on client's side"""
+    SkillMatcher.cachePath = skillCachePath # not inherited by spawned (non-forked) processes
+    _parseWorkerState['scraperLogic'] = ScraperLogic()
+    _parseWorkerState['doc'] = doc
+
+def _parseWorkerTask(pageBytes, encoding):
+    """Decodes the raw bytes of a job page inside a parse-worker process and scrapes its header information (see jobPageHeaderParser())"""
+    return jobPageHeaderParser(_parseWorkerState['scraperLogic'], _parseWorkerState['doc'], pageBytes.decode(encoding or 'utf-8', errors = 'replace'))
+
+def parseExecutorCreator(doc, parseWorkers):
+    """Creates a process pool for CPU-bound job-page parsing, whose workers hold precompiled ScraperLogic patterns
+
+        Params: 
+        • doc - Date on client's side, for the job-posting time difference
+        • parseWorkers - Number of parse-worker processes
+
+        Returns:
+        • ProcessPoolExecutor to be passed to parallelJobPageParser()
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    return ProcessPoolExecutor(max_workers = parseWorkers, initializer = _parseWorkerInitializer, initargs = (doc, SkillMatcher.cachePath))
+
+def parallelJobPageParser(parseExecutor, parseWorkers, pages):
+    """Scrapes the header information of many job pages across the parse-worker processes, keeping the order of the pages
+
+        Params: 
+        • parseExecutor - Process pool created by parseExecutorCreator()
+        • parseWorkers - Number of processes of the pool
+        • pages - List of (pageBytes, encoding) tuples of raw job pages
+
+        Returns:
+        • List of (headerValues, errorInfo, parseInfo) tuples (see jobPageHeaderParser()), in the same order as 'pages'
+    """
+    if not pages: return []
+    chunkSize = max(1, len(pages) // (parseWorkers * 4)) # batches of pages per inter-process round-trip
+    return list(parseExecutor.map(_parseWorkerTask, [pageBytes for pageBytes, _ in pages], [encoding for _, encoding in pages], chunksize = chunkSize))
+
+def cachedJobPageParser(responseCache, doc, parseWorkers = 0):
+    """Re-scrapes every job page held by a response cache, e.g. after a header pattern was added or changed, without any network access
+
+        Params: 
+        • responseCache - HTTPResponseCache holding previously fetched job pages
+        • doc - Date on client's side, for the job-posting time difference
+        • parseWorkers - Number of parse-worker processes (0 = parse in the calling thread)
+
+        Returns:
+        • List of (jobURL, headerValues, errorInfo) tuples
+    """
+    cachedPages = list(responseCache.cachedBodies('job'))
+    pages = [(pageBytes, encoding) for _, pageBytes, encoding in cachedPages]
+    if parseWorkers:
+        with parseExecutorCreator(doc, parseWorkers) as parseExecutor: parsedHeaders = parallelJobPageParser(parseExecutor, parseWorkers, pages)
+    else:
+        scraperLogic = ScraperLogic()
+        parsedHeaders = [jobPageHeaderParser(scraperLogic, doc, pageBytes.decode(encoding or 'utf-8', errors = 'replace')) for pageBytes, encoding in pages]
+    return [(jobURL, headerValues, errorInfo) for (jobURL, _, _), (headerValues, errorInfo, _) in zip(cachedPages, parsedHeaders)]
+
+# BOUNDED JOB-PAGE READING {The tail of a job page (similar jobs, footer, scripts) is neither downloaded nor decoded}
+def boundedPageReader(scraperLogic, responseObj, chunkSize = 16384):
+    """Reads a streamed job page (requested with stream=True) chunk by chunk, stopping once its header information and job description are read
+
+        Params: 
+        • scraperLogic - ScraperLogic object deciding when enough of the page is read (see ScraperLogic.pageReadChecker())
+        • responseObj - Streamed response object of a job page
+        • chunkSize - Number of bytes read at a time
+
+        Returns:
+        • responseObj - The same response object, whose content holds the part of the page read (responseObj.truncated tells whether the rest was left unread)
+    """
+    try: decoder = codecs.getincrementaldecoder(responseObj.encoding or 'utf-8')(errors = 'replace')
+    except LookupError: decoder = codecs.getincrementaldecoder('utf-8')(errors = 'replace')
+    pageChunks, htmlContent, readState, truncated = [], '', {}, False
+    try:
+        for pageChunk in responseObj.iter_content(chunkSize):
+            pageChunks.append(pageChunk)
+            htmlContent += decoder.decode(pageChunk)
+            if scraperLogic.pageReadChecker(htmlContent, readState): 
+                truncated = True
+                break
+    finally:
+        responseObj.close() # a connection left with unread data cannot be reused, so it is closed rather than returned to the pool
+    responseObj._content, responseObj._content_consumed = b''.join(pageChunks), True
+    responseObj.truncated = truncated
+    return responseObj
+
+# SKILL-DICTIONARY MATCHER CLASS {Aho-Corasick automaton over all dictionary terms}
+class SkillMatcher:
+    """Tags job-description text with the skills of the fine (tools) and coarse (concepts) skill dictionaries, in a single pass over the text
+
+    • All terms are compiled into one Aho-Corasick automaton, so the matching time grows with the text length, not with the number of terms
+    • Terms match case-insensitively, except short terms written with capitals (at most 2 letters/digits, e.g. 'R', 'C', 'AI', 'A.I.', 'S3'), 
+      which only match as written
+    • A term only matches as a whole word (no letter, digit, '_', '+', '#' or '&' next to it, nor '-' next to a single-letter term, so 'R&D' 
+      and 'C-level' are no matches), and overlapping matches keep the longest one ('React.js' rather than 'React', 'C++' rather than 'C')
+    • Short capitalised terms that read as part of a name are no matches: a single capital letter right after a capitalised word 
+      ('Series C', 'Plan B'), and a title such as 'MR' followed by a period and a capitalised word ('MR. Smith')
+    """
+
+    # PRIVATE VARIABLES
+    _dictFiles = (('fineSkills', 'fine_skills_dict.txt'), ('coarseSkills', 'coarse_skills_dict.txt')) # (category, file name next to this script)
+    _caseSensitiveLength = 2 
+    _titleTerms = ('MR',) # terms also written as a title before a name
+    _cacheVersion = 1 # bumped whenever the automaton layout changes, invalidating cache files
+    _defaultMatcher = None
+    _defaultMatcherLock = Lock()
+    cachePath = None # File caching the automaton of the dictionary files across processes (no caching if None, see defaultMatcher())
+
+    def __init__(self, skillDicts = None):
+        """Compiles the skill dictionaries into the matching automaton
+           Params:
+           • skillDicts - List of (category, terms) tuples (the fine and coarse skill dictionary files if not given)
+
+           Returns: [None]
+        """
+        if skillDicts is None: 
+            scriptDir = os.path.dirname(os.path.abspath(__file__))
+            skillDicts = [(category, SkillMatcher.skillDictReader(os.path.join(scriptDir, fileName))) for category, fileName in SkillMatcher._dictFiles]
+        self.categories = [category for category, _ in skillDicts]
+        self._terms, termKeys = [], {} # (category, term, caseSensitive), normalized term -> term index
+        for category, terms in skillDicts:
+            for term in terms:
+                term = ' '.join(term.split())
+                termKey = term.lower()
+                if not term or termKey in termKeys: continue # first spelling of a duplicate term is kept
+                termKeys[termKey] = len(self._terms)
+                caseSensitive = sum(char.isalnum() for char in term) <= SkillMatcher._caseSensitiveLength and term != termKey
+                self._terms.append((category, term, caseSensitive))
+        self._goto, self._fail, self._outputs = self._automatonBuilder(termKeys)
+
+    @classmethod
+    def defaultMatcher(cls):
+        """Returns the matcher of the skill dictionary files, built once per process and shared by all ScraperLogic objects
+           With 'cachePath' set, the built automaton is loaded from (or saved to) that file, and rebuilt once a dictionary file changes
+           (only the automaton is worth caching: a pickled regex is compiled all over again when unpickled; marshal is used, as it is 
+           built into the interpreter and loads faster than pickle, which itself takes longer to import than the automaton takes to load)
+
+           Params: [None]
+
+           Returns:
+           • Shared SkillMatcher object
+        """
+        with cls._defaultMatcherLock:
+            if cls._defaultMatcher is not None: return cls._defaultMatcher
+            scriptDir = os.path.dirname(os.path.abspath(__file__))
+            dictPaths = [os.path.join(scriptDir, fileName) for _, fileName in cls._dictFiles]
+            cacheKey = [cls._cacheVersion] + [(os.path.getsize(dictPath), os.stat(dictPath).st_mtime_ns) for dictPath in dictPaths]
+            if cls.cachePath is not None:
+                import marshal
+                try:
+                    with open(cls.cachePath, 'rb') as cacheFile: storedKey, automaton = marshal.loads(cacheFile.read()) # marshal.load() reads the file in small pieces
+                    if storedKey == cacheKey:
+                        cls._defaultMatcher = cls.__new__(cls)
+                        cls._defaultMatcher.categories, cls._defaultMatcher._terms, cls._defaultMatcher._goto, cls._defaultMatcher._fail, cls._defaultMatcher._outputs = automaton
+                        return cls._defaultMatcher
+                except (OSError, EOFError, ValueError, TypeError): pass # missing, unreadable or written by another Python version: rebuilt below
+            cls._defaultMatcher = cls()
+            if cls.cachePath is not None:
+                matcher = cls._defaultMatcher
+                tempPath = '{}.{}.tmp'.format(cls.cachePath, os.getpid())
+                try:
+                    with open(tempPath, 'wb') as cacheFile: 
+                        marshal.dump((cacheKey, (matcher.categories, matcher._terms, matcher._goto, matcher._fail, matcher._outputs)), cacheFile)
+                    os.replace(tempPath, cls.cachePath) # concurrent processes never read a half-written cache
+                except OSError as error: print('<WARNING> Could not save the skill-matcher cache\n......> <Further Info> {}'.format(error), flush = True)
+            return cls._defaultMatcher
+
+    @staticmethod
+    def skillDictReader(path):
+        """Reads a skill dictionary file holding one term per line (blank lines are skipped)"""
+        with open(path, encoding = 'utf-8') as dictFile: return [line.strip() for line in dictFile if line.strip()]
+
+    @staticmethod
+    def _isWordChar(char):
+        """Checks whether a character continues a word, so that a term cannot end or start next to it"""
+        return char.isalnum() or char in '_+#&'
+
+    @staticmethod
+    def _isNamePart(text, start, end, term):
+        """Checks whether a capitalised short term matched as written reads as part of a name ('Series C', 'MR. Smith') rather than as a skill"""
+        if len(term) == 1 and start >= 2 and text[start - 1] == ' ':
+            wordBefore = text[text.rfind(' ', 0, start - 1) + 1:start - 1]
+            return wordBefore.isalpha() and wordBefore[0].isupper()
+        return term in SkillMatcher._titleTerms and text[end:end + 2] == '. ' and text[end + 2:end + 3].isupper()
+
+    def _automatonBuilder(self, termKeys):
+        """Builds the Aho-Corasick automaton (trie transitions, failure links and outputs) of the normalized terms
+           Helper Method For: __init__()
+
+           Params:
+           • termKeys - Dictionary mapping each normalized (lowercase) term to its term index
+
+           Returns:
+           • goto - List of transition dictionaries (character -> state) of the trie states, state 0 being the root
+           • fail - List of failure-link states, i.e. the state of the longest proper suffix also present in the trie
+           • outputs - List of (term index, term length) tuples of the terms ending at every state
+        """
+        goto, fail, outputs = [{}], [0], [[]]
+        for termKey, termIndex in termKeys.items():
+            state = 0
+            for char in termKey:
+                nextState = goto[state].get(char)
+                if nextState is None:
+                    nextState = len(goto)
+                    goto.append({})
+                    fail.append(0)
+                    outputs.append([])
+                    goto[state][char] = nextState
+                state = nextState
+            outputs[state].append((termIndex, len(termKey)))
+
+        stateQueue = deque(goto[0].values()) # breadth-first, so every failure link points to an already linked state
+        while stateQueue:
+            state = stateQueue.popleft()
+            for char, nextState in goto[state].items():
+                stateQueue.append(nextState)
+                failState = fail[state]
+                while failState and char not in goto[failState]: failState = fail[failState]
+                fail[nextState] = goto[failState].get(char, 0)
+                outputs[nextState] = outputs[nextState] + outputs[fail[nextState]]
+        return goto, fail, outputs
+
+    def skillMatchFinder(self, text):
+        """Finds the skill terms in a text in a single pass of the automaton
+           Params:
+           • text - Job-description (plain) text
+
+           Returns:
+           • List of (start, end, category, term) tuples of non-overlapping whole-word matches, ordered by position 
+             (start and end are character offsets in the whitespace-collapsed text)
+        """
+        text = ' '.join(text.split())
+        lowered = text.lower()
+        if len(lowered) != len(text): lowered = ''.join(char.lower() if len(char.lower()) == 1 else char for char in text) # keeps offsets aligned
+        goto, fail, outputs, terms, isWordChar = self._goto, self._fail, self._outputs, self._terms, SkillMatcher._isWordChar
+
+        candidates, state = [], 0
+        for end, char in enumerate(lowered, 1):
+            while state and char not in goto[state]: state = fail[state]
+            state = goto[state].get(char, 0)
+            for termIndex, termLength in outputs[state]:
+                start = end - termLength
+                _, term, caseSensitive = terms[termIndex]
+                if caseSensitive and (text[start:end] != term or SkillMatcher._isNamePart(text, start, end, term)): continue
+                if start > 0 and isWordChar(term[0]) and (isWordChar(text[start - 1]) or termLength == 1 and text[start - 1] == '-'): continue
+                if end < len(text) and isWordChar(term[-1]) and (isWordChar(text[end]) or termLength == 1 and text[end] == '-'): continue
+                candidates.append((start, end, termIndex))
+
+        skillMatches, coveredEnd = [], 0
+        for start, end, termIndex in sorted(candidates, key = lambda candidate: (candidate[0], candidate[0] - candidate[1])): # leftmost, then longest
+            if start < coveredEnd: continue
+            category, term, _ = terms[termIndex]
+            skillMatches.append((start, end, category, term))
+            coveredEnd = end
+        return skillMatches
+
+    def skillExtractor(self, text):
+        """Tags a text with the skills it mentions
+           Params:
+           • text - Job-description (plain) text
+
+           Returns:
+           • skillTags - Dictionary mapping each skill category (e.g. 'fineSkills', 'coarseSkills') to the list of its distinct terms found, 
+             in order of first mention
+        """
+        skillTags = {category: [] for category in self.categories}
+        for _, _, category, term in self.skillMatchFinder(text):
+            if term not in skillTags[category]: skillTags[category].append(term)
+        return skillTags
+
+# RATE LIMITER CLASS
+class TokenBucket:
+    """Token-bucket rate limiter shared by all threads issuing requests
+    
+    • Tokens refill continuously at 'rate' per second, up to 'capacity' (the allowed burst of back-to-back requests)
+    """
+
+    def __init__(self, rate, capacity = 1):
+        """Sets up a full bucket
+           Params:
+           • rate - Number of requests allowed per second (0 = unlimited)
+           • capacity - Maximum number of tokens held, i.e. the largest burst of requests
+
+           Returns: [None]
+        """
+        self._rate = rate
+        self._capacity = max(1, capacity)
+        self._tokens = self._capacity
+        self._lastRefill = time.monotonic()
+        self._lock = Lock()
+
+    def acquire(self):
+        """Takes a token out of the bucket, waiting until one is available
+           Params: [None]
+
+           Returns:
+           • waitTime - Seconds spent waiting for the token
+        """
+        if not self._rate: return 0.0
+        waitTime = 0.0
+        while True:
+            with self._lock:
+                currentTime = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (currentTime - self._lastRefill) * self._rate)
+                self._lastRefill = currentTime
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waitTime
+                tokenWait = (1 - self._tokens) / self._rate
+            time.sleep(tokenWait)
+            waitTime += tokenWait
+
+# ADAPTIVE CONCURRENCY CONTROLLER CLASS {AIMD, like TCP congestion control, over the number of in-flight job-page fetches}
+class AdaptiveConcurrencyController:
+    """Tunes the number of in-flight job-page fetches to what the site sustains, from the responses it sends back
+
+    • Additive increase: the limit grows by 1 per round of healthy job-page responses (+1/limit per response), as long as their 
+      latency stays within 'latencyTolerance' times the baseline (the lowest latency seen, slowly drifting up)
+    • Multiplicative decrease: [403]/[429]/[503] responses and network errors cut the limit by 'backoffFactor', and a grown latency 
+      by 10%, at most once per round trip (the responses to requests sent before a cut do not cut it again)
+    • Block detection: every job page without a job-title match (likely a CAPTCHA or block page, a fast [200] that counted as healthy) 
+      cuts the limit by 'backoffFactor', each one as job pages are parsed in batches after their fetches; missing job titles across 
+      most of the last 'missWindow' pages drop the limit to its minimum and pause all fetches, for twice as long on every further block
+    • Every change of the (whole-number) limit is logged, and the history is kept for the run report
+    """
+
+    _throttleStatuses = (403, 429, 503)
+
+    def __init__(self, maxLimit, minLimit = 1, startLimit = 2, backoffFactor = 0.5, latencyTolerance = 2.0, missWindow = 10, missThreshold = 0.6, 
+                 pauseSeconds = 5, maxPauseSeconds = 120, verbose = True):
+        """Sets up the controller at its start limit
+           Params:
+           • maxLimit - Upper bound of the limit (the number of fetching threads)
+           • minLimit - Lower bound of the limit
+           • startLimit - Limit the run starts with (slow start)
+           • backoffFactor - Factor the limit is multiplied by upon a throttling response
+           • latencyTolerance - Factor by which the response latency may exceed the lowest one seen before the limit is cut
+           • missWindow - Number of latest job pages checked for missing job titles
+           • missThreshold - Fraction of those job pages without a job title taken as being blocked
+           • pauseSeconds, maxPauseSeconds - Pause of all fetches upon a first block, and its upper bound
+           • verbose - Whether changes of the limit are printed
+
+           Returns: [None]
+        """
+        self._maxLimit = max(1, maxLimit)
+        self._minLimit = max(1, min(minLimit, self._maxLimit))
+        self._limit = float(min(self._maxLimit, max(self._minLimit, startLimit)))
+        self._backoffFactor = backoffFactor
+        self._latencyTolerance = latencyTolerance
+        self._missWindow = deque(maxlen = missWindow)
+        self._missThreshold = missThreshold
+        self._pauseSeconds = pauseSeconds
+        self._maxPauseSeconds = maxPauseSeconds
+        self._verbose = verbose
+        self._condition = Condition()
+        self._inFlight = 0
+        self._slotHolder = local() # marks the threads holding a fetch slot, whose latencies are the ones tracked
+        self._latencyEWMA, self._baseLatency = None, None
+        self._lastCut, self._pauseUntil, self._blockCount = 0.0, 0.0, 0
+        self._startTime = time.monotonic()
+        self._history = deque(maxlen = 200)
+        self._stats = {'increases': 0, 'decreases': 0, 'blocks': 0, 'pauseSeconds': 0.0, 'peakLimit': int(self._limit)}
+
+    def acquire(self):
+        """Takes a fetch slot, waiting while the limit is reached or fetches are paused
+           Params: [None]
+
+           Returns:
+           • waitTime - Seconds spent waiting for the slot
+        """
+        waitStart = time.monotonic()
+        with self._condition:
+            while True:
+                pauseLeft = self._pauseUntil - time.monotonic()
+                if pauseLeft <= 0 and self._inFlight < int(self._limit): break
+                self._condition.wait(pauseLeft if pauseLeft > 0 else None)
+            self._inFlight += 1
+        self._slotHolder.held = True
+        return time.monotonic() - waitStart
+
+    def release(self):
+        """Gives a fetch slot back"""
+        self._slotHolder.held = False
+        with self._condition:
+            self._inFlight -= 1
+            self._condition.notify()
+
+    def observe(self, statusCode, seconds):
+        """Adjusts the limit to the outcome of a request (called by HTTPSessionPool for every attempt)
+           Params:
+           • statusCode - Status of the response (None after a network error)
+           • seconds - Time until the response arrived
+
+           Returns: [None]
+        """
+        with self._condition:
+            if statusCode is None or statusCode in self._throttleStatuses: 
+                self._limitCutter(self._backoffFactor, 'network error' if statusCode is None else '[{}]'.format(statusCode))
+                return
+            if statusCode != 200 or not getattr(self._slotHolder, 'held', False): return # other pages (e.g. job listings) differ in latency
+            self._latencyEWMA = seconds if self._latencyEWMA is None else 0.8 * self._latencyEWMA + 0.2 * seconds
+            self._baseLatency = self._latencyEWMA if self._baseLatency is None else min(1.01 * self._baseLatency, self._latencyEWMA) # drifts up, so a lasting slowdown is accepted
+            if self._latencyEWMA > self._latencyTolerance * self._baseLatency: 
+                self._limitCutter(0.9, 'latency {:.0f} ms vs. {:.0f} ms'.format(1000 * self._latencyEWMA, 1000 * self._baseLatency))
+            elif self._limit < self._maxLimit:
+                self._limitSetter(min(self._maxLimit, self._limit + 1 / self._limit), 'healthy')
+
+    def observeParse(self, titleMissed):
+        """Tracks the job pages without a job-title match, cutting the limit for each and pausing all fetches once most of the latest ones miss it
+           Params:
+           • titleMissed - Whether the job title of a scraped job page could not be matched
+
+           Returns: [None]
+        """
+        with self._condition:
+            if time.monotonic() < self._pauseUntil: return # pages fetched before the pause tell nothing new
+            self._missWindow.append(titleMissed)
+            if titleMissed: self._limitCutter(self._backoffFactor, 'job title missing, likely a block page', perRoundTrip = False) # pages are parsed in batches, so every one cuts
+            if len(self._missWindow) < self._missWindow.maxlen or sum(self._missWindow) < self._missThreshold * len(self._missWindow): 
+                if not titleMissed: self._blockCount = 0 # unblocked again
+                return
+            self._missWindow.clear()
+            pauseTime = min(self._maxPauseSeconds, self._pauseSeconds * 2 ** self._blockCount)
+            self._blockCount += 1
+            self._stats['blocks'] += 1
+            self._stats['pauseSeconds'] += pauseTime
+            self._pauseUntil = time.monotonic() + pauseTime
+            self._limitSetter(self._minLimit, 'job titles missing, likely blocked - pausing {} s'.format(pauseTime), force = True)
+
+    def _limitCutter(self, factor, reason, perRoundTrip = True):
+        """Cuts the limit by a factor, at most once per round trip unless told otherwise (lock must be held)"""
+        currentTime = time.monotonic()
+        if perRoundTrip and currentTime - self._lastCut < 2 * (self._latencyEWMA or 0.0): return
+        self._lastCut = currentTime
+        self._limitSetter(max(self._minLimit, self._limit * factor), reason)
+
+    def _limitSetter(self, newLimit, reason, force = False):
+        """Sets the limit, logging and recording a change of its whole-number part (lock must be held)"""
+        oldLimit, self._limit = self._limit, newLimit
+        if int(newLimit) == int(oldLimit) and not force: return
+        self._stats['increases' if newLimit > oldLimit else 'decreases'] += 1
+        self._stats['peakLimit'] = max(self._stats['peakLimit'], int(newLimit))
+        self._history.append((round(time.monotonic() - self._startTime, 3), int(newLimit), reason))
+        print('|CONCURRENCY LIMIT| {} -> {} ({})'.format(int(oldLimit), int(newLimit), reason), flush = True) if self._verbose else None
+        self._condition.notify_all()
+
+    def stats(self):
+        """Reports the current and peak limit, the numbers of increases, decreases and blocks, the seconds paused, 
+           the latency estimates and the history of limit changes as (seconds into the run, limit, reason)"""
+        with self._condition:
+            return dict(self._stats, limit = int(self._limit), pauseSeconds = round(self._stats['pauseSeconds'], 3), 
+                        latencyMs = round(1000 * self._latencyEWMA, 3) if self._latencyEWMA is not None else None, 
+                        baseLatencyMs = round(1000 * self._baseLatency, 3) if self._baseLatency is not None else None, history = list(self._history))
+
+# RUN INSTRUMENTATION CLASS
+class RunMetrics:
+    """Collects per-stage timings and counters of a scrape run, for a machine-readable end-of-run report (see report())
+
+    • Every stage (e.g. 'listingFetch', 'jobPageFetch', 'headerExtraction', 'datasetWrite') keeps its sample count, items, busy seconds, 
+      bytes, failures, cache hits and a latency histogram with fixed, roughly logarithmic bucket bounds
+    • Counters with a dotted name (e.g. 'fieldMisses.jobTitle') are grouped by their prefix in the report
+    • Thread-safe, so the fetching threads and the pipeline stages can share one object
+    """
+
+    # PRIVATE VARIABLES
+    _latencyBuckets = (0.00001, 0.00002, 0.00005, 0.0001, 0.0002, 0.0005, 0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1, 2, 5, 10, 30, 60) # upper bounds (seconds), the last bucket being unbounded
+
+    def __init__(self):
+        """Starts the run's clock with empty stages and counters
+           Params: [None]
+
+           Returns: [None]
+        """
+        self._startTime = time.perf_counter()
+        self._lock = Lock()
+        self._stages = {}
+        self._counters = {}
+
+    def recordStage(self, stageName, seconds, itemCount = 1, byteCount = 0, failed = False, cacheHit = False):
+        """Records one sample of a stage
+           Params:
+           • stageName - Name of the stage
+           • seconds - Duration of the sample
+           • itemCount - Number of items (pages, records) handled by the sample
+           • byteCount - Number of bytes transferred by the sample (not counted for cache hits)
+           • failed - Whether the sample failed
+           • cacheHit - Whether the sample was served by the response cache
+
+           Returns: [None]
+        """
+        bucketIndex = next((index for index, upperBound in enumerate(RunMetrics._latencyBuckets) if seconds <= upperBound), len(RunMetrics._latencyBuckets))
+        with self._lock:
+            stage = self._stages.get(stageName)
+            if stage is None: 
+                stage = self._stages[stageName] = {'samples': 0, 'items': 0, 'seconds': 0.0, 'maxSeconds': 0.0, 'bytes': 0, 'failures': 0, 'cacheHits': 0, 
+                                                   'histogram': [0] * (len(RunMetrics._latencyBuckets) + 1)}
+            stage['samples'] += 1
+            stage['items'] += itemCount
+            stage['seconds'] += seconds
+            stage['maxSeconds'] = max(stage['maxSeconds'], seconds)
+            stage['bytes'] += 0 if cacheHit else byteCount
+            stage['failures'] += 1 if failed else 0
+            stage['cacheHits'] += 1 if cacheHit else 0
+            stage['histogram'][bucketIndex] += 1
+
+    def addCount(self, counterName, amount = 1):
+        """Adds to a counter (e.g. 'fieldMisses.companyRating')"""
+        with self._lock: self._counters[counterName] = self._counters.get(counterName, 0) + amount
+
+    @staticmethod
+    def _bucketLabel(bucketIndex):
+        """Names a histogram bucket by its upper bound, e.g. '<=50us', '<=5ms', '<=2s' or '>60s'"""
+        if bucketIndex == len(RunMetrics._latencyBuckets): return '>{}s'.format(RunMetrics._latencyBuckets[-1])
+        upperBound = RunMetrics._latencyBuckets[bucketIndex]
+        if upperBound < 0.001: return '<={}us'.format(round(upperBound * 1000000))
+        return '<={}ms'.format(round(upperBound * 1000)) if upperBound < 1 else '<={}s'.format(upperBound)
+
+    @staticmethod
+    def _percentile(histogram, fraction, maxSeconds):
+        """Estimates a latency percentile (seconds) by interpolating linearly inside the histogram bucket holding it (capped by the largest sample)"""
+        rankNeeded, rankSeen = fraction * sum(histogram), 0
+        for bucketIndex, bucketCount in enumerate(histogram):
+            if bucketCount and rankSeen + bucketCount >= rankNeeded:
+                lowerBound = RunMetrics._latencyBuckets[bucketIndex - 1] if bucketIndex else 0.0
+                upperBound = RunMetrics._latencyBuckets[bucketIndex] if bucketIndex < len(RunMetrics._latencyBuckets) else maxSeconds
+                return min(maxSeconds, lowerBound + (upperBound - lowerBound) * (rankNeeded - rankSeen) / bucketCount)
+            rankSeen += bucketCount
+        return maxSeconds
+
+    def report(self, **extraSections):
+        """Builds the end-of-run report
+           Params:
+           • extraSections - Further sections of the report, e.g. connections = HTTPSessionPool.stats(), cache = HTTPResponseCache.stats()
+
+           Returns:
+           • Dictionary (JSON-serializable) holding the elapsed seconds, every stage's throughput and latency statistics, 
+             the counters and the extra sections
+        """
+        elapsedTime = time.perf_counter() - self._startTime
+        with self._lock: stages, counters = {stageName: dict(stage, histogram = list(stage['histogram'])) for stageName, stage in self._stages.items()}, dict(self._counters)
+
+        stageReports = {}
+        for stageName, stage in sorted(stages.items()):
+            stageReports[stageName] = {
+                'samples': stage['samples'], 'items': stage['items'], 'failures': stage['failures'], 'bytes': stage['bytes'], 
+                'busySeconds': round(stage['seconds'], 4), 
+                'itemsPerSec': round(stage['items'] / elapsedTime, 2) if elapsedTime else 0.0, # over the whole run, i.e. the stage's share of the throughput
+                'meanMs': round(1000 * stage['seconds'] / stage['samples'], 3),
+                'p50Ms': round(1000 * RunMetrics._percentile(stage['histogram'], 0.5, stage['maxSeconds']), 3), 
+                'p90Ms': round(1000 * RunMetrics._percentile(stage['histogram'], 0.9, stage['maxSeconds']), 3),
+                'p99Ms': round(1000 * RunMetrics._percentile(stage['histogram'], 0.99, stage['maxSeconds']), 3),
+                'maxMs': round(1000 * stage['maxSeconds'], 3),
+                'cacheHitRate': round(stage['cacheHits'] / stage['samples'], 3),
+                'histogram': {RunMetrics._bucketLabel(bucketIndex): bucketCount for bucketIndex, bucketCount in enumerate(stage['histogram']) if bucketCount}
+            }
+
+        counterReports = {}
+        for counterName, count in sorted(counters.items()):
+            groupName, _, memberName = counterName.partition('.')
+            if memberName: counterReports.setdefault(groupName, {})[memberName] = count
+            else: counterReports[counterName] = count
+
+        report = {'elapsedSeconds': round(elapsedTime, 3), 'stages': stageReports, 'counters': counterReports}
+        report.update(extraSections)
+        return report
+
+# POOLED HTTP SESSION HANDLER CLASS
+class HTTPSessionPool:
+    """Issues GET requests through one persistent (keep-alive) session, with retries and rate limiting
+
+    • Connections are reused across requests and threads, saving a TCP+TLS handshake per request
+    • Responses with a retryable status (429/5xx) and network errors are retried with exponential backoff and full jitter
+    """
+
+    # PRIVATE VARIABLES
+    _retryStatuses = (429, 500, 502, 503, 504)
+
+    def __init__(self, poolSize = 10, maxRetries = 4, backoffBase = 0.5, backoffCap = 30, rateLimit = 0, burst = 1, timeout = 30, concurrencyController = None):
+        """Sets up the session and its connection pool
+           Params:
+           • poolSize - Number of keep-alive connections held per host (should be >= the number of concurrent fetches)
+           • maxRetries - Number of retries of a request after a retryable status or a network error
+           • backoffBase - Backoff (seconds) of the first retry, doubled on every further retry
+           • backoffCap - Upper bound (seconds) of a single backoff
+           • rateLimit - Number of requests allowed per second across all threads (0 = unlimited)
+           • burst - Number of requests allowed back-to-back before the rate limit applies
+           • timeout - Seconds to wait for the server to connect or send data
+           • concurrencyController - AdaptiveConcurrencyController informed of the status and latency of every attempt (none if not given)
+
+           Returns: [None]
+        """
+        import requests
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections = poolSize, pool_maxsize = poolSize, max_retries = 0)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        self._session.headers.update({'Accept-Encoding': 'gzip, deflate', 'Connection': 'keep-alive'})
+        self._adapter = adapter
+        self._maxRetries = maxRetries
+        self._backoffBase = backoffBase
+        self._backoffCap = backoffCap
+        self._timeout = timeout
+        self._rateLimiter = TokenBucket(rateLimit, burst)
+        self.concurrencyController = concurrencyController
+        self._statsLock = Lock()
+        self._stats = {'requests': 0, 'retries': 0, 'failures': 0, 'rateLimitWaitSeconds': 0.0, 'backoffWaitSeconds': 0.0}
+
+    def _addStat(self, statName, amount = 1):
+        """Thread-safe increment of a connection statistic"""
+        with self._statsLock: self._stats[statName] += amount
+
+    def _backoff(self, attempt, responseObj):
+        """Computes the wait before the next retry: the server's Retry-After (if given in seconds), else a fully jittered exponential backoff
+           Params:
+           • attempt - Number of the failed attempt (0 = first attempt)
+           • responseObj - Response of the failed attempt (None after a network error)
+
+           Returns:
+           • Seconds to wait
+        """
+        retryAfter = responseObj.headers.get('Retry-After', '') if responseObj is not None else ''
+        if retryAfter.isdigit(): return min(self._backoffCap, int(retryAfter))
+        return random.uniform(0, min(self._backoffCap, self._backoffBase * 2 ** attempt))
+
+    def get(self, url, params = None, headers = None, stream = False):
+        """Performs a rate-limited GET request, retrying on retryable statuses and network errors
+           Params:
+           • url - Address for the GET request
+           • params - Query-string arguments
+           • headers - Request headers (added to the session's own)
+           • stream - Whether the body is left unread, to be read incrementally (e.g. by boundedPageReader())
+
+           Returns:
+           • responseObj - Response object of the last attempt (which may still have a retryable status once retries are exhausted)
+
+           Raises:
+           • requests.RequestException - Network error of the last attempt
+        """
+        import requests
+        for attempt in range(self._maxRetries + 1):
+            self._addStat('rateLimitWaitSeconds', self._rateLimiter.acquire())
+            self._addStat('requests')
+            responseObj, attemptStart = None, time.perf_counter()
+            try:
+                responseObj = self._session.get(url, params = params, headers = headers, timeout = self._timeout, stream = stream)
+                if self.concurrencyController is not None: self.concurrencyController.observe(responseObj.status_code, time.perf_counter() - attemptStart)
+                if responseObj.status_code not in self._retryStatuses or attempt == self._maxRetries: return responseObj
+                if stream: responseObj.close() # releases the connection of the unread body before retrying
+            except requests.RequestException:
+                if self.concurrencyController is not None: self.concurrencyController.observe(None, time.perf_counter() - attemptStart)
+                if attempt == self._maxRetries:
+                    self._addStat('failures')
+                    raise
+            backoffTime = self._backoff(attempt, responseObj)
+            self._addStat('retries')
+            self._addStat('backoffWaitSeconds', backoffTime)
+            time.sleep(backoffTime)
+
+    def stats(self):
+        """Reports connection-reuse and retry statistics for tuning the pool size and rate limit
+           Params: [None]
+
+           Returns:
+           • Dictionary holding the numbers of requests, opened connections (handshakes), handshakes saved by keep-alive, 
+             retries, failures and the seconds spent waiting on the rate limiter and on backoffs
+        """
+        connectionPools = self._adapter.poolmanager.pools
+        connectionsOpened = sum(connectionPools[poolKey].num_connections for poolKey in connectionPools.keys())
+        with self._statsLock: stats = dict(self._stats)
+        stats['connectionsOpened'] = connectionsOpened
+        stats['handshakesSaved'] = max(0, stats['requests'] - connectionsOpened)
+        stats['rateLimitWaitSeconds'] = round(stats['rateLimitWaitSeconds'], 3)
+        stats['backoffWaitSeconds'] = round(stats['backoffWaitSeconds'], 3)
+        return stats
+
+    def close(self):
+        """Closes the session and all of its pooled connections"""
+        self._session.close()
+
+# ON-DISK HTTP RESPONSE CACHE CLASS
+class HTTPResponseCache:
+    """Caches successful GET responses on disk, so that repeated and resumed runs do not download the same pages again
+
+    • Entries are keyed by the SHA-256 of the normalized URL and parameters, and bodies are stored gzip-compressed under 'bodies/'
+      (the files can be inspected with zcat, e.g. for developing the regex patterns offline)
+    • Every request type has its own time-to-live; stale entries holding an ETag/Last-Modified are revalidated with a conditional GET
+    • The total size of stored bodies is bounded, evicting the least recently used entries first (the access times of cache hits are batched 
+      and written every few seconds, before an eviction and on close(), so that hits do not wait on a disk write)
+    • Job pages read only up to their description (see boundedPageReader()) are flagged as truncated, and only serve requests that read as little
+    """
+
+    # PRIVATE VARIABLES
+    _defaultTTLs = {'location': 30 * 86400, 'listing': 6 * 3600, 'job': 3 * 86400, 'default': 86400} # seconds
+    _identityParams = {'/job-listing/details.htm': ('jobListingId',)} # volatile tracking parameters (guid, cb, pos, ...) are not part of a job page's identity
+    _accessFlushInterval = 5.0 # seconds between two writes of the batched access times
+
+    def __init__(self, cacheDir, maxBytes = 512 * 1024 * 1024, ttls = None, offline = False):
+        """Opens (or creates) the cache directory and its SQLite index
+           Params:
+           • cacheDir - Directory holding the cache
+           • maxBytes - Upper bound of the total size of the stored (compressed) bodies
+           • ttls - Dictionary overriding the time-to-live (seconds) of request types ('location', 'listing', 'job', 'default')
+           • offline - Whether cached entries are served regardless of their age, and nothing is fetched from the network
+
+           Returns: [None]
+        """
+        self._cacheDir = cacheDir
+        self._maxBytes = maxBytes
+        self._ttls = dict(HTTPResponseCache._defaultTTLs, **(ttls or {}))
+        self.offline = offline
+        os.makedirs(os.path.join(cacheDir, 'bodies'), exist_ok = True)
+        self._lock = Lock()
+        import sqlite3
+        self._index = sqlite3.connect(os.path.join(cacheDir, 'index.sqlite'), check_same_thread = False)
+        self._index.execute('CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, url TEXT, finalURL TEXT, category TEXT, encoding TEXT, '
+                            'contentType TEXT, etag TEXT, lastModified TEXT, storedAt REAL, lastAccess REAL, size INTEGER, truncated INTEGER DEFAULT 0)')
+        if 'truncated' not in [column[1] for column in self._index.execute('PRAGMA table_info(entries)')]: # index created before truncated bodies were flagged
+            self._index.execute('ALTER TABLE entries ADD COLUMN truncated INTEGER DEFAULT 0')
+        self._index.execute('CREATE INDEX IF NOT EXISTS entriesByAccess ON entries (lastAccess)')
+        self._index.commit()
+        self._stats = {'hits': 0, 'misses': 0, 'revalidated': 0, 'stored': 0, 'evicted': 0}
+        self._pendingAccesses, self._lastAccessFlush = {}, time.time() # key -> access time not yet written
+
+    @staticmethod
+    def normalizedRequest(url, params = None):
+        """Builds the canonical form of a GET request: lower-case scheme and host, parameters merged into a sorted query string, no fragment
+           Params:
+           • url - Address of the GET request
+           • params - Query-string arguments of the GET request
+
+           Returns:
+           • Normalized URL
+        """
+        urlParts = urlsplit(url)
+        queryParams = parse_qsl(urlParts.query, keep_blank_values = True) + [(str(name), str(value)) for name, value in (params or {}).items()]
+        identityParams = HTTPResponseCache._identityParams.get(urlParts.path)
+        if identityParams and any(name in identityParams for name, _ in queryParams): queryParams = [(name, value) for name, value in queryParams if name in identityParams]
+        return urlunsplit((urlParts.scheme.lower(), urlParts.netloc.lower(), urlParts.path, urlencode(sorted(queryParams)), ''))
+
+    def _bodyPath(self, key):
+        """Returns the path of an entry's compressed body (spread over 256 sub-directories)"""
+        return os.path.join(self._cacheDir, 'bodies', key[:2], key + '.html.gz')
+
+    def _cachedResponse(self, key, entry):
+        """Rebuilds a response object from a cached entry (None if its body file is missing)"""
+        try:
+            with open(self._bodyPath(key), 'rb') as bodyFile: body = gzip.decompress(bodyFile.read())
+        except (OSError, EOFError): return None
+        import requests
+        responseObj = requests.models.Response()
+        responseObj._content, responseObj.status_code, responseObj.url, responseObj.encoding = body, 200, entry[1], entry[2]
+        responseObj.headers = requests.structures.CaseInsensitiveDict({'Content-Type': entry[3] or 'text/html'})
+        responseObj.fromCache, responseObj.truncated = True, bool(entry[6])
+        return responseObj
+
+    def _store(self, key, url, category, responseObj):
+        """Writes a successful response's compressed body and index entry, then evicts entries beyond the size bound"""
+        body = gzip.compress(responseObj.content)
+        bodyPath = self._bodyPath(key)
+        os.makedirs(os.path.dirname(bodyPath), exist_ok = True)
+        with open(bodyPath + '.tmp', 'wb') as bodyFile: bodyFile.write(body)
+        os.replace(bodyPath + '.tmp', bodyPath) # atomic, so concurrent readers never see a partial body
+        currentTime = time.time()
+        with self._lock:
+            self._index.execute('INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                                (key, url, responseObj.url, category, responseObj.encoding, responseObj.headers.get('Content-Type'), 
+                                 responseObj.headers.get('ETag'), responseObj.headers.get('Last-Modified'), currentTime, currentTime, len(body), 
+                                 int(getattr(responseObj, 'truncated', False))))
+            self._pendingAccesses.pop(key, None)
+            self._accessFlusher(currentTime) # commits the entry along with the batched access times, which the eviction order relies on
+            self._stats['stored'] += 1
+            self._evict()
+
+    def _evict(self):
+        """Deletes the least recently used entries until the stored bodies fit into the size bound (index lock must be held)"""
+        totalSize = self._index.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+        if totalSize <= self._maxBytes: return
+        for key, size in self._index.execute('SELECT key, size FROM entries ORDER BY lastAccess').fetchall():
+            if totalSize <= self._maxBytes: break
+            self._index.execute('DELETE FROM entries WHERE key = ?', (key,))
+            try: os.remove(self._bodyPath(key))
+            except OSError: pass
+            totalSize -= size
+            self._stats['evicted'] += 1
+        self._index.commit()
+
+    def get(self, url, params, headers, category, requester, revalidate = False, partial = False):
+        """Serves a GET request from the cache, falling back to (or revalidating with) the given requester
+           Params:
+           • url - Address of the GET request
+           • params - Query-string arguments of the GET request
+           • headers - Request headers
+           • category - Request type deciding the time-to-live ('location', 'listing', 'job' or 'default')
+           • requester - Function (url, params, headers) performing the actual GET request
+           • revalidate - Whether an entry is revalidated with a conditional GET even while it is fresh (e.g. a posting re-checked for changes)
+           • partial - Whether a truncated entry (the beginning of the page only) will do, as the requester reads no further either
+
+           Returns:
+           • responseObj - Cached or fetched response object (None when offline and the request is not cached)
+        """
+        normalizedURL = HTTPResponseCache.normalizedRequest(url, params)
+        key = hashlib.sha256(normalizedURL.encode('utf-8')).hexdigest()
+        with self._lock:
+            entry = self._index.execute('SELECT storedAt, finalURL, encoding, contentType, etag, lastModified, truncated FROM entries WHERE key = ?', (key,)).fetchone()
+        cachedResObj = self._cachedResponse(key, entry) if entry and (partial or not entry[6]) else None # a truncated page is a miss for a full-page request
+
+        if cachedResObj is not None and (self.offline or not revalidate and time.time() - entry[0] < self._ttls.get(category, self._ttls['default'])):
+            self._touch(key, 'hits')
+            return cachedResObj
+        if self.offline: 
+            self._touch(None, 'misses')
+            return None
+
+        conditionalHeaders = dict(headers or {})
+        if cachedResObj is not None and entry[4]: conditionalHeaders['If-None-Match'] = entry[4]
+        if cachedResObj is not None and entry[5]: conditionalHeaders['If-Modified-Since'] = entry[5]
+        responseObj = requester(url, params, conditionalHeaders)
+        if responseObj.status_code == 304 and cachedResObj is not None:
+            self._touch(key, 'revalidated', refreshed = True)
+            return cachedResObj
+        self._touch(None, 'misses')
+        if responseObj.status_code == 200: self._store(key, normalizedURL, category, responseObj)
+        return responseObj
+
+    def _touch(self, key, statName, refreshed = False):
+        """Counts a lookup outcome and marks the entry as recently used (and as freshly stored after a revalidation, which is written right away)"""
+        with self._lock:
+            self._stats[statName] += 1
+            if key is None: return
+            currentTime = time.time()
+            if refreshed: 
+                self._index.execute('UPDATE entries SET lastAccess = ?, storedAt = ? WHERE key = ?', (currentTime, currentTime, key))
+                self._pendingAccesses.pop(key, None)
+                self._accessFlusher(currentTime)
+            else:
+                self._pendingAccesses[key] = currentTime
+                if currentTime - self._lastAccessFlush >= HTTPResponseCache._accessFlushInterval: self._accessFlusher(currentTime)
+
+    def _accessFlusher(self, currentTime):
+        """Writes the batched access times in one transaction, committing any other pending change along with them (index lock must be held)"""
+        if self._pendingAccesses: 
+            self._index.executemany('UPDATE entries SET lastAccess = ? WHERE key = ?', [(accessTime, key) for key, accessTime in self._pendingAccesses.items()])
+            self._pendingAccesses = {}
+        self._index.commit()
+        self._lastAccessFlush = currentTime
+
+    def cachedBodies(self, category):
+        """Iterates over the cached (complete) bodies of one request type, regardless of their age
+           Params:
+           • category - Request type of the entries ('location', 'listing', 'job' or 'default')
+
+           Yields:
+           • (url, body, encoding) - Final URL, decompressed raw body and text encoding of every cached entry
+        """
+        with self._lock:
+            entries = self._index.execute('SELECT key, finalURL, encoding FROM entries WHERE category = ? AND NOT truncated ORDER BY storedAt', (category,)).fetchall()
+        for key, finalURL, encoding in entries:
+            try:
+                with open(self._bodyPath(key), 'rb') as bodyFile: yield finalURL, gzip.decompress(bodyFile.read()), encoding
+            except (OSError, EOFError): continue
+
+    def stats(self):
+        """Reports the cache's hits, misses, revalidations (304s), stored and evicted entries, and its current size
+           Params: [None]
+
+           Returns:
+           • Dictionary of cache statistics
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'], stats['bytes'] = self._index.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries').fetchone()
+        lookups = stats['hits'] + stats['misses'] + stats['revalidated']
+        stats['hitRate'] = round((stats['hits'] + stats['revalidated']) / lookups, 3) if lookups else 0.0
+        return stats
+
+    def close(self):
+        """Writes the batched access times and closes the cache index"""
+        with self._lock: 
+            self._accessFlusher(time.time())
+            self._index.close()
+
+# RESPONSE FIXTURE RECORDER CLASS
+class FixtureRecorder:
+    """Records the responses of a run (location JSON, job-listing pages and job pages) as fixtures, to be replayed by a local server 
+       (see benchmark.py) for repeatable end-to-end measurements without the live website
+
+    • Every response is stored once, as a gzip-compressed body under 'bodies/' and a JSON line in 'manifest.jsonl' (a truncated job page, see 
+      boundedPageReader(), is stored again once a complete one is recorded, whose later manifest line takes precedence)
+    • Responses are keyed like the response cache (normalized path and query), so replayed job links match despite volatile tracking parameters, 
+      and redirects (e.g. of the job-listing base page) are kept as the key of the final page
+    """
+
+    def __init__(self, fixtureDir):
+        """Opens (or creates) the fixture directory, adding to the fixtures already recorded there
+           Params:
+           • fixtureDir - Directory holding the fixtures
+
+           Returns: [None]
+        """
+        os.makedirs(os.path.join(fixtureDir, 'bodies'), exist_ok = True)
+        self._fixtureDir = fixtureDir
+        self._lock = Lock()
+        self._recordedKeys = dict((fixture['key'], fixture.get('truncated', False)) for fixture in fixtureReader(fixtureDir)) # key -> truncated
+        self._manifestFile = open(os.path.join(fixtureDir, 'manifest.jsonl'), 'a', encoding = 'utf-8')
+        self.recordCount = 0
+
+    @staticmethod
+    def fixtureKey(url, params = None):
+        """Builds the host-independent key of a request: the path and query of its normalized URL (see HTTPResponseCache.normalizedRequest())"""
+        urlParts = urlsplit(HTTPResponseCache.normalizedRequest(url, params))
+        return urlParts.path + ('?' + urlParts.query if urlParts.query else '')
+
+    def record(self, url, params, responseObj, category):
+        """Stores a successful response as a fixture (responses already recorded are skipped, unless only truncated so far)
+           Params:
+           • url - Address of the GET request
+           • params - Query-string arguments of the GET request
+           • responseObj - Response object of the GET request
+           • category - Request type ('location', 'listing' or 'job')
+
+           Returns: [None]
+        """
+        key, truncated = FixtureRecorder.fixtureKey(url, params), getattr(responseObj, 'truncated', False)
+        with self._lock:
+            if key in self._recordedKeys and (truncated or not self._recordedKeys[key]): return
+            self._recordedKeys[key] = truncated
+        bodyPath = os.path.join('bodies', hashlib.sha256(key.encode('utf-8')).hexdigest() + ('.truncated.gz' if truncated else '.gz'))
+        with open(os.path.join(self._fixtureDir, bodyPath), 'wb') as bodyFile: bodyFile.write(gzip.compress(responseObj.content))
+        fixture = {'key': key, 'finalKey': FixtureRecorder.fixtureKey(responseObj.url), 'category': category, 'status': responseObj.status_code, 
+                   'contentType': responseObj.headers.get('Content-Type', 'text/html'), 'body': bodyPath, 'truncated': truncated}
+        with self._lock:
+            self._manifestFile.write(json.dumps(fixture) + '\n')
+            self._manifestFile.flush()
+            self.recordCount += 1
+
+    def close(self):
+        """Closes the fixture manifest"""
+        with self._lock: self._manifestFile.close()
+
+def fixtureReader(fixtureDir):
+    """Reads the manifest of a fixture directory recorded by FixtureRecorder
+
+        Params: 
+        • fixtureDir - Directory holding the fixtures
+
+        Returns:
+        • List of fixture dictionaries (key, finalKey, category, status, contentType, body path relative to fixtureDir, truncated), empty if none are recorded
+    """
+    manifestPath = os.path.join(fixtureDir, 'manifest.jsonl')
+    if not os.path.exists(manifestPath): return []
+    with open(manifestPath, encoding = 'utf-8') as manifestFile: return [json.loads(line) for line in manifestFile if line.strip()]
+
+# STREAMING DATASET WRITER CLASS
+class DatasetWriter:
+    """Writes scraped job records to disk as soon as they are extracted, so memory use stays flat and partial runs still leave usable data
+
+    • Supported formats: JSONL (one JSON object per line), CSV (header row from the first record) and Parquet (requires pyarrow)
+    • Records are flushed (and fsync-ed) every 'flushEvery' records; Parquet records are buffered and written as one row group per flush
+    • The Parquet schema is declared once, from the fields of the first row group, and every value is converted to it, so row groups holding 
+      only None descriptions, empty skill lists or numeric ratings still match
+    """
+
+    # PRIVATE VARIABLES
+    _formats = ('jsonl', 'csv', 'parquet')
+    _parquetTypes = {'companyRating': 'string', 'jobPostingTimeDiff': 'int64', 'fineSkills': 'list', 'coarseSkills': 'list'} # other fields: 'list' if list-valued, else 'string'
+
+    def __init__(self, path, fileFormat = None, flushEvery = 30, fsync = True, append = False):
+        """Opens the output file
+           Params:
+           • path - Path of the output file
+           • fileFormat - One of 'jsonl', 'csv' or 'parquet' (inferred from the file extension if not given)
+           • flushEvery - Number of records written between two flushes to disk
+           • fsync - Whether every flush is also forced from the OS buffers onto the disk
+           • append - Whether records are appended to an existing JSONL/CSV file (e.g. for resumed runs) instead of overwriting it
+
+           Returns: [None]
+        """
+        self.fileFormat = fileFormat or os.path.splitext(path)[1].lstrip('.').lower()
+        if self.fileFormat not in DatasetWriter._formats: raise ValueError('Unsupported dataset format "{}" (expected one of: {})'.format(self.fileFormat, ', '.join(DatasetWriter._formats)))
+        if self.fileFormat == 'parquet' and append: raise ValueError('Parquet datasets cannot be appended to')
+        self._path = path
+        self._flushEvery = max(1, flushEvery)
+        self._fsync = fsync
+        self._pendingRecords = 0
+        self._lock = Lock()
+        self.recordCount = 0
+
+        if self.fileFormat == 'parquet':
+            import pyarrow.parquet # optional dependency, only needed for Parquet output
+            self._parquet, self._parquetWriter, self._rowBuffer, self._droppedFields = pyarrow.parquet, None, [], set()
+        else:
+            hasContent = append and os.path.exists(path) and os.path.getsize(path) > 0
+            self._fileHandler = open(path, 'a' if append else 'w', encoding = 'utf-8', newline = '')
+            self._csvWriter, self._csvHeaderWritten = None, hasContent
+
+    @staticmethod
+    def _flatValue(value):
+        """Converts list-valued fields (e.g. skills) into a single CSV cell"""
+        return ';'.join(str(item) for item in value) if isinstance(value, (list, tuple)) else value
+
+    def write(self, record):
+        """Writes a single job record (a dictionary of header values)
+           Params:
+           • record - Job record to be written
+
+           Returns: [None]
+        """
+        with self._lock:
+            if self.fileFormat == 'jsonl':
+                self._fileHandler.write(json.dumps(record, ensure_ascii = False) + '\n')
+            elif self.fileFormat == 'csv':
+                if self._csvWriter is None:
+                    self._csvWriter = csv.DictWriter(self._fileHandler, fieldnames = list(record), extrasaction = 'ignore')
+                    if not self._csvHeaderWritten: self._csvWriter.writeheader()
+                self._csvWriter.writerow({fieldName: self._flatValue(value) for fieldName, value in record.items()})
+            else:
+                self._rowBuffer.append(record)
+            self.recordCount += 1
+            self._pendingRecords += 1
+            if self._pendingRecords >= self._flushEvery: self._flush()
+
+    def writeMany(self, records):
+        """Writes several job records, e.g. all records scraped from a job-listing page"""
+        for record in records: self.write(record)
+
+    def _parquetSchemaBuilder(self):
+        """Declares the Parquet schema from the fields of the buffered records: text (e.g. companyRating's '4.1' and -1), whole numbers or lists of text"""
+        import pyarrow
+        arrowTypes, fieldTypes = {'string': pyarrow.string(), 'int64': pyarrow.int64(), 'list': pyarrow.list_(pyarrow.string())}, {}
+        for record in self._rowBuffer:
+            for fieldName, value in record.items():
+                if fieldName in DatasetWriter._parquetTypes: fieldTypes[fieldName] = DatasetWriter._parquetTypes[fieldName]
+                elif isinstance(value, (list, tuple)): fieldTypes[fieldName] = 'list'
+                else: fieldTypes.setdefault(fieldName, 'string')
+        return pyarrow.schema([(fieldName, arrowTypes[fieldType]) for fieldName, fieldType in fieldTypes.items()])
+
+    @staticmethod
+    def _parquetValue(value, arrowType):
+        """Converts a field value to the type of its Parquet column (None stays None)"""
+        if value is None: return None
+        if str(arrowType).startswith('list'): return [str(item) for item in value] if isinstance(value, (list, tuple)) else [str(value)]
+        if str(arrowType) == 'int64': return int(value)
+        return str(value)
+
+    def _parquetColumns(self, schema):
+        """Turns the buffered records into columns of the declared schema, dropping (with a warning) fields the schema does not hold"""
+        for record in self._rowBuffer:
+            for fieldName in record:
+                if fieldName in schema.names or fieldName in self._droppedFields: continue
+                self._droppedFields.add(fieldName)
+                print('<WARNING> Field "{}" is not part of the Parquet schema declared by the first row group, dropping it'.format(fieldName), flush = True)
+        return {schemaField.name: [DatasetWriter._parquetValue(record.get(schemaField.name), schemaField.type) for record in self._rowBuffer] for schemaField in schema}
+
+    def _flush(self):
+        """Pushes the pending records onto the disk (lock must be held)"""
+        if self.fileFormat == 'parquet':
+            if self._rowBuffer:
+                import pyarrow
+                if self._parquetWriter is None: self._parquetWriter = self._parquet.ParquetWriter(self._path, self._parquetSchemaBuilder())
+                self._parquetWriter.write_table(pyarrow.Table.from_pydict(self._parquetColumns(self._parquetWriter.schema), schema = self._parquetWriter.schema))
+                self._rowBuffer = []
+        else:
+            self._fileHandler.flush()
+            if self._fsync: os.fsync(self._fileHandler.fileno())
+        self._pendingRecords = 0
+
+    def flush(self):
+        """Pushes all pending records onto the disk
            Params: [None]
-    
-           Returns: [None]   
+
+           Returns: [None]
         """
-        self.patternBase = {
-            # Applied separately using jobLinkExtractor()
-            'jobLink' : re.compile(r'v><a href=(?:\'|")/partner/jobListing([.?=&_0-9a-zA-Z]+)(?:\'|")'), 
-            # Applied separately using logoLinkExtractor()
-            'logoLink' : re.compile(r'(?:https?://media\.glassdoor\.[a-zA-Z.-]+/sqls/[0-9]+/[a-zA-Z0-9-]+\.png|defLogo)'),
-            # Applied collectively on job-pages accessible via extracted job-links [Header Information]
-            'jobTitle' : re.compile(r'(?:\'|")jobTitle(?:\'|"):(?:\'|")([\d\w\sÀ-ÿ.,&\)\(\]\[\{\};:\\/#!—–-]+)(?:\'|")'), 
-            'companyRating' : re.compile(r'(?:\'|")ratingNum(?:\'|")>([\d.]+)<'), 
-            'jobLocation' : re.compile(r'(?:\'|")loc(?:\'|"):(?:\'|")([\d\w\sÀ-ÿ.,&\)\(\]\[\{\};:\\/#!—–-]+)(?:\'|")'),   
-            'jobPostingDate' : re.compile(r'(?:\'|")datePosted(?:\'|")\svalue=(?:\'|")([0-9-]+)\s'),
-            'companyName' : re.compile(r'(?:\'|")employerName(?:\'|"):(?:\'|")([\d\w\sÀ-ÿ.,&\)\(\]\[\{\};:\\/#!—–-]+)(?:\'|")'), 
-            'companyNameAlt' : re.compile(r'(?:\'|")companyName(?:\'|")>([\d\w\sÀ-ÿ.,&\)\(\]\[\{\};:\\/#!—–-]+)<')          
-        }                
+        with self._lock: self._flush()
+
+    def close(self):
+        """Flushes the pending records and closes the output file
+           Params: [None]
+
+           Returns: [None]
+        """
+        with self._lock:
+            self._flush()
+            if self.fileFormat == 'parquet':
+                if self._parquetWriter is not None: self._parquetWriter.close()
+            else:
+                self._fileHandler.close()
+
+# SCRAPE CHECKPOINT AND SEEN-INDEX CLASS
+class ScrapeCheckpoint:
+    """Records the progress of a scrape run in a SQLite file, so that an interrupted run can be resumed where it stopped
+
+    • The last completed job-listing page and the job-listing base URL are stored for the searched job position and location
+    • A seen index of job-listing IDs lets resumed (and repeated) runs skip job pages that were already fetched
+    • A page whose job pages partly failed (e.g. [403] or throttled) is not completed, so a resumed run starts over from it and fetches only the failed ones
+    • Without a file path, the index only lives in memory, still dropping duplicate postings within the run
+    """
+
+    def __init__(self, path = None):
+        """Opens (or creates) the checkpoint file
+           Params:
+           • path - Path of the checkpoint file (in-memory index if not given)
+
+           Returns: [None]
+        """
+        self._lock = Lock()
+        self.path = path
+        import sqlite3
+        self._index = sqlite3.connect(path or ':memory:', check_same_thread = False)
+        self._index.execute('CREATE TABLE IF NOT EXISTS state (name TEXT PRIMARY KEY, value TEXT)')
+        self._index.execute('CREATE TABLE IF NOT EXISTS seen (jobListingId TEXT PRIMARY KEY)')
+        self._index.commit()
+        self.duplicatesSkipped = 0
+
+    def _state(self):
+        """Returns the stored progress as a dictionary (lock must be held)"""
+        return dict(self._index.execute('SELECT name, value FROM state').fetchall())
+
+    def resumePoint(self, title, loc):
+        """Looks up where a previous run for the same search stopped; a checkpoint of a different search is discarded
+           Params:
+           • title - Job position searched
+           • loc - Job location searched
+
+           Returns:
+           • (lastCompletedPage, baseJobListPgURL) of the previous run, None if there is nothing to resume
+        """
+        with self._lock:
+            state = self._state()
+            if state and (state.get('title'), state.get('loc')) != (title, loc):
+                print('<WARNING> Checkpoint belongs to another search ({}, {}), starting over'.format(state.get('title'), state.get('loc')), flush = True)
+                self._index.execute('DELETE FROM state')
+                self._index.execute('DELETE FROM seen')
+                self._index.commit()
+                return None
+            if 'lastCompletedPage' not in state: return None
+            return int(state['lastCompletedPage']), state['baseJobListPgURL']
+
+    def isSeen(self, jobListingId):
+        """Checks whether the job page of a job-listing ID was already fetched by a completed page"""
+        with self._lock: return self._index.execute('SELECT 1 FROM seen WHERE jobListingId = ?', (jobListingId,)).fetchone() is not None
+
+    def markPageComplete(self, title, loc, pageNumber, baseJobListPgURL, jobListingIds):
+        """Records the progress of a search together with the job-listing IDs settled by its latest job-listing page, in one transaction
+           Params:
+           • title - Job position searched
+           • loc - Job location searched
+           • pageNumber - Number of the last completed job-listing page, up to which no page holds a failed job page (0 = none)
+           • baseJobListPgURL - Job-listing base URL of the search
+           • jobListingIds - IDs of the job pages settled for the latest page (scraped, or gone for good), leaving out failed ones
+
+           Returns: [None]
+        """
+        with self._lock:
+            self._index.executemany('INSERT OR REPLACE INTO state VALUES (?, ?)', 
+                                    [('title', title), ('loc', loc), ('lastCompletedPage', str(pageNumber)), ('baseJobListPgURL', baseJobListPgURL)])
+            self._index.executemany('INSERT OR IGNORE INTO seen VALUES (?)', [(jobListingId,) for jobListingId in jobListingIds])
+            self._index.commit()
+
+    def stats(self):
+        """Reports the last completed page, the size of the seen index and the number of duplicate job links skipped in this run"""
+        with self._lock:
+            return {'lastCompletedPage': int(self._state().get('lastCompletedPage', 0)), 
+                    'seenJobListings': self._index.execute('SELECT COUNT(*) FROM seen').fetchone()[0],
+                    'duplicatesSkipped': self.duplicatesSkipped}
+
+    def close(self):
+        """Closes the checkpoint file"""
+        with self._lock: self._index.close()
+
+# POSTING INDEX CLASS {Incremental runs: only new postings and a sample of known ones are fetched again}
+class PostingIndex:
+    """Keeps the job records of earlier runs in a SQLite file, keyed by job-listing ID, so that a recurring run of the same searches 
+       only fetches its job-listing pages and the job pages of new postings, plus a random sample of known postings re-checked for changes
+
+    • Every record is stored with a hash of its content (the fields that do not depend on the run date or tracking parameters), 
+      which tells changed postings apart from unchanged ones
+    • The postings found by every search are kept, so that postings missing from a run that reached the end of the listing are reported as removed
+    • Known postings are served from the index with their posting age brought up to the run date
+    • The change counts in 'stats' are per search, i.e. a posting found by two searches is counted twice
+    """
+
+    _volatileFields = ('jobPostingTimeDiff', 'companyLogoURL', 'jobURL', 'changeStatus', 'searchTitle', 'searchLocation') # left out of the content hash
+
+    def __init__(self, path, recheckRate = 0.1):
+        """Opens (or creates) the posting index
+           Params:
+           • path - Path of the index file
+           • recheckRate - Fraction of the known postings whose job pages are fetched again, to detect changed postings
+
+           Returns: [None]
+        """
+        self._lock = Lock()
+        self._recheckRate = recheckRate
+        import sqlite3
+        self._index = sqlite3.connect(path, check_same_thread = False)
+        self._index.execute('CREATE TABLE IF NOT EXISTS postings (jobListingId TEXT PRIMARY KEY, record TEXT, contentHash TEXT, postingDate TEXT, firstSeen TEXT, lastChecked TEXT)')
+        self._index.execute('CREATE TABLE IF NOT EXISTS searchPostings (title TEXT, loc TEXT, jobListingId TEXT, PRIMARY KEY (title, loc, jobListingId))')
+        self._index.commit()
+        self._runStatuses = {} # jobListingId -> change status in this run
+        self._presentIds = {} # (title, loc) -> job-listing IDs found by the search in this run
+        self.stats = {'added': 0, 'changed': 0, 'unchanged': 0, 'removed': 0, 'rechecked': 0, 'jobPagesSkipped': 0}
+
+    @staticmethod
+    def contentHash(jobRecord):
+        """Hashes the content of a job record, leaving out the fields that change without the posting changing"""
+        content = {fieldName: fieldValue for fieldName, fieldValue in jobRecord.items() if fieldName not in PostingIndex._volatileFields}
+        return hashlib.sha256(json.dumps(content, sort_keys = True).encode('utf-8')).hexdigest()
+
+    def knownRecord(self, jobListingId, doc):
+        """Looks up the stored record of a posting
+           Params:
+           • jobListingId - Job-listing ID of the posting
+           • doc - Date on client's side, the stored posting age is brought up to
+
+           Returns:
+           • Stored job record (None if the posting is not known)
+        """
+        with self._lock: row = self._index.execute('SELECT record, postingDate FROM postings WHERE jobListingId = ?', (jobListingId,)).fetchone()
+        if row is None: return None
+        jobRecord = json.loads(row[0])
+        if row[1]: jobRecord['jobPostingTimeDiff'] = (doc - datetime.strptime(row[1], JobURLUtil.getJobPostingDateFormat())).days
+        return jobRecord
+
+    def recheckSampled(self):
+        """Draws whether the job page of a known posting is fetched again"""
+        rechecked = random.random() < self._recheckRate
+        with self._lock: self.stats['rechecked' if rechecked else 'jobPagesSkipped'] += 1
+        return rechecked
+
+    def recordPosting(self, title, loc, jobListingId, jobRecord, doc):
+        """Stores the freshly scraped record of a posting found by a search, comparing it with the stored one
+           Params:
+           • title, loc - Search the posting was found by
+           • jobListingId - Job-listing ID of the posting
+           • jobRecord - Job record scraped from the posting's job page
+           • doc - Date on client's side, the posting age is counted from
+
+           Returns:
+           • Change status of the posting ('added', 'changed' or 'unchanged')
+        """
+        contentHash, checkDate = PostingIndex.contentHash(jobRecord), doc.strftime(JobURLUtil.getJobPostingDateFormat())
+        postingDate = (doc - timedelta(days = jobRecord['jobPostingTimeDiff'])).strftime(JobURLUtil.getJobPostingDateFormat())
+        storedRecord = {fieldName: fieldValue for fieldName, fieldValue in jobRecord.items() if fieldName not in ('changeStatus', 'searchTitle', 'searchLocation')}
+        with self._lock:
+            row = self._index.execute('SELECT contentHash, firstSeen FROM postings WHERE jobListingId = ?', (jobListingId,)).fetchone()
+            changeStatus = self._runStatuses.get(jobListingId) or ('added' if row is None else 'unchanged' if row[0] == contentHash else 'changed')
+            self._index.execute('INSERT OR REPLACE INTO postings VALUES (?, ?, ?, ?, ?, ?)', 
+                                (jobListingId, json.dumps(storedRecord), contentHash, postingDate, row[1] if row else checkDate, checkDate))
+            self._index.commit()
+            return self._statusRecorder(title, loc, jobListingId, changeStatus)
+
+    def markPresent(self, title, loc, jobListingId):
+        """Records a posting found by a search without its job page being scraped again (e.g. served from the index)
+           Params:
+           • title, loc - Search the posting was found by
+           • jobListingId - Job-listing ID of the posting
+
+           Returns:
+           • Change status of the posting (the one it got earlier in the run, else 'unchanged')
+        """
+        with self._lock: return self._statusRecorder(title, loc, jobListingId, self._runStatuses.get(jobListingId, 'unchanged'))
+
+    def _statusRecorder(self, title, loc, jobListingId, changeStatus):
+        """Counts the change status of a posting and adds it to the search's postings (lock must be held)"""
+        presentIds = self._presentIds.setdefault((title, loc), set())
+        if jobListingId not in presentIds: self.stats[changeStatus] += 1
+        presentIds.add(jobListingId)
+        self._runStatuses[jobListingId] = changeStatus
+        self._index.execute('INSERT OR IGNORE INTO searchPostings VALUES (?, ?, ?)', (title, loc, jobListingId))
+        self._index.commit()
+        return changeStatus
+
+    def removedPostings(self, title, loc, doc):
+        """Closes a completed run of a search, dropping the postings it found in earlier runs but not in this one
+           Params:
+           • title, loc - Search whose run is completed
+           • doc - Date on client's side, the posting age of the removed records is brought up to
+
+           Returns:
+           • List of the last stored records of the removed postings
+        """
+        with self._lock:
+            presentIds = self._presentIds.pop((title, loc), set())
+            removedIds = [jobListingId for (jobListingId,) in self._index.execute('SELECT jobListingId FROM searchPostings WHERE title = ? AND loc = ?', (title, loc)) 
+                          if jobListingId not in presentIds]
+            self._index.executemany('DELETE FROM searchPostings WHERE title = ? AND loc = ? AND jobListingId = ?', [(title, loc, jobListingId) for jobListingId in removedIds])
+            self._index.commit()
+            self.stats['removed'] += len(removedIds)
+        return [jobRecord for jobRecord in (self.knownRecord(jobListingId, doc) for jobListingId in removedIds) if jobRecord is not None]
+
+    def close(self):
+        """Closes the index file"""
+        with self._lock: self._index.close()
 
 # JOB-PAGES URL HANDLER CLASS
 class JobURLUtil:
@@ -79,14 +1587,33 @@ class JobURLUtil:
 
     # PRIVATE VARIABLES
     _dateFormat = '%Y-%m-%d' 
+    _siteRoot = 'https://www.glassdoor.co.in' # Overridable for local stub servers (see benchmark.py)
+    _locationMemo = {} # (siteRoot, loc) -> (locId, locT), shared by all instances of the process
+    _locationMemoLock = Lock()
+    _requestStages = {'location': 'locationLookup', 'listing': 'listingFetch', 'job': 'jobPageFetch'} # cache category -> instrumented stage name
+    _goneStatuses = (404, 410) # pages removed for good, which are not worth requesting again (e.g. by a resumed run)
     
-    def __init__(self, title, loc, doc):
+    def __init__(self, title, loc, doc, maxWorkers = 1, perHostLimit = 4, httpPool = None, responseCache = None, parseWorkers = 0, parseExecutor = None, sharedJobRecords = None, 
+                 streamPages = False, runMetrics = None, fixtureRecorder = None, postingIndex = None):
         """Initially sets up thebasic instance functionality and info such as the user's location and job/profession title
         
            Params:
            • title - Profession/Job title to be searched, given the user
            • loc - Abstract Location Information based on which the jobs will be searched, given the user
            • doc - Date on client's side 
+           • maxWorkers - Number of job pages fetched concurrently (1 = sequential fetching)
+           • perHostLimit - Maximum number of in-flight requests to any single host
+           • httpPool - HTTPSessionPool through which all requests are made (a pool sized for maxWorkers is created if not given)
+           • responseCache - HTTPResponseCache serving repeated requests from disk (no caching if not given)
+           • parseWorkers - Number of processes scraping the fetched job pages (0 = scrape in the fetching thread)
+           • parseExecutor - Process pool (see parseExecutorCreator()) shared with other instances, used instead of creating one
+           • sharedJobRecords - Dictionary of scraped header values by job-listing ID, shared with other instances so that 
+             a job page found by several searches is fetched only once
+           • streamPages - Whether job pages are read incrementally, leaving the rest of a page unread once its header information and description are read
+           • runMetrics - RunMetrics receiving the instance's stage timings and counters, e.g. shared with other instances (created if not given)
+           • fixtureRecorder - FixtureRecorder saving every successful response as a replayable fixture (nothing is recorded if not given)
+           • postingIndex - PostingIndex of earlier runs, for an incremental run that only fetches the job pages of new and re-checked postings 
+             and tags every record with its change status (every job page is fetched if not given)
     
            Returns: [None]   
         """
@@ -94,18 +1621,40 @@ class JobURLUtil:
         # User Input Preference Storage
         self._title = title
         self._loc = loc
-        if doc == 'SERVER_TIMING': self._doc = datetime.strptime(datetime.today().strftime(JobURLUtil.getJobPostingDateFormat()), JobURLUtil.getJobPostingDateFormat()) 
-        else: self._doc = datetime.strptime(doc, JobURLUtil.getJobPostingDateFormat())
+        self._doc = JobURLUtil.clientDateParser(doc)
         
         # URLs and Header Initialization
         self._standardHeaders = {'User-Agent': 'Mozilla/5.0 (Windows NT 6.1; WOW64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/56.0.2924.76 Safari/537.36'} # mimicking browser request
-        self._locReqURL = 'https://www.glassdoor.co.in/util/ajax/findLocationsByFullText.htm'
-        self._listPgBaseReqURL = 'https://www.glassdoor.co.in/Job/jobs.htm'
+        self._locReqURL = '{}/util/ajax/findLocationsByFullText.htm'.format(self._siteRoot)
+        self._listPgBaseReqURL = '{}/Job/jobs.htm'.format(self._siteRoot)
+
+        # Concurrent Fetching Initialization (executor is created on first use)
+        self._maxWorkers = max(1, maxWorkers)
+        self._perHostLimit = max(1, perHostLimit)
+        self._fetchExecutor = None
+        self._hostSlots = {}
+        self._hostSlotsLock = Lock()
+        self._ownsHTTPPool = httpPool is None # a shared pool is closed by its owner
+        self._httpPool = httpPool if httpPool is not None else HTTPSessionPool(poolSize = max(10, self._maxWorkers))
+        self._responseCache = responseCache
+        self._sharedJobRecords = sharedJobRecords
+        self._streamPages = streamPages
+        self.runMetrics = runMetrics if runMetrics is not None else RunMetrics()
+        self._fixtureRecorder = fixtureRecorder
+        self._postingIndex = postingIndex
+        self._listingIncomplete = False # set once job-listing pages are skipped (fetch failure, resumed run), as missing postings are then not known to be removed
+        self._listingExhausted = False # set once a job-listing page without job links is reached, i.e. every posting of the search was listed
+
+        # Parallel Parsing Initialization (process pool is created on first use)
+        self._parseWorkers = max(0, parseWorkers)
+        self._ownsParseExecutor = parseExecutor is None
+        self._parseExecutor = parseExecutor
         
         # Company and Job-related Resource and Regex-Pattern Initialization/Compilation
         self._scraper = ScraperLogic()
 
         # GD-Formatted Location Information Extraction Initialization  
+        self._locId, self._locT = None, None
         self._locationInfoExtractor()
 
     @staticmethod
@@ -120,6 +1669,19 @@ class JobURLUtil:
         """
         return JobURLUtil._dateFormat
 
+    @staticmethod
+    def clientDateParser(doc):
+        """Converts the date on client's side into the datetime that job-posting time differences are computed against
+        
+           Params:
+           • doc - Date on client's side, in the job-posting date format, or 'SERVER_TIMING' for today's date
+    
+           Returns: 
+           • Datetime of the date (at midnight)
+        """
+        if doc == 'SERVER_TIMING': return datetime.strptime(datetime.today().strftime(JobURLUtil.getJobPostingDateFormat()), JobURLUtil.getJobPostingDateFormat()) 
+        return datetime.strptime(doc, JobURLUtil.getJobPostingDateFormat())
+
     def _setLocInfo(self, locId, locT):
         """Set the user's location and job/profession title, as found by the location GET request
            Helper Method For: _locationInfoExtractor()
@@ -146,7 +1708,7 @@ class JobURLUtil:
 
         self._baseJobListPgURL = baseJobListPgURL # Main Base URL for finding Job Links
 
-    def _GETRequester(self, url, parameters, headers, requestType):
+    def _GETRequester(self, url, parameters, headers, requestType, cacheCategory = 'default', revalidate = False):
         """Perform a specfic contextual type of GET Request with typical error handling
         
            Params:
@@ -154,43 +1716,170 @@ class JobURLUtil:
            • parameters - Assumed GD's-format query-string arguments
            • headers - Headers, usually specifying info such as mimicking a browser request to avoid [403] errors
            • requestType - Context type of the GET request 
+           • cacheCategory - Request type deciding how long the response stays fresh in the response cache ('location', 'listing', 'job')
+           • revalidate - Whether a cached response is revalidated with the server even while it is fresh
 
            Returns:
-           • responseObj - Response object created from the GET request    
+           • responseObj - Response object created from the GET request (False if the request failed, None if the page is gone for good)
         """
 
+        import requests # already loaded by the HTTP session pool
+        requester = self._boundedGETRequester if self._streamPages and cacheCategory == 'job' else self._httpPool.get
+        stageName, stageStart = JobURLUtil._requestStages.get(cacheCategory, 'otherFetch'), time.perf_counter()
         try:
-            responseObj = requests.get(url, params=parameters, headers=headers)
-        except:
-            print('<ERROR> Unable to make {} GET request'.format(requestType))
-            exit(0)
-        if responseObj.status_code != 200: return False
+            if self._responseCache is None: responseObj = requester(url, parameters, headers)
+            else: responseObj = self._responseCache.get(url, parameters, headers, cacheCategory, requester, revalidate, requester == self._boundedGETRequester)
+        except requests.RequestException as error:
+            self.runMetrics.recordStage(stageName, time.perf_counter() - stageStart, failed = True)
+            print('<ERROR> Unable to make {} GET request\n......> <Further Info> {}'.format(requestType, error), flush = True)
+            return False # Retries are exhausted, but the rest of the run goes on
+        if responseObj is None:
+            self.runMetrics.recordStage(stageName, time.perf_counter() - stageStart, failed = True)
+            print('<ERROR> No cached response for {} GET request in offline mode\n......> <URL> {}'.format(requestType, url), flush = True)
+            return False
+        fetched = responseObj.status_code == 200
+        self.runMetrics.recordStage(stageName, time.perf_counter() - stageStart, byteCount = len(responseObj.content) if fetched else 0, 
+                                    failed = not fetched, cacheHit = getattr(responseObj, 'fromCache', False))
+        if not fetched: 
+            self.runMetrics.addCount('httpStatuses.{}'.format(responseObj.status_code))
+            return None if responseObj.status_code in JobURLUtil._goneStatuses else False
+        if self._fixtureRecorder is not None: self._fixtureRecorder.record(url, parameters, responseObj, cacheCategory)
+        return responseObj
+
+    def _boundedGETRequester(self, url, parameters, headers):
+        """Performs a streamed GET request for a job page, reading the page only up to the end of its header information and job description
+           Helper Method For: _GETRequester()
+
+           Params:
+           • url - Address for the GET request
+           • parameters - Query-string arguments
+           • headers - Request headers
+
+           Returns:
+           • responseObj - Response object holding the part of the page read (see boundedPageReader())
+        """
+        responseObj = self._httpPool.get(url, parameters, headers, stream = True)
+        if responseObj.status_code == 200: return boundedPageReader(self._scraper, responseObj)
+        responseObj.close()
         return responseObj
+
+    def cacheStats(self):
+        """Returns the response cache's statistics (see HTTPResponseCache.stats()), or None if no cache is used"""
+        return self._responseCache.stats() if self._responseCache is not None else None
+
+    def connectionStats(self):
+        """Returns the HTTP session pool's connection-reuse, retry and rate-limiting statistics (see HTTPSessionPool.stats())"""
+        return self._httpPool.stats()
+
+    def close(self):
+        """Releases the instance's fetching threads, parse-worker processes and pooled connections (unless shared with other instances)
+           Params: [None]
+
+           Returns: [None]
+        """
+        if self._fetchExecutor is not None: self._fetchExecutor.shutdown()
+        if self._parseExecutor is not None and self._ownsParseExecutor: self._parseExecutor.shutdown()
+        if self._ownsHTTPPool: self._httpPool.close() # the response cache is always closed by its owner
+
+    def _hostSlot(self, url):
+        """Returns the semaphore capping the number of in-flight requests to the URL's host
+           Helper Method For: _concurrentGETRequester()
+
+           Params:
+           • url - Address whose host is to be throttled
+
+           Returns:
+           • Bounded semaphore shared by all requests to the same host
+        """
+
+        host = urlsplit(url).netloc
+        with self._hostSlotsLock:
+            if host not in self._hostSlots: self._hostSlots[host] = BoundedSemaphore(self._perHostLimit)
+            return self._hostSlots[host]
+
+    def _hostLimitedGETRequester(self, url, requestType, revalidate = False):
+        """Performs a GET request once a slot for the URL's host (and of the HTTP pool's adaptive concurrency controller, if any) is available
+           Helper Method For: _concurrentGETRequester()
+
+           Params:
+           • url - Address for the GET request
+           • requestType - Context type of the GET request
+           • revalidate - Whether a cached response is revalidated with the server even while it is fresh
+
+           Returns:
+           • responseObj - Response object created from the GET request (False on a non-200 response)
+        """
+
+        concurrencyController = self._httpPool.concurrencyController
+        if concurrencyController is not None: self.runMetrics.recordStage('concurrencyWait', concurrencyController.acquire())
+        try:
+            slotWaitStart, hostSlot = time.perf_counter(), self._hostSlot(url)
+            with hostSlot:
+                self.runMetrics.recordStage('hostSlotWait', time.perf_counter() - slotWaitStart)
+                return self._GETRequester(url, {}, self._standardHeaders, requestType, 'job', revalidate)
+        finally:
+            if concurrencyController is not None: concurrencyController.release()
+
+    def _concurrentGETRequester(self, urls, requestType, revalidateURLs = ()):
+        """Performs GET requests for several pages concurrently, keeping the order of the given URLs
+           Falls back to one-after-another fetching when the instance is set up with a single worker
+
+           Params:
+           • urls - Addresses for the GET requests
+           • requestType - Context type of the GET requests
+           • revalidateURLs - Addresses whose cached responses are revalidated with the server even while they are fresh
+
+           Returns:
+           • List of response objects (False for failed requests), in the same order as 'urls'
+        """
+
+        if self._maxWorkers == 1 or len(urls) < 2:
+            if self._httpPool.concurrencyController is not None: return [self._hostLimitedGETRequester(url, requestType, url in revalidateURLs) for url in urls] # pauses still apply
+            return [self._GETRequester(url, {}, self._standardHeaders, requestType, 'job', url in revalidateURLs) for url in urls]
+        if self._fetchExecutor is None: 
+            from concurrent.futures import ThreadPoolExecutor
+            self._fetchExecutor = ThreadPoolExecutor(max_workers = self._maxWorkers)
+        return list(self._fetchExecutor.map(lambda url: self._hostLimitedGETRequester(url, requestType, url in revalidateURLs), urls)) # map() yields results in submission order
     
     def _locationInfoExtractor(self): 
         """Extracts GD's required location parameters for assistance in building up the job-listing page GET request  
            (GD requires location type (locT) and location id (locId) for successful request build-up for job-list page)
+           Location strings already looked up in this process are served from a memo, without any request
 
            Params: [None]
     
            Returns:
-           • Response object containing the GD-format location information
+           • Response object containing the GD-format location information (the memoized (locId, locT) tuple for a known location string, 
+             False if the location could not be looked up or matches no location)
+
+           Raises:
+           • ValueError, KeyError - Location response that is not JSON, or lacks the expected fields
         """
 
+        memoKey = (self._siteRoot, self._loc)
+        with JobURLUtil._locationMemoLock: memoizedLocInfo = JobURLUtil._locationMemo.get(memoKey)
+        if memoizedLocInfo is not None:
+            self._setLocInfo(*memoizedLocInfo)
+            return memoizedLocInfo
+
         locReqParams = {
             'locationSearchString' : self._loc.replace(' ', '+'),
             'allowPostalCodes' : 'true'
         }            
 
 
-        resObj =  self._GETRequester(self._locReqURL, locReqParams, self._standardHeaders, 'location')
+        resObj =  self._GETRequester(self._locReqURL, locReqParams, self._standardHeaders, 'location', 'location')
         if not resObj: return False        
 
         locResJsonObj = resObj.json() # json data extraction from response object as dictionary
+        if not locResJsonObj['locations']:
+            print('<ERROR> No location found for "{}"'.format(self._loc), flush = True)
+            return False
         if isinstance(locResJsonObj['locations'], list):
             self._setLocInfo(locResJsonObj['locations'][0]['id'], locResJsonObj['locations'][0]['type']) # returning first match for location
         else:
             self._setLocInfo(locResJsonObj['locations']['id'], locResJsonObj['locations']['type'])
+        with JobURLUtil._locationMemoLock: JobURLUtil._locationMemo[memoKey] = (self._locId, self._locT)
         return resObj
 
     def jobListingPageBaseRequester(self):
@@ -199,9 +1888,10 @@ class JobURLUtil:
             Params: [None]
 
             Returns:
-            • Response object containing the GD-format job-listing base page information
+            • Response object containing the GD-format job-listing base page information (False if it could not be retrieved)
         """
 
+        if self._locId is None: return False # Location lookup failed
         listPgBaseReqParams = {
             'suggestCount' : '0',
             'suggestChosen' : 'false',
@@ -212,7 +1902,7 @@ class JobURLUtil:
             'locId' : str(self._locId)
         }
 
-        resObj =  self._GETRequester(self._listPgBaseReqURL, listPgBaseReqParams, self._standardHeaders, 'job-listing base page') # requests handle redirections automatically [301]
+        resObj =  self._GETRequester(self._listPgBaseReqURL, listPgBaseReqParams, self._standardHeaders, 'job-listing base page', 'listing') # requests handle redirections automatically [301]
         if not resObj: return False
     
         self._setJobListBaseInfo(resObj.url)        
@@ -228,7 +1918,7 @@ class JobURLUtil:
             • jobLinks - All parse-able job links from the HTML text content 
         """
 
-        jobLinks = ['https://www.glassdoor.co.in/job-listing/details'+extractedPattern for extractedPattern in self._scraper.patternBase['jobLink'].findall(htmlContent)]
+        jobLinks = [self._siteRoot+'/job-listing/details'+extractedPattern for extractedPattern in self._scraper.patternBase['jobLink'].findall(htmlContent)]
         print('|NUMBER OF JOB LINKS EXTRACTED| {}'.format(len(jobLinks)), flush = True) if debugPrint else None
         return jobLinks
 
@@ -245,147 +1935,763 @@ class JobURLUtil:
         #for logoLink in logoLinks: print(logoLink) # Printing debug line
         return logoLinks
 
-    def jobLinkHeaderInfoExtractor(self, jobLinks, jobListPgHTMLContent):
+    def jobListingIdExtractor(self, jobLink):
+        """Extracts GD's job-listing ID from a job link, identifying the same posting across job-listing pages and runs
+
+            Params: 
+            • jobLink - Job link extracted by jobLinkExtractor()
+
+            Returns:
+            • Job-listing ID (the job link itself if it does not hold one)
+        """
+        jobListingIdRes = self._scraper.patternBase['jobListingId'].findall(jobLink)
+        return jobListingIdRes[0] if jobListingIdRes else jobLink
+
+    def _jobHeaderBuilder(self, headerValues, errorInfo, jobLink, logoLinks, logoLinkIndex):
+        """Completes a job page's scraped header information with its links, reporting pages that could not be scraped
+           Helper Method For: jobLinkHeaderInfoExtractor()
+
+            Params: 
+            • headerValues - Header information scraped by jobPageHeaderParser() (None if it could not be scraped)
+            • errorInfo - Description of the scraping error
+            • jobLink - Link of the job page (for output and error reporting)
+            • logoLinks - Company logo links extracted from the job-listing page
+            • logoLinkIndex - Position of the job link on the job-listing page
+
+            Returns:
+            • Dictionary containing the job's header information (None if it could not be scraped)   
+        """
+
+        if headerValues is None:
+            # htmlFileTester('test', htmlContent) # Debugging Line
+            print('<ERROR> Could not scrape job header info. \n......> <Further Info> {}\n......> <URL> {}'.format(errorInfo, jobLink), flush = True)
+            return None
+
+        try:
+            return dict(headerValues, companyLogoURL = logoLinks[logoLinkIndex], jobURL = jobLink)
+        except Exception as error:
+            print('<ERROR> Could not store scraped job-header info. \n......> <Further Info> {}\n......> <Line Number> {}\n......> <URL> {}'.format(error, exc_info()[-1].tb_lineno, jobLink), flush = True)
+            return None
+
+    def _jobPageParser(self, resObjs):
+        """Scrapes the header information of fetched job pages, in the parse-worker processes if the instance has any
+           Helper Method For: jobLinkHeaderInfoExtractor()
+
+            Params: 
+            • resObjs - Response objects of the fetched job pages
+
+            Returns:
+            • List of (headerValues, errorInfo) tuples (see jobPageHeaderParser()), in the same order as 'resObjs'
+        """
+
+        stageStart = time.perf_counter()
+        if not self._parseWorkers: parsedPages = [jobPageHeaderParser(self._scraper, self._doc, resObj.text) for resObj in resObjs]
+        else:
+            if self._parseExecutor is None: self._parseExecutor = parseExecutorCreator(self._doc, self._parseWorkers)
+            parsedPages = parallelJobPageParser(self._parseExecutor, self._parseWorkers, [(resObj.content, resObj.encoding) for resObj in resObjs]) # raw bytes are decoded inside the workers
+        if resObjs: self.runMetrics.recordStage('jobPageParse', time.perf_counter() - stageStart, itemCount = len(resObjs))
+
+        for headerValues, _, parseInfo in parsedPages: # extraction steps timed inside the parsing thread or worker process
+            for stageName, stageSeconds in parseInfo['stageSeconds'].items(): self.runMetrics.recordStage(stageName, stageSeconds)
+            for fieldName in parseInfo['fieldMisses']: self.runMetrics.addCount('fieldMisses.{}'.format(fieldName))
+            if 'companyName' in parseInfo['fieldMisses'] and 'companyNameAlt' not in parseInfo['fieldMisses']: self.runMetrics.addCount('companyNameAltFallbacks')
+            if headerValues is None: self.runMetrics.addCount('jobPageParseErrors')
+            if self._httpPool.concurrencyController is not None: self._httpPool.concurrencyController.observeParse('jobTitle' in parseInfo['fieldMisses'])
+        return [(headerValues, errorInfo) for headerValues, errorInfo, _ in parsedPages]
+
+    def jobLinkHeaderInfoExtractor(self, jobLinks, jobListPgHTMLContent, logoLinks = None, settledIds = None):
         """Processes 30 job links (as of 9 July, 2018) at once to collect relevant jobs' header-information 
             Params: 
             • jobLinks - Collection of links extracted from the job-listing page 
             • jobListPgHTMLContent - HTML Content of Job Listing Page, for whom the job links have been extracted <to prevent GET Request repetition and delay for HTML Content> 
+            • logoLinks - Company logo links paired up with jobLinks (extracted from jobListPgHTMLContent if not given)
+            • settledIds - Set receiving the job-listing IDs that need not be fetched again: scraped, served from elsewhere, or gone for good [404/410]
+              (a job page that failed with a retryable error, e.g. [403], throttling, a timeout or an unscrapable block page, is left out)
 
             Returns:
             • headerInfo - Array of dictioinaries containing each job's header information   
         """
         headerInfo = []
-        logoLinks = self.logoLinkExtractor(jobListPgHTMLContent)
+        if logoLinks is None: logoLinks = self.logoLinkExtractor(jobListPgHTMLContent)
+        jobListingIds = [self.jobListingIdExtractor(jobLink) for jobLink in jobLinks]
+        sharedValues = [self._sharedJobRecords.get(jobListingId) if self._sharedJobRecords is not None else None for jobListingId in jobListingIds] # scraped by another search
+        indexedValues = [self._postingIndex.knownRecord(jobListingId, self._doc) if self._postingIndex is not None and headerValues is None else None 
+                         for jobListingId, headerValues in zip(jobListingIds, sharedValues)] # scraped by an earlier run
+        fetchFlags = [headerValues is None and (storedValues is None or self._postingIndex.recheckSampled()) for headerValues, storedValues in zip(sharedValues, indexedValues)]
+        fetchLinks = [jobLink for jobLink, fetchFlag in zip(jobLinks, fetchFlags) if fetchFlag]
+        recheckLinks = set(jobLink for jobLink, fetchFlag, storedValues in zip(jobLinks, fetchFlags, indexedValues) if fetchFlag and storedValues is not None) # not served stale from the cache
+        resObjs = iter(self._concurrentGETRequester(fetchLinks, 'job-page header-extraction', recheckLinks)) # Ordered like fetchLinks, so logoLinks[logoLinkIndex] still pairs up
 
-        for logoLinkIndex, jobLink in enumerate(jobLinks):
-            resObj = self._GETRequester(jobLink, {}, self._standardHeaders, 'job-page header-extraction')
-            htmlContent = resObj.text
+        fetchedPages, goneLinkIndexes = [], set()
+        for logoLinkIndex, (jobLink, fetchFlag) in enumerate(zip(jobLinks, fetchFlags)):
+            if not fetchFlag: continue
+            resObj = next(resObjs)
+            if resObj: fetchedPages.append((logoLinkIndex, jobLink, resObj))
+            else: print('<ERROR> Could not fetch job page. \n......> <URL> {}'.format(jobLink), flush = True)
+            if resObj is None: goneLinkIndexes.add(logoLinkIndex)
 
-            # Future Work: Need to preprocess names and titles by removing unicodes like &amp;
-            try:
-                # Company-Name Extraction
-                companyNameRes = self._scraper.patternBase['companyName'].findall(htmlContent)
-                if not companyNameRes: companyName = self._scraper.patternBase['companyNameAlt'].findall(htmlContent)[0] # Use Backup Pattern
-                else: companyName = companyNameRes[0]
-                # print('{} : {}'.format(companyName, jobLink)) # Debug Print Line
-                
-                # Company-Rating Extraction
-                companyRatingRes = self._scraper.patternBase['companyRating'].findall(htmlContent)
-                if not companyRatingRes: companyRating = -1
-                else: companyRating = companyRatingRes[0] 
-
-                # Job-Title Extraction
-                jobTitle = self._scraper.patternBase['jobTitle'].findall(htmlContent)[0]
-
-                # Job-Location Extraction 
-                jobLocation = self._scraper.patternBase['jobLocation'].findall(htmlContent)[0]
-
-                # Job Posting Time Difference Extraction
-                jobPostingTimeDiff = (self._doc - datetime.strptime(self._scraper.patternBase['jobPostingDate'].findall(htmlContent)[0], JobURLUtil.getJobPostingDateFormat())).days 
-
-            except Exception as error:
-                # htmlFileTester('test', htmlContent) # Debugging Line
-                print('<ERROR> Could not scrape job header info. \n......> <Further Info> {}\n......> <Line Number> {}\n......> <URL> {}'.format(error, exc_info()[-1].tb_lineno, jobLink), flush = True) # Shows with line number error wth sys.exc_info()
-            # for item in companyName: print(item) # Debugging line
-            # htmlFileTester('test', resObj.text) # Debugging Utility Line
-
-            try:
-                headerInfo.append( {'companyName': companyName, 
-                                   'companyRating': companyRating, 
-                                   'jobTitle': jobTitle, 
-                                   'jobLocation': jobLocation, 
-                                   'jobPostingTimeDiff': jobPostingTimeDiff,
-                                   'companyLogoURL': logoLinks[logoLinkIndex],
-                                   'jobURL': jobLink})
-            except Exception as error:
-                print('<ERROR> Could not store scraped job-header info. \n......> <Further Info> {}\n......> <Line Number> {}\n......> <URL> {}'.format(error, exc_info()[-1].tb_lineno, jobLink), flush = True)
+        parsedHeaders = dict((logoLinkIndex, parsedHeader) for (logoLinkIndex, _, _), parsedHeader in zip(fetchedPages, self._jobPageParser([resObj for _, _, resObj in fetchedPages])))
+        for logoLinkIndex, (jobLink, jobListingId, headerValues, storedValues) in enumerate(zip(jobLinks, jobListingIds, sharedValues, indexedValues)):
+            errorInfo, scraped = None, logoLinkIndex in parsedHeaders and parsedHeaders[logoLinkIndex][0] is not None
+            if logoLinkIndex in parsedHeaders: 
+                headerValues, errorInfo = parsedHeaders[logoLinkIndex]
+                if headerValues is not None and self._sharedJobRecords is not None: self._sharedJobRecords[jobListingId] = headerValues
+            if headerValues is None and storedValues is not None: headerValues, errorInfo = storedValues, None # served from the index (also when a re-check failed)
+            if settledIds is not None and (headerValues is not None or logoLinkIndex in goneLinkIndexes): settledIds.add(jobListingId)
+            if headerValues is None and errorInfo is None: continue # job page could not be fetched
+            jobHeader = self._jobHeaderBuilder(headerValues, errorInfo, jobLink, logoLinks, logoLinkIndex)
+            if jobHeader and self._postingIndex is not None:
+                if scraped: jobHeader['changeStatus'] = self._postingIndex.recordPosting(self._title, self._loc, jobListingId, jobHeader, self._doc)
+                else: jobHeader['changeStatus'] = self._postingIndex.markPresent(self._title, self._loc, jobListingId)
+            if jobHeader: headerInfo.append(jobHeader)
 
         return headerInfo
 
     def jobListingPageRetriever(self, pageNumber):
         """Retrieves job-listing page info by initiating a GET Request 
             Params: 
-            • pageNumber - Job-listing page number > 1  
+            • pageNumber - Job-listing page number (1 = the job-listing base page, e.g. when a resumed run starts over from it)
 
             Returns:
             • Job-listing page response-object, for utilizing its properties like html content, url, etc.    
         """
         currentJobListPgURL = '{}{}{}{}'.format(self._baseJobListPgURL[:-4], '_IP', pageNumber, self._baseJobListPgURL[-4:]) # Assumed extension is .htm for now, but might need 'future proofing' 
+        if pageNumber == 1: currentJobListPgURL = self._baseJobListPgURL
         # print('|JOB-LISTING PAGE URL CONSTRUCTED AS| {}'.format(currentJobListPgURL)) # Debugging Line
-        return self._GETRequester(currentJobListPgURL, {}, self._standardHeaders, 'job-listing page-number ({})'.format(pageNumber))
+        return self._GETRequester(currentJobListPgURL, {}, self._standardHeaders, 'job-listing page-number ({})'.format(pageNumber), 'listing')
+
+    @staticmethod
+    def _stagePut(stageQueue, item, stopEvent):
+        """Hands an item over to the next pipeline stage, waiting while the (bounded) queue is full
+           Helper Method For: _listingPageProducer(), _jobLinkStage()
+
+            Params: 
+            • stageQueue - Bounded queue connecting two pipeline stages
+            • item - Item to be handed over (None marks the end of the stage's output)
+            • stopEvent - Event set once the pipeline is stopped, upon which the item is dropped
+
+            Returns:
+            • True if the item was handed over, False if the pipeline was stopped meanwhile
+        """
+        while not stopEvent.is_set():
+            try:
+                stageQueue.put(item, timeout = 0.1)
+                return True
+            except Full: continue
+        return False
+
+    @staticmethod
+    def _stageGet(stageQueue, stopEvent):
+        """Takes the next item from the previous pipeline stage, waiting while the queue is empty
+           Helper Method For: _jobLinkStage(), jobHeaderPageIterator()
+
+            Params: 
+            • stageQueue - Bounded queue connecting two pipeline stages
+            • stopEvent - Event set once the pipeline is stopped
+
+            Returns:
+            • Next item of the stage (None once the stage is done or the pipeline was stopped)
+        """
+        while not stopEvent.is_set():
+            try: return stageQueue.get(timeout = 0.1)
+            except Empty: continue
+        return None
+
+    def _listingPageProducer(self, resObj, startPage, batchCount, pageQueue, stopEvent):
+        """Pipeline Stage 1: Fetches the job-listing pages ahead of the later stages (_IP2, _IP3, ...), in page order
+           Fetching stops once the bounded page queue is full, and resumes as soon as a page is taken out of it
+
+            Params: 
+            • resObj - Response object of the start page (the job-listing base page for page 1; fetched here if None)
+            • startPage - Number of the first job-listing page
+            • batchCount - Number of the last job-listing page to be fetched
+            • pageQueue - Bounded queue receiving (pageNumber, htmlContent, jobListingPgURL) tuples
+            • stopEvent - Event set once the pipeline is stopped
+
+            Returns: [None]
+        """
+        try:
+            pageNumber = startPage
+            if resObj is None: resObj = self.jobListingPageRetriever(pageNumber)
+            while resObj and self._stagePut(pageQueue, (pageNumber, resObj.text, resObj.url), stopEvent) and pageNumber < batchCount:
+                pageNumber += 1
+                resObj = self.jobListingPageRetriever(pageNumber)
+            if not resObj: 
+                self._listingIncomplete = True
+                print('<ERROR> Could not fetch job-listing page ({}), stopping early'.format(pageNumber), flush = True)
+        finally:
+            self._stagePut(pageQueue, None, stopEvent)
+
+    def _jobLinkStage(self, pageQueue, linkQueue, stopEvent, stopEarly, debugPrint, checkpoint):
+        """Pipeline Stage 2: Extracts the job links (paired up with their logo links) of every fetched job-listing page, in page order
+           Job links already fetched by an earlier page of this run, or recorded in the checkpoint's seen index, are dropped
+
+            Params: 
+            • pageQueue - Bounded queue holding the fetched job-listing pages
+            • linkQueue - Bounded queue receiving (pageNumber, jobListingPgURL, jobLinks, logoLinks, jobListingIds, htmlContent) tuples
+            • stopEvent - Event set once the pipeline is stopped
+            • stopEarly - Whether the pipeline is stopped at the first job-listing page without any job links
+            • debugPrint - Whether the number of extracted job links is displayed
+            • checkpoint - ScrapeCheckpoint holding the seen index
+
+            Returns: [None]
+        """
+        claimedIds = set() # job listings handed over to stage 3 in this run
+        try:
+            while True:
+                page = self._stageGet(pageQueue, stopEvent)
+                if page is None: break
+                pageNumber, htmlContent, jobListingPgURL = page
+                stageStart = time.perf_counter()
+                jobLinks = self.jobLinkExtractor(htmlContent, debugPrint)
+                if not jobLinks: self._listingExhausted = True
+                if not jobLinks and stopEarly:
+                    print('|NO JOB LINKS FOUND ON JOB-LISTING PAGE - {}| Stopping early'.format(pageNumber), flush = True)
+                    break
+
+                logoLinks, unseenLinks = self.logoLinkExtractor(htmlContent), []
+                for logoLinkIndex, jobLink in enumerate(jobLinks): # pairing up before filtering, so logo links stay with their job links
+                    jobListingId = self.jobListingIdExtractor(jobLink)
+                    if jobListingId in claimedIds: continue # recorded in the posting index once its first listing is scraped by stage 3
+                    if checkpoint.isSeen(jobListingId): 
+                        if self._postingIndex is not None: self._postingIndex.markPresent(self._title, self._loc, jobListingId) # still listed, so not removed
+                        continue
+                    claimedIds.add(jobListingId)
+                    unseenLinks.append((jobLink, logoLinks[logoLinkIndex] if logoLinkIndex < len(logoLinks) else None, jobListingId))
+                checkpoint.duplicatesSkipped += len(jobLinks) - len(unseenLinks)
+                self.runMetrics.recordStage('linkExtraction', time.perf_counter() - stageStart, itemCount = len(jobLinks))
+                self.runMetrics.addCount('duplicateJobLinksSkipped', len(jobLinks) - len(unseenLinks))
+                print('|DUPLICATE JOB LINKS SKIPPED| {}'.format(len(jobLinks) - len(unseenLinks)), flush = True) if debugPrint and len(unseenLinks) < len(jobLinks) else None
+
+                pageLinks = [list(linkColumn) for linkColumn in zip(*unseenLinks)] or [[], [], []]
+                if not self._stagePut(linkQueue, (pageNumber, jobListingPgURL, pageLinks[0], pageLinks[1], pageLinks[2], htmlContent), stopEvent): break
+        finally:
+            self._stagePut(linkQueue, None, stopEvent)
+
+    def jobHeaderPageIterator(self, resObj, batchCount = 2, prefetchDepth = 2, stopEarly = False, debugPrint = False, checkpoint = None):
+        """Runs the scraping pipeline, where job-listing page fetching (stage 1) and job-link extraction (stage 2) run in background threads, 
+           ahead of the job-header extraction (stage 3) performed by the caller's iteration
+            Params: 
+            • resObj - Response object containing the GD-format job-listing base page information (may be None when resuming from a checkpoint)
+            • batchCount - Number indicating how many batches of 30 job-listings are to be extracted (1 page = 30 job-listings)   
+            • prefetchDepth - Number of job-listing pages that may be fetched ahead of the job-header extraction
+            • stopEarly - Whether the pipeline stops at the first job-listing page without any job links, instead of going on up to batchCount
+            • debugPrint - Whether the number of extracted job links is displayed
+            • checkpoint - ScrapeCheckpoint to resume from and to record progress in; a page counts as completed once the caller 
+              asks for the next one and none of its job pages failed with a retryable error, so that a resumed run fetches those again 
+              (only duplicates within the run are dropped if not given)
+
+            Yields:
+            • (pageNumber, jobListingPgURL, jobHeadersList) - Job headers scraped from each job-listing page, in page order
+        """
+        ownCheckpoint = checkpoint is None
+        if ownCheckpoint: checkpoint = ScrapeCheckpoint()
+        startPage, resumePoint = 1, checkpoint.resumePoint(self._title, self._loc)
+        if resumePoint:
+            startPage, resObj = resumePoint[0] + 1, None
+            self._listingIncomplete = True # the postings of the pages completed before the interruption are not listed again
+            self._setJobListBaseInfo(resumePoint[1])
+            print('|RESUMING FROM JOB-LISTING PAGE| {}'.format(startPage), flush = True) if startPage <= batchCount else None
+        if startPage > batchCount:
+            if resumePoint and checkpoint.path is not None:
+                print('|CHECKPOINT COMPLETE| All {} job-listing pages of this search were already scraped; delete the checkpoint file ({}) to scrape them again, '
+                      'or pass a larger batch size to scrape further pages'.format(batchCount, checkpoint.path), flush = True)
+            if ownCheckpoint: checkpoint.close()
+            return
+
+        pageQueue, linkQueue, stopEvent = Queue(maxsize = max(1, prefetchDepth)), Queue(maxsize = 1), Event()
+        stageThreads = [Thread(target = self._listingPageProducer, args = (resObj, startPage, batchCount, pageQueue, stopEvent), daemon = True),
+                        Thread(target = self._jobLinkStage, args = (pageQueue, linkQueue, stopEvent, stopEarly, debugPrint, checkpoint), daemon = True)]
+        for stageThread in stageThreads: stageThread.start()
+
+        completedPage = startPage - 1 # every page up to this one has all of its job pages settled
+        try:
+            while True:
+                stageStart = time.perf_counter()
+                linkedPage = self._stageGet(linkQueue, stopEvent)
+                self.runMetrics.recordStage('pipelineWait', time.perf_counter() - stageStart) # time stage 3 sat idle, waiting on stages 1-2
+                if linkedPage is None: break
+                pageNumber, jobListingPgURL, jobLinks, logoLinks, jobListingIds, htmlContent = linkedPage
+                settledIds = set()
+                yield pageNumber, jobListingPgURL, self.jobLinkHeaderInfoExtractor(jobLinks, htmlContent, logoLinks, settledIds) # Returns 30 job header info from each job link 
+                unsettledCount = len(set(jobListingIds) - settledIds)
+                if unsettledCount: print('<WARNING> {} job page(s) of job-listing page {} failed, a resumed run fetches them again'.format(unsettledCount, pageNumber), flush = True)
+                elif completedPage == pageNumber - 1: completedPage = pageNumber
+                checkpoint.markPageComplete(self._title, self._loc, completedPage, self._baseJobListPgURL, settledIds) # the caller is done with the page
+        finally:
+            stopEvent.set() # Releases the background stages, even if the caller stops iterating early
+            for stageThread in stageThreads: stageThread.join()
+            if ownCheckpoint: checkpoint.close()
+
+    def removedPostingsCollector(self):
+        """Collects the postings of the search that an earlier run found, but this (completed) run did not, from the posting index
+            Params: [None]
+
+            Returns:
+            • List of the last stored records of the removed postings, tagged with the 'removed' change status (empty without a posting index, 
+              if job-listing pages were skipped, or if the run stopped before the end of the listing, where the missing postings may only have moved further down)
+        """
+        if self._postingIndex is None: return []
+        if self._listingIncomplete:
+            print('<WARNING> Not every job-listing page was listed in this run (fetch failure or resumed run), so no postings are reported as removed', flush = True)
+            return []
+        if not self._listingExhausted:
+            print('<WARNING> The run stopped before the end of the listing (no job-listing page without job links was reached), so no postings are reported as removed', flush = True)
+            return []
+        return [dict(jobRecord, changeStatus = 'removed') for jobRecord in self._postingIndex.removedPostings(self._title, self._loc, self._doc)]
 
-    def batchExtract(self, resObj, batchCount = 2, debugPrint = False):        
+    def batchExtract(self, resObj, batchCount = 2, debugPrint = False, prefetchDepth = 2, stopEarly = False, recordSink = None, checkpoint = None):        
         """Retrieves job-listing page info by initiating a GET Request 
             Params: 
             • resObj - Response object containing the GD-format job-listing base page information
             • batchCount - Number indicating how many batches of 30 job-listings are to be extracted (1 page = 30 job-listings)   
+            • prefetchDepth - Number of job-listing pages that may be fetched ahead of the job-header extraction
+            • stopEarly - Whether extraction stops at the first job-listing page without any job links
+            • recordSink - DatasetWriter receiving the job headers of every job-listing page as soon as they are scraped (instead of collecting them in memory)
+            • checkpoint - ScrapeCheckpoint for resuming an interrupted run and skipping already fetched job pages
 
             Returns:
-            • jobHeadersCollection - List of job headers scraped (a dictionary containing header values) of all of the the job postings    
+            • jobHeadersCollection - List of job headers scraped (a dictionary containing header values) of all of the the job postings (empty when streamed to a recordSink)   
         """
-        jobHeadersCollection = []
-        htmlContent, jobListingPgURL = resObj.text, resObj.url
+        jobHeadersCollection, jobHeadersCount = [], 0
 
-        for pageNumber in range(2, batchCount + 2):
-            print('\n' + '-'*50 + '\n', flush = True) if pageNumber != 2 else None # Page Divider - implicitly informs the number of batches processed 
+        for pageNumber, jobListingPgURL, jobHeadersList in self.jobHeaderPageIterator(resObj, batchCount, prefetchDepth, stopEarly, debugPrint, checkpoint):
+            print('\n' + '-'*50 + '\n', flush = True) if pageNumber != 1 else None # Page Divider - implicitly informs the number of batches processed 
             print('|JOB-LISTING PAGE IN CONSIDERATION| {} '.format(jobListingPgURL), flush = True) if debugPrint else None
-            jobHeadersList = self.jobLinkHeaderInfoExtractor(self.jobLinkExtractor(htmlContent, debugPrint), htmlContent) # Returns 30 job header info from each job link 
-            jobHeadersCollection += jobHeadersList 
+            jobHeadersCount += len(jobHeadersList)
+            if recordSink is not None: 
+                stageStart = time.perf_counter()
+                recordSink.writeMany(jobHeadersList) # Streamed to disk, so memory use does not grow with the batch count
+                recordSink.flush() # on disk before the checkpoint marks the page as completed
+                self.runMetrics.recordStage('datasetWrite', time.perf_counter() - stageStart, itemCount = len(jobHeadersList))
+            else: jobHeadersCollection += jobHeadersList 
             
             # Displays all of the job headers extracted 
             if debugPrint:
                 print('|JOB-HEADER EXTRACTION COMPLETE|', flush = True) # Debug Print Lines
-                print('|JOB-HEADER INFORMATION ON JOB-LISTING PAGE - {}|\n'.format(pageNumber-1), flush = True) 
+                print('|JOB-HEADER INFORMATION ON JOB-LISTING PAGE - {}|\n'.format(pageNumber), flush = True) 
                 for jobNumber, jobHeader in enumerate(jobHeadersList):                     
                     print('{}:)\n'.format(jobNumber+1)) 
-                    for jobHeaderName, jobHeaderValue in jobHeader.items(): print('{} : {}'.format(jobHeaderName, jobHeaderValue), flush = True)
-                    print('\n' + '*'*50 + '\n') if jobNumber != 29 else None           
+                    for jobHeaderName, jobHeaderValue in jobHeader.items(): 
+                        if jobHeaderName == 'jobDescription' and jobHeaderValue and len(jobHeaderValue) > 200: jobHeaderValue = jobHeaderValue[:200] + '...' # full text goes to the dataset file
+                        print('{} : {}'.format(jobHeaderName, jobHeaderValue), flush = True)
+                    print('\n' + '*'*50 + '\n') if jobNumber != len(jobHeadersList) - 1 else None           
             #htmlFileTester('test', htmlContent) # Debugging Line
-            resObj = self.jobListingPageRetriever(pageNumber)
-            htmlContent, jobListingPgURL = resObj.text, resObj.url
+
+        removedRecords = self.removedPostingsCollector() # incremental runs also report the postings gone since the last run
+        if removedRecords and recordSink is not None: recordSink.writeMany(removedRecords)
+        elif removedRecords: jobHeadersCollection += removedRecords
+        print('|REMOVED JOB POSTINGS| {}'.format(len(removedRecords)), flush = True) if debugPrint and self._postingIndex is not None else None
         print('\n' + '='*50 + '\n') if debugPrint else None   
-        print('{} Job-Posting Header Data Extracted Successfully'.format(batchCount*30), flush = True) # Debug Print Line                       
+        print('{} Job-Posting Header Data Extracted Successfully'.format(jobHeadersCount), flush = True) # Debug Print Line                       
         print('\n' + '='*50 + '\n') # Implicitly indicating that the scrapping is complete
 
         return jobHeadersCollection 
 
+# SEARCH-QUERY FILE READER
+def queryFileReader(path):
+    """Reads the searches of a multi-query batch run from a CSV file (with a 'title,location,batches' header row) or a JSONL file 
+       (one {"title": ..., "location": ..., "batches": ...} object per line)
+
+        Params: 
+        • path - Path of the query file
+
+        Returns:
+        • queries - List of (title, location, batchCount) tuples, in file order
+
+        Raises:
+        • ValueError - Malformed query file
+    """
+    with open(path, encoding = 'utf-8', newline = '') as queryFile:
+        if path.lower().endswith('.jsonl'): queryRows = [json.loads(line) for line in queryFile if line.strip()]
+        else: queryRows = list(csv.DictReader(queryFile))
+
+    queries = []
+    for rowNumber, queryRow in enumerate(queryRows, 1):
+        title, loc, batchCount = (str(queryRow.get(fieldName, '')).strip() for fieldName in ('title', 'location', 'batches'))
+        if not title or not loc or not re.match(r'^\d+$', batchCount) or not int(batchCount): 
+            raise ValueError('Query {} of {} needs a title, a location and a positive whole number of batches'.format(rowNumber, path))
+        queries.append((title, loc, int(batchCount)))
+    return queries
+
+# MULTI-QUERY SCHEDULER CLASS
+class MultiQueryScheduler:
+    """Scrapes many (title, location, batch count) searches in one process, sharing the HTTP session pool, the response cache, 
+       the parse-worker processes, the location lookups and the job pages found by several searches
+
+    • Searches are interleaved fairly: every active search scrapes one job-listing page per round (round-robin), 
+      with at most 'maxActiveQueries' searches prefetching their job-listing pages at the same time
+    """
+
+    def __init__(self, queries, doc = 'SERVER_TIMING', maxWorkers = 1, perHostLimit = 4, httpPool = None, responseCache = None, parseWorkers = 0, 
+                 maxActiveQueries = 4, prefetchDepth = 2, stopEarly = False, urlUtilClass = None, streamPages = False, runMetrics = None, 
+                 fixtureRecorder = None, postingIndex = None):
+        """Sets up the shared resources of the batch run
+           Params:
+           • queries - List of (title, location, batchCount) tuples, e.g. from queryFileReader()
+           • doc - Date on client's side 
+           • maxWorkers, perHostLimit - Job-page fetching concurrency of each search (see JobURLUtil)
+           • httpPool - HTTPSessionPool shared by all searches (created if not given)
+           • responseCache - HTTPResponseCache shared by all searches (no caching if not given)
+           • parseWorkers - Number of parse-worker processes shared by all searches (0 = scrape in the fetching thread)
+           • maxActiveQueries - Number of searches scraped side by side
+           • prefetchDepth, stopEarly - Pipeline settings of each search (see JobURLUtil.jobHeaderPageIterator())
+           • urlUtilClass - JobURLUtil (sub)class used for every search (JobURLUtil if not given)
+           • streamPages - Whether job pages are read only up to the end of their description (see JobURLUtil)
+           • runMetrics - RunMetrics receiving the stage timings and counters of all searches (created if not given)
+           • fixtureRecorder - FixtureRecorder saving the responses of all searches as replayable fixtures (nothing is recorded if not given)
+           • postingIndex - PostingIndex shared by all searches, for an incremental run (see JobURLUtil)
+
+           Returns: [None]
+        """
+        self._queries = list(queries)
+        self._doc = doc
+        self._maxWorkers = maxWorkers
+        self._perHostLimit = perHostLimit
+        self._ownsHTTPPool = httpPool is None
+        self._httpPool = httpPool if httpPool is not None else HTTPSessionPool(poolSize = max(10, maxWorkers))
+        self._responseCache = responseCache
+        self._parseWorkers = parseWorkers
+        self._maxActiveQueries = max(1, maxActiveQueries)
+        self._prefetchDepth = prefetchDepth
+        self._stopEarly = stopEarly
+        self._urlUtilClass = urlUtilClass or JobURLUtil
+        self._streamPages = streamPages
+        self.runMetrics = runMetrics if runMetrics is not None else RunMetrics()
+        self._fixtureRecorder = fixtureRecorder
+        self._postingIndex = postingIndex
+        self._sharedJobRecords = {}
+        self.stats = {'queries': len(self._queries), 'failedQueries': 0, 'jobListingPages': 0, 'jobRecords': 0, 'sharedJobRecordsReused': 0}
+
+    def _queryStarter(self, query, parseExecutor):
+        """Sets up a search's JobURLUtil and pipeline (None if its job-listing base page could not be retrieved)"""
+        title, loc, batchCount = query
+        try:
+            urlUtil = self._urlUtilClass(title, loc, self._doc, self._maxWorkers, self._perHostLimit, self._httpPool, self._responseCache, 
+                                         self._parseWorkers, parseExecutor, self._sharedJobRecords, self._streamPages, self.runMetrics, self._fixtureRecorder, 
+                                         self._postingIndex)
+        except (ValueError, KeyError, TypeError) as error: # malformed location response
+            print('<ERROR> Could not look up the location of ({}, {}), skipping it\n......> <Further Info> {}'.format(title, loc, repr(error)), flush = True)
+            self.stats['failedQueries'] += 1
+            return None
+        resObj = urlUtil.jobListingPageBaseRequester()
+        if not resObj:
+            print('<ERROR> Could not retrieve the job-listing base page for ({}, {}), skipping it'.format(title, loc), flush = True)
+            self.stats['failedQueries'] += 1
+            urlUtil.close()
+            return None
+        return query, urlUtil, urlUtil.jobHeaderPageIterator(resObj, batchCount, self._prefetchDepth, self._stopEarly)
+
+    def run(self, recordSink = None, debugPrint = False):
+        """Scrapes all searches, tagging every job record with the search (searchTitle, searchLocation) it was found by
+           Params:
+           • recordSink - DatasetWriter receiving the job records as soon as they are scraped (instead of collecting them in memory)
+           • debugPrint - Whether the progress of every job-listing page is displayed
+
+           Returns:
+           • jobHeadersCollection - List of job records of all searches (empty when streamed to a recordSink)
+        """
+        jobHeadersCollection, pendingQueries, activeQueries = [], deque(self._queries), deque()
+        parseExecutor = parseExecutorCreator(JobURLUtil.clientDateParser(self._doc), self._parseWorkers) if self._parseWorkers else None
+        try:
+            while pendingQueries or activeQueries:
+                while pendingQueries and len(activeQueries) < self._maxActiveQueries:
+                    activeQuery = self._queryStarter(pendingQueries.popleft(), parseExecutor)
+                    if activeQuery: activeQueries.append(activeQuery)
+                if not activeQueries: continue
+
+                query, urlUtil, pageIterator = activeQueries.popleft()
+                sharedRecordCount, indexedRecordCount = len(self._sharedJobRecords), self._postingIndex.stats['jobPagesSkipped'] if self._postingIndex is not None else 0
+                try: 
+                    pageNumber, _, jobHeadersList = next(pageIterator)
+                except StopIteration:
+                    pageNumber, jobHeadersList = None, urlUtil.removedPostingsCollector() # search completed: only its removed postings are left
+                    urlUtil.close()
+                    if not jobHeadersList: continue
+                jobHeadersList = [dict(jobHeader, searchTitle = query[0], searchLocation = query[1]) for jobHeader in jobHeadersList]
+                if pageNumber is not None: self.stats['jobListingPages'] += 1
+                self.stats['jobRecords'] += len(jobHeadersList)
+                if pageNumber is not None: 
+                    indexedRecordCount = (self._postingIndex.stats['jobPagesSkipped'] if self._postingIndex is not None else 0) - indexedRecordCount # served by the posting index instead
+                    self.stats['sharedJobRecordsReused'] += len(jobHeadersList) - (len(self._sharedJobRecords) - sharedRecordCount) - indexedRecordCount
+                print('|SEARCH ({}, {}) - JOB-LISTING PAGE {}| {} job records'.format(query[0], query[1], pageNumber or 'REMOVED POSTINGS', len(jobHeadersList)), flush = True) if debugPrint else None
+                if recordSink is not None: 
+                    stageStart = time.perf_counter()
+                    recordSink.writeMany(jobHeadersList)
+                    self.runMetrics.recordStage('datasetWrite', time.perf_counter() - stageStart, itemCount = len(jobHeadersList))
+                else: jobHeadersCollection += jobHeadersList
+                if pageNumber is not None: activeQueries.append((query, urlUtil, pageIterator)) # back of the round-robin queue
+        finally:
+            for _, urlUtil, pageIterator in activeQueries: 
+                pageIterator.close()
+                urlUtil.close()
+            if parseExecutor is not None: parseExecutor.shutdown()
+        return jobHeadersCollection
+
+    def close(self):
+        """Closes the HTTP session pool (unless it was given by the caller)"""
+        if self._ownsHTTPPool: self._httpPool.close()
+
+# SAMPLING PROFILER CLASS {cProfile only sees the thread it is enabled in, whereas the scrape runs across fetching and pipeline threads}
+class SamplingProfiler:
+    """Periodically samples the innermost frames of all threads, counting where the run spends its (wall-clock) time"""
+
+    def __init__(self, interval = 0.005, topFrames = 30):
+        """Sets up the profiler (sampling starts with start())
+           Params:
+           • interval - Seconds between two samples
+           • topFrames - Number of most sampled frames kept in the report
+
+           Returns: [None]
+        """
+        self._interval = interval
+        self._topFrames = topFrames
+        self._frameCounts = {}
+        self._sampleCount = 0
+        self._stopEvent = Event()
+        self._samplerThread = Thread(target = self._sampler, daemon = True)
+
+    def _sampler(self):
+        """Samples the current frame of every other thread until stopped"""
+        samplerId = self._samplerThread.ident
+        while not self._stopEvent.wait(self._interval):
+            self._sampleCount += 1
+            for threadId, frame in _current_frames().items():
+                if threadId == samplerId: continue
+                frameName = '{}:{} {}'.format(os.path.basename(frame.f_code.co_filename), frame.f_lineno, frame.f_code.co_name)
+                self._frameCounts[frameName] = self._frameCounts.get(frameName, 0) + 1
+
+    def start(self):
+        """Starts sampling in a background thread"""
+        self._samplerThread.start()
+
+    def stop(self):
+        """Stops sampling and reports the most sampled frames
+           Params: [None]
+
+           Returns:
+           • Dictionary holding the number of samples taken and the most sampled (file:line function) frames with their sample counts
+        """
+        self._stopEvent.set()
+        self._samplerThread.join()
+        topFrames = sorted(self._frameCounts.items(), key = lambda frameCount: frameCount[1], reverse = True)[:self._topFrames]
+        return {'samples': self._sampleCount, 'intervalSeconds': self._interval, 'topFrames': dict(topFrames)}
+
+# COMMAND-LINE OPTIONS {Name : (Validation Pattern, Converter, Default Value, Description)}
+CMD_OPTIONS = {
+    'workers' : (r'^[1-9]\d*$', int, 1, 'Number of job pages fetched concurrently'),
+    'host-limit' : (r'^[1-9]\d*$', int, 4, 'Maximum number of in-flight requests to a single host'),
+    'prefetch' : (r'^[1-9]\d*$', int, 2, 'Number of job-listing pages fetched ahead of the job-header extraction'),
+    'stop-early' : (r'^$', lambda optValue: True, False, 'Stop at the first job-listing page without any job links (flag, no value)'),
+    'pool-size' : (r'^[1-9]\d*$', int, 10, 'Number of keep-alive connections held per host'),
+    'retries' : (r'^\d+$', int, 4, 'Number of retries of a request after a 429/5xx response or a network error'),
+    'rate' : (r'^\d+(\.\d+)?$', float, 0, 'Number of requests allowed per second (0 = unlimited)'),
+    'burst' : (r'^[1-9]\d*$', int, 1, 'Number of requests allowed back-to-back before the rate limit applies'),
+    'parse-workers' : (r'^\d+$', int, 0, 'Number of processes scraping the fetched job pages (0 = no separate processes)'),
+    'output' : (r'^.+$', str, None, 'Path of the dataset file the job records are streamed into (.jsonl, .csv or .parquet)'),
+    'format' : (r'^(jsonl|csv|parquet)$', str, None, 'Dataset format, if not given by the output file extension (jsonl, csv or parquet)'),
+    'flush-every' : (r'^[1-9]\d*$', int, 30, 'Number of job records written between two flushes of the dataset file to disk'),
+    'checkpoint' : (r'^.+$', str, None, 'Path of the checkpoint file, for resuming an interrupted run and skipping already fetched job pages'),
+    'cache-dir' : (r'^.+$', str, None, 'Directory of the on-disk response cache (no caching if not given)'),
+    'cache-size' : (r'^[1-9]\d*$', int, 512, 'Upper bound (MB) of the response cache, evicting least recently used pages'),
+    'offline' : (r'^$', lambda optValue: True, False, 'Serve every request from the response cache, without any network access (flag, no value)'),
+    'stream-pages' : (r'^$', lambda optValue: True, False, 'Read job pages only up to the end of their description, leaving the rest of the page undownloaded (flag, no value)'),
+    'metrics' : (r'^.+$', str, None, 'Path of the JSON report of per-stage timings, throughput, bytes, pattern misses and cache hit rates written at the end of the run'),
+    'profile' : (r'^.+$', str, None, 'Path of the cProfile statistics of the run (main thread only, i.e. job-page parsing when --parse-workers=0)'),
+    'sample-profile' : (r'^.+$', str, None, 'Path of the JSON report of a sampling profiler covering all threads (fetching and pipeline stages included)'),
+    'adaptive' : (r'^$', lambda optValue: True, False, 'Tune the number of in-flight job-page fetches to the site\'s responses, up to --workers and --host-limit (flag, no value)'),
+    'skill-cache' : (r'^.+$', str, None, 'Path of a file caching the skill-matching automaton across runs (rebuilt when a skill dictionary changes)'),
+    'record-fixtures' : (r'^.+$', str, None, 'Directory the responses of the run are recorded into, as fixtures for the replay server of benchmark.py'),
+    'incremental' : (r'^.+$', str, None, 'Path of the posting index of earlier runs; only new postings and a sample of known ones are fetched, and records are tagged added/changed/unchanged/removed'),
+    'recheck-rate' : (r'^(0(\.\d+)?|1(\.0+)?)$', float, 0.1, 'Fraction of the known postings of an --incremental run whose job pages are fetched again to detect changes'),
+    'batch-file' : (r'^.+$', str, None, 'CSV/JSONL file of searches (title, location, batches) scraped in one run, instead of the 3 arguments'),
+    'max-active' : (r'^[1-9]\d*$', int, 4, 'Number of searches of a --batch-file run scraped side by side')
+}
+
 # COMMAND-LINE ARGUMENT CHECKER
 def cmdArgChecker(cmdParams):
     """Validates commandline arguments for the program. (Created for future flexibility abd extensibility for CMD Arguments) 
         Params: 
-        • cmdParams - List of Commandline Arguments 
+        • cmdParams - List of Commandline Arguments (optional settings are given as --NAME=VALUE, see CMD_OPTIONS)
 
         Returns:
-        • JOB_POSITION, JOB_LOCATION, BATCH_SIZE - Job Position, location and Batch Size entered by the user    
+        • JOB_POSITION, JOB_LOCATION, BATCH_SIZE - Job Position, location and Batch Size entered by the user (None for a --batch-file run)   
+        • CMD_OPTS - Dictionary of optional settings, holding defaults for the ones not entered by the user
     """
-    numArgs = len(cmdParams)
+    if '--help' in cmdParams[1:] or '-h' in cmdParams[1:]:
+        print('Usage: python scraper.py JOB_POSITION JOB_LOCATION BATCH_SIZE [--NAME=VALUE ...]\n       python scraper.py --batch-file=PATH [--NAME=VALUE ...]\n\nOptions:')
+        for optName, optSpec in CMD_OPTIONS.items():
+            print('  --{:<18} {}{}'.format(optName if optSpec[0] == r'^$' else optName + '=VALUE', optSpec[3], ' (default: {})'.format(optSpec[2]) if optSpec[2] is not None and optSpec[2] is not False else ''))
+        exit(0)
+    positionalParams = [cmdParam for cmdParam in cmdParams[1:] if not cmdParam.startswith('--')]
+    CMD_OPTS = {optName: optSpec[2] for optName, optSpec in CMD_OPTIONS.items()}
+    for cmdParam in cmdParams[1:]:
+        if not cmdParam.startswith('--'): continue
+        optName, _, optValue = cmdParam[2:].partition('=')
+        if optName not in CMD_OPTIONS:
+            print('<ERROR> Unknown option --{} (expected one of: {})'.format(optName, ', '.join('--' + name for name in CMD_OPTIONS)))
+            exit(0)
+        if not re.match(CMD_OPTIONS[optName][0], optValue):
+            print('<ERROR> Invalid value "{}" for option --{} ({})'.format(optValue, optName, CMD_OPTIONS[optName][3]))
+            exit(0)
+        CMD_OPTS[optName] = CMD_OPTIONS[optName][1](optValue)
+
+
+    if CMD_OPTS['batch-file']:
+        if positionalParams:
+            print('<ERROR> No arguments expected along with --batch-file (the searches are read from the file)')
+            exit(0)
+        print('\n' + '='*50 + '\n') # Acts like a screen output divider
+        print('Scraping Initiated For The Searches Listed In: {}\n'.format(CMD_OPTS['batch-file']))
+        print('\n' + '='*50 + '\n', flush = True) # Acts like a screen output divider
+        return None, None, None, CMD_OPTS
+
+    numArgs = len(positionalParams) + 1
     if numArgs < 4 or numArgs > 4: 
         print('<ERROR> 3 Arguments expected - {JOB_POSITION, JOB_LOCATION, BATCH_SIZE}')
         exit(0)
     else: 
-        JOB_POSITION, JOB_LOCATION, BATCH_SIZE = cmdParams[1], cmdParams[2], cmdParams[3]
+        JOB_POSITION, JOB_LOCATION, BATCH_SIZE = positionalParams[0], positionalParams[1], positionalParams[2]
 
         # Error Handling
-        if not re.match(r'^\d+$', BATCH_SIZE): # handles any string or  negative batch size input
+        if not re.match(r'^\d+$', BATCH_SIZE) or not int(BATCH_SIZE): # handles any string, negative or zero batch size input
             print('<ERROR> Batch Size must be a positive whole number')
             exit(0)
         else: 
             BATCH_SIZE = int(BATCH_SIZE)   
 
         print('\n' + '='*50 + '\n') # Acts like a screen output divider
-        print('Scraping Initiated For Job Listings Pertaining To: \n\t.....\t JOB POSITION: {} \n\t.....\t JOB LOCATION: {}\n\t.....\t BATCH SIZE (1 batch = 30 job-postings): {}\n'.format(cmdParams[1], cmdParams[2], cmdParams[3]))
+        print('Scraping Initiated For Job Listings Pertaining To: \n\t.....\t JOB POSITION: {} \n\t.....\t JOB LOCATION: {}\n\t.....\t BATCH SIZE (1 batch = 30 job-postings): {}\n'.format(JOB_POSITION, JOB_LOCATION, BATCH_SIZE))
         print('\n' + '='*50 + '\n', flush = True) # Acts like a screen output divider
-        return JOB_POSITION, JOB_LOCATION, BATCH_SIZE
+        return JOB_POSITION, JOB_LOCATION, BATCH_SIZE, CMD_OPTS
+
+def datasetWriterCreator(CMD_OPTS, append = False):
+    """Creates the DatasetWriter of the --output option (None if not given), exiting with an error message if it cannot be created"""
+    if not CMD_OPTS['output']: return None
+    try:
+        return DatasetWriter(CMD_OPTS['output'], CMD_OPTS['format'], CMD_OPTS['flush-every'], append = append)
+    except (ValueError, ImportError) as error:
+        print('<ERROR> Could not create the dataset file\n......> <Further Info> {}'.format(error))
+        exit(0)
+
+def datasetWriterCloser(recordSink, CMD_OPTS):
+    """Closes the DatasetWriter of the --output option (if any), keeping every record scraped so far, even if the run is cut off"""
+    if recordSink is None: return
+    recordSink.close()
+    print('|DATASET WRITTEN| {} job records to {}'.format(recordSink.recordCount, CMD_OPTS['output']), flush = True)
+
+def multiQueryMain(CMD_OPTS, httpPool, responseCache, runMetrics, fixtureRecorder, postingIndex):
+    """Runs all searches of the --batch-file option through one MultiQueryScheduler, returning the batch statistics for the run report"""
+    if CMD_OPTS['checkpoint']:
+        print('<ERROR> Option --checkpoint is not supported along with --batch-file')
+        exit(0)
+    try:
+        queries = queryFileReader(CMD_OPTS['batch-file'])
+    except (OSError, ValueError) as error:
+        print('<ERROR> Could not read the batch file\n......> <Further Info> {}'.format(error))
+        exit(0)
+
+    scheduler = MultiQueryScheduler(queries, 'SERVER_TIMING', CMD_OPTS['workers'], CMD_OPTS['host-limit'], httpPool, responseCache, CMD_OPTS['parse-workers'], 
+                                    CMD_OPTS['max-active'], CMD_OPTS['prefetch'], CMD_OPTS['stop-early'], streamPages = CMD_OPTS['stream-pages'], runMetrics = runMetrics, 
+                                    fixtureRecorder = fixtureRecorder, postingIndex = postingIndex)
+    recordSink = datasetWriterCreator(CMD_OPTS)
+    try:
+        scheduler.run(recordSink, True)
+    finally:
+        datasetWriterCloser(recordSink, CMD_OPTS)
+    print('|BATCH STATS| {}'.format(scheduler.stats), flush = True)
+    return {'batch': scheduler.stats}
+
+def singleQueryMain(JOB_POSITION, JOB_LOCATION, BATCH_SIZE, CMD_OPTS, httpPool, responseCache, runMetrics, fixtureRecorder, postingIndex):
+    """Runs the search given by the command-line arguments, returning the checkpoint statistics (if any) for the run report"""
+    # Setting the base page
+    try:
+        urlUtil = JobURLUtil(JOB_POSITION, JOB_LOCATION, 'SERVER_TIMING', CMD_OPTS['workers'], CMD_OPTS['host-limit'], httpPool, responseCache, CMD_OPTS['parse-workers'], 
+                             streamPages = CMD_OPTS['stream-pages'], runMetrics = runMetrics, fixtureRecorder = fixtureRecorder, postingIndex = postingIndex) # Creates the job scraper object
+    except (ValueError, KeyError, TypeError) as error: # malformed location response
+        print('<ERROR> Could not look up the given job location\n......> <Further Info> {}'.format(repr(error)))
+        exit(0)
+    checkpoint = ScrapeCheckpoint(CMD_OPTS['checkpoint']) if CMD_OPTS['checkpoint'] else None
+    resuming = checkpoint is not None and checkpoint.resumePoint(JOB_POSITION, JOB_LOCATION) is not None
+    resObj = urlUtil.jobListingPageBaseRequester() if not resuming else None # Sets the job-listing page base URL (restored from the checkpoint when resuming)
+    if not resObj and not resuming:
+        print('<ERROR> Could not retrieve the job-listing base page for the given job position and location')
+        exit(0)
+
+    # Displaying batches of 30 individual job-pages, streaming them into the dataset file (if given)
+    recordSink = datasetWriterCreator(CMD_OPTS, append = resuming)
+    try:
+        jobHeaders = urlUtil.batchExtract(resObj, BATCH_SIZE, True, CMD_OPTS['prefetch'], CMD_OPTS['stop-early'], recordSink, checkpoint) # With --adaptive, the fetch concurrency backs off on throttling and block pages instead of relying on a small batch size
+    finally:
+        datasetWriterCloser(recordSink, CMD_OPTS)
+    reportSections = {}
+    if checkpoint is not None:
+        reportSections['checkpoint'] = checkpoint.stats()
+        print('|CHECKPOINT STATS| {}'.format(reportSections['checkpoint']), flush = True)
+        checkpoint.close()
+    urlUtil.close()
+    return reportSections
+
+def profilersStopper(profiler, sampler, CMD_OPTS):
+    """Stops the profilers of the --profile and --sample-profile options (if any) and saves their results"""
+    if profiler is not None:
+        profiler.disable()
+        profiler.dump_stats(CMD_OPTS['profile'])
+        print('|PROFILE WRITTEN| {} (main thread only; view with: python -m pstats {})'.format(CMD_OPTS['profile'], CMD_OPTS['profile']), flush = True)
+        import pstats
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(15)
+    if sampler is not None:
+        with open(CMD_OPTS['sample-profile'], 'w', encoding = 'utf-8') as sampleFile: json.dump(sampler.stop(), sampleFile, indent = 2)
+        print('|SAMPLE PROFILE WRITTEN| {}'.format(CMD_OPTS['sample-profile']), flush = True)
 
 ### PROGRAM COMMENCEMENT 
 def main():
-    # Extracting and Validating command-line arguments, and then setting the base page
-    JOB_POSITION, JOB_LOCATION, BATCH_SIZE = cmdArgChecker(argv)
-    urlUtil = JobURLUtil(JOB_POSITION, JOB_LOCATION, 'SERVER_TIMING') # Creates the job scraper object
-    resObj = urlUtil.jobListingPageBaseRequester() # Sets the job-listing page base URL
+    # Extracting and Validating command-line arguments, and then setting up the shared HTTP resources
+    JOB_POSITION, JOB_LOCATION, BATCH_SIZE, CMD_OPTS = cmdArgChecker(argv) # runs before any network library is loaded
+    SkillMatcher.cachePath = CMD_OPTS['skill-cache']
+    if CMD_OPTS['offline'] and not CMD_OPTS['cache-dir']:
+        print('<ERROR> Option --offline requires --cache-dir')
+        exit(0)
+    concurrencyController = AdaptiveConcurrencyController(min(CMD_OPTS['workers'], CMD_OPTS['host-limit'])) if CMD_OPTS['adaptive'] else None
+    httpPool = HTTPSessionPool(max(CMD_OPTS['pool-size'], CMD_OPTS['workers']), CMD_OPTS['retries'], rateLimit = CMD_OPTS['rate'], burst = CMD_OPTS['burst'], 
+                               concurrencyController = concurrencyController)
+    responseCache = HTTPResponseCache(CMD_OPTS['cache-dir'], CMD_OPTS['cache-size'] * 1024 * 1024, offline = CMD_OPTS['offline']) if CMD_OPTS['cache-dir'] else None
+
+    # Instrumenting the run (and profiling it, if asked for)
+    runMetrics = RunMetrics()
+    fixtureRecorder = FixtureRecorder(CMD_OPTS['record-fixtures']) if CMD_OPTS['record-fixtures'] else None
+    postingIndex = PostingIndex(CMD_OPTS['incremental'], CMD_OPTS['recheck-rate']) if CMD_OPTS['incremental'] else None
+    if CMD_OPTS['profile']: import cProfile
+    profiler = cProfile.Profile() if CMD_OPTS['profile'] else None
+    sampler = SamplingProfiler() if CMD_OPTS['sample-profile'] else None
+    if profiler is not None: profiler.enable()
+    if sampler is not None: sampler.start()
+    try:
+        if CMD_OPTS['batch-file']: reportSections = multiQueryMain(CMD_OPTS, httpPool, responseCache, runMetrics, fixtureRecorder, postingIndex)
+        else: reportSections = singleQueryMain(JOB_POSITION, JOB_LOCATION, BATCH_SIZE, CMD_OPTS, httpPool, responseCache, runMetrics, fixtureRecorder, postingIndex)
+    finally:
+        profilersStopper(profiler, sampler, CMD_OPTS)
+        if fixtureRecorder is not None: 
+            fixtureRecorder.close()
+            print('|FIXTURES RECORDED| {} responses to {}'.format(fixtureRecorder.recordCount, CMD_OPTS['record-fixtures']), flush = True)
 
-    # Displaying batches of 30 individual job-pages
-    jobHeaders = urlUtil.batchExtract(resObj, BATCH_SIZE, True) # Recommended Max Batch Size for Testing <= 3 (to prevent likelihood of Glassdoor API blockage in response to DOS attacks)
+    if postingIndex is not None:
+        reportSections['changes'] = postingIndex.stats
+        print('|CHANGES SINCE LAST RUN| {}'.format(reportSections['changes']), flush = True)
+        postingIndex.close()
+    if concurrencyController is not None:
+        reportSections['concurrency'] = concurrencyController.stats()
+        print('|CONCURRENCY STATS| {}'.format({statName: statValue for statName, statValue in reportSections['concurrency'].items() if statName != 'history'}), flush = True)
+    reportSections['connections'] = httpPool.stats()
+    print('|CONNECTION STATS| {}'.format(reportSections['connections']), flush = True)
+    if responseCache is not None: 
+        reportSections['cache'] = responseCache.stats()
+        print('|CACHE STATS| {}'.format(reportSections['cache']), flush = True)
+    if CMD_OPTS['metrics']:
+        with open(CMD_OPTS['metrics'], 'w', encoding = 'utf-8') as metricsFile: json.dump(runMetrics.report(**reportSections), metricsFile, indent = 2)
+        print('|RUN METRICS WRITTEN| {}'.format(CMD_OPTS['metrics']), flush = True)
+    httpPool.close()
+    if responseCache is not None: responseCache.close()
 
 if __name__ == '__main__': main()
 
@@ -407,5 +2713,6 @@ Abbreviations :
 • Alt - Alternate
 • Cmd, CMD - Command / Commandline
 • Arg - Arguments
+• Opt, Opts - Option(s) / Optional Settings
 
 """
\ No newline at end of file